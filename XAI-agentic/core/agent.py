@@ -10,10 +10,19 @@ Version: 2.0
 
 import asyncio
 import json
+import logging
+import os
+import re
+import sys
+import time
 import numpy as np
+import torch
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from itertools import islice
 
 from core.config import Config
 from core.llm_client import GroqClient
@@ -22,8 +31,273 @@ from models.gnn_detector import GNNAnomalyDetector
 from models.zscore_detector import ZScoreAnomalyDetector
 from utils.graph_analyzer import GraphAnalyzer
 from utils.batch_processor import BatchProcessor
+from utils.json_encoder import NumpyEncoder
 from utils.logger import setup_logger
 
+# Optional: orjson encodes/decodes several times faster and handles numpy
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def _json_dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes (orjson when available)"""
+    if HAS_ORJSON:
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, indent=2 if indent else None, cls=NumpyEncoder).encode('utf-8')
+
+
+def _json_loads(data):
+    """Parse JSON str/bytes; orjson's errors subclass json.JSONDecodeError"""
+    return orjson.loads(data) if HAS_ORJSON else json.loads(data)
+
+# [whole second, its formatted local "YYYY-MM-DDTHH:MM:SS"], reused until
+# the second changes
+_ts_cache = [None, ""]
+
+def _iso_now() -> str:
+    """datetime.now().isoformat() with the strftime done at most once per second"""
+    now = time.time()
+    second = int(now)
+    if second != _ts_cache[0]:
+        _ts_cache[:] = [second, time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(second))]
+    return f"{_ts_cache[1]}.{int((now - second) * 1e6):06d}"
+
+def _write_file_atomic(path: str, data: bytes):
+    """
+    Replace path with data so readers see the old or the new file, never a
+    partial one: write a temp file, fsync it, then os.replace over path
+    """
+    tmp_path = f"{path}.tmp"
+    # Raw fd write: no buffered-file layer for a single large write
+    # (O_BINARY keeps Windows from translating newlines)
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+    fd = os.open(tmp_path, flags, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, path)
+
+@dataclass(slots=True)
+class MemoryEntry:
+    """One cycle in the agent's rolling memory (slots: no per-entry dict)"""
+    iteration: int
+    timestamp: str
+    anomalies: int
+    anomaly_rate: float
+    severity: str
+    confidence: float
+    actions: List[str]
+    cves_found: int
+    critical_cves: int
+    reasoning_summary: str
+    # History line for the LLM context and its token count, cached once
+    context_line: str = ""
+    context_tokens: int = 0
+
+
+# Short severity tags used in the LLM history context
+SEVERITY_TAGS = {
+    'CRITICAL': '[CRIT]',
+    'HIGH': '[HIGH]',
+    'MEDIUM': '[MED]',
+    'LOW': '[LOW]'
+}
+
+# Only these characters matter when matching braces, so the scan can jump
+# between them instead of visiting every character in Python
+_JSON_TOKEN_RE = re.compile(r'[{}"\\]')
+
+def _extract_json_object(text: str) -> Optional[str]:
+    """
+    Return the first balanced {...} block in text, or None
+
+    A single linear, string-aware pass: braces inside JSON strings are
+    ignored and any prose after the object (even with braces) is left out.
+    """
+    start = text.find('{')
+    if start == -1:
+        return None
+
+    depth = 0
+    in_string = False
+    escaped_pos = -1
+    for match in _JSON_TOKEN_RE.finditer(text, start):
+        pos = match.start()
+        if pos == escaped_pos:
+            continue
+        char = text[pos]
+        if char == '\\':
+            escaped_pos = pos + 1
+        elif char == '"':
+            in_string = not in_string
+        elif in_string:
+            continue
+        elif char == '{':
+            depth += 1
+        else:
+            depth -= 1
+            if depth == 0:
+                return text[start:pos + 1]
+    return None
+
+
+# Static parts of the LLM prompt around the per-cycle analysis JSON
+_PROMPT_ANALYSIS_HEADER = """
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+ CURRENT NETWORK ANALYSIS (GNN + Statistical Detection):
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+```json
+"""
+
+_PROMPT_INSTRUCTIONS = """
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+ YOUR MISSION: COMPREHENSIVE THREAT ANALYSIS & REMEDIATION PLANNING
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+As an expert security analyst, provide a PROFESSIONAL, ACTIONABLE security assessment:
+
+ ANALYSIS REQUIREMENTS:
+
+1. EXECUTIVE SUMMARY (2-3 sentences, plain English):
+   - What's happening right now?
+   - Why does it matter to the business?
+   - What's the immediate risk?
+
+2. CVE VULNERABILITY TRANSLATION (CRITICAL - Required for each CVE):
+   For EVERY vulnerability found, provide:
+   • plain_english_explanation: Explain like talking to a CEO (no jargon)
+   • real_world_impact: Concrete examples of what attackers can do
+   • business_consequences: Money, reputation, legal impact
+   • simple_fix_steps: Clear 1-2-3 instructions
+
+3. THREAT ASSESSMENT:
+   - Correlate GNN anomaly metrics (Z-score, degree, clustering) with CVE severity
+   - Explain HOW the network topology reveals attack patterns
+   - Identify if this is: reconnaissance, exploitation, lateral movement, or data exfiltration
+
+4. ROOT CAUSE ANALYSIS:
+   - What security gaps allowed this?
+   - Why are these systems vulnerable?
+   - Is this a systemic issue or isolated incident?
+
+5. ACTIONABLE REMEDIATION:
+   - Prioritized action plan (immediate, 24hrs, week, month)
+   - Specific technical steps AND business-friendly explanations
+   - Resource requirements and estimated time
+   - Risk of NOT acting
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+ REQUIRED RESPONSE FORMAT (JSON):
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+{
+  "severity": "CRITICAL|HIGH|MEDIUM|LOW",
+  "confidence": 0.0-1.0,
+  
+  "executive_summary": "2-3 sentence plain-English summary for C-suite executives",
+  
+  "cve_explanations": [
+    {
+      "cve_id": "CVE-XXXX-XXXXX",
+      "cvss_score": 9.8,
+      "technical_description": "Original CVE description",
+      "plain_english_explanation": "Imagine your house lock is broken... [use clear analogies]",
+      "real_world_impact": "Attackers can: [specific actions]",
+      "business_consequences": "This could lead to: [money/reputation/legal impacts]",
+      "affected_nodes": [1, 2, 3],
+      "exploitation_difficulty": "Trivial|Easy|Moderate|Hard",
+      "simple_fix_steps": [
+        "Step 1: [what to do]",
+        "Step 2: [what to do]",
+        "Step 3: [verification]"
+      ],
+      "estimated_fix_time": "30 minutes",
+      "fix_urgency": "Immediate|Today|This Week|This Month"
+    }
+  ],
+  
+  "threat_analysis": {
+    "attack_stage": "Reconnaissance|Initial Access|Lateral Movement|Data Exfiltration",
+    "topology_correlation": "How GNN metrics (degree, Z-score) reveal the attack pattern",
+    "severity_rationale": "Why this is CRITICAL/HIGH/MEDIUM/LOW - be specific",
+    "attack_vector_assessment": "How attackers are likely exploiting this",
+    "predicted_next_steps": "What attackers will likely do next"
+  },
+  
+  "root_cause": {
+    "primary_vulnerability": "Main security gap",
+    "contributing_factors": ["Factor 1", "Factor 2"],
+    "why_detected_now": "Explanation of detection timing",
+    "systemic_vs_isolated": "Is this widespread or localized?"
+  },
+  
+  "business_impact": {
+    "immediate_risks": ["Risk 1", "Risk 2"],
+    "potential_losses": "Financial/Reputational/Legal impact",
+    "compliance_implications": "Regulatory concerns (GDPR, HIPAA, etc.)",
+    "affected_operations": "Which business functions are at risk"
+  },
+  
+  "recommended_actions": [
+    {
+      "priority": 1,
+      "urgency": "IMMEDIATE|24hrs|Week|Month",
+      "action_name": "Patch Critical CVEs",
+      "technical_steps": ["Step 1", "Step 2", "Step 3"],
+      "business_friendly_explanation": "Simple explanation for non-technical staff",
+      "estimated_time": "2 hours",
+      "resources_needed": "What/who is needed",
+      "cve_related": ["CVE-XXXX-XXXXX"],
+      "risk_if_delayed": "What happens if we don't do this"
+    }
+  ],
+  
+  "immediate_mitigations": [
+    "Right now: Action 1 (takes 5 minutes)",
+    "Today: Action 2 (takes 1 hour)",
+    "This week: Action 3 (takes 1 day)"
+  ],
+  
+  "long_term_recommendations": [
+    "Implement automated patch management",
+    "Deploy network segmentation",
+    "Enhance monitoring capabilities"
+  ],
+  
+  "detailed_reasoning": "Multi-paragraph professional analysis connecting GNN anomalies, CVE risks, network topology, and business impact. Write as if for a security audit report.",
+  
+  "questions_for_team": [
+    "Question 1 about current security posture",
+    "Question 2 about incident response readiness"
+  ]
+}
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+  CRITICAL REQUIREMENTS:
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+✓ Write professionally - this report may go to executives and auditors
+✓ Provide SPECIFIC, ACTIONABLE recommendations (not vague advice)
+✓ Use clear language for CVE explanations (test: would your grandma understand?)
+✓ Connect technical findings to business impact
+✓ Prioritize by ACTUAL risk, not just CVSS scores
+✓ Include time estimates and resource requirements
+✓ Respond ONLY with valid JSON (no extra text)
+
+Your analysis will directly influence security decisions and resource allocation."""
+
 
 class GNNAgent:
     """
@@ -72,6 +346,18 @@ class GNNAgent:
         )
         self.graph_analyzer = GraphAnalyzer()
         self.batch_processor = BatchProcessor(config)
+        # Report files are written here so disk I/O never blocks the event
+        # loop; a single worker keeps report/index writes in order
+        self._io_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="report-io")
+
+        # Prompt scaffolding that never changes between cycles, built once
+        self._prompt_prefix = (
+            f"You are {config.AGENT_NAME}, an elite cybersecurity AI agent "
+            f"specialized in {config.AGENT_ROLE}.\n\n"
+        )
+        self._prompt_static_tokens = self.token_manager.count_tokens(
+            self._prompt_prefix + _PROMPT_ANALYSIS_HEADER + _PROMPT_INSTRUCTIONS
+        )
 
         # Agent state management
         self.memory = deque(maxlen=config.AGENT_MEMORY_SIZE)
@@ -88,14 +374,27 @@ class GNNAgent:
         
         Continuously monitors the network, detects anomalies,
         analyzes threats, and takes automated actions.
+
+        Monitoring cycles run as a pipeline of stages joined by bounded
+        queues, so the next snapshot and GNN inference proceed while the
+        previous cycle is still waiting on the LLM.
         """
         self.is_running = True
         self.logger.info(" Agent started autonomous monitoring")
 
+        depth = self.config.PIPELINE_DEPTH
+        snapshots = asyncio.Queue(maxsize=depth)
+        analyses = asyncio.Queue(maxsize=depth)
+        responses = asyncio.Queue(maxsize=depth)
+        stages = [
+            asyncio.create_task(self._snapshot_producer(snapshots)),
+            asyncio.create_task(self._inference_worker(snapshots, analyses)),
+            asyncio.create_task(self._reasoning_worker(analyses, responses)),
+            asyncio.create_task(self._report_worker(responses))
+        ]
+
         try:
-            while self.is_running:
-                await self._monitor_cycle()
-                await asyncio.sleep(self.config.UPDATE_INTERVAL)
+            await asyncio.gather(*stages)
                 
         except KeyboardInterrupt:
             self.logger.info("  Agent stopped by user")
@@ -106,71 +405,127 @@ class GNNAgent:
             raise
             
         finally:
+            for stage in stages:
+                stage.cancel()
+            await asyncio.gather(*stages, return_exceptions=True)
             await self._cleanup()
 
     async def _cleanup(self):
         """Safely cleanup resources and connections"""
         try:
-            if hasattr(self, 'llm_client'):
-                await self.llm_client.close()
+            await self.llm_client.close()
+            await self.cve_analyzer.close()
+            self._io_executor.shutdown(wait=True)
             self.logger.info(" Resources cleaned up successfully")
         except Exception as e:
             self.logger.error(f"  Cleanup error: {e}")
 
-    async def _monitor_cycle(self):
-        """
-        Execute a single monitoring cycle
-        
-        Process:
-        1. Collect graph data
-        2. Detect anomalies using GNN + Z-score
-        3. Correlate with CVE vulnerabilities
-        4. Generate AI-powered threat analysis
-        5. Execute automated responses
-        6. Generate comprehensive reports
-        """
-        self.iteration += 1
-        self.logger.debug(f"[DEBUG] Starting monitoring cycle {self.iteration}")
+    # Monitoring pipeline
+    # -------------------
+    # 1. Collect graph data                      (_snapshot_producer)
+    # 2. Detect anomalies using GNN + Z-score    (_inference_worker)
+    # 3. Correlate with CVE vulnerabilities      (_inference_worker)
+    # 4. Generate AI-powered threat analysis     (_reasoning_worker)
+    # 5. Execute automated responses             (_reasoning_worker)
+    # 6. Generate comprehensive reports          (_report_worker)
+    #
+    # Each stage hands its output to the next through a queue and ends by
+    # passing None downstream. A failed cycle is logged and dropped without
+    # stopping the pipeline.
+
+    async def _snapshot_producer(self, snapshots: asyncio.Queue):
+        """Step 1: Data Collection, every UPDATE_INTERVAL while running"""
+        # Resolve the loop's attribute chains once rather than every cycle
+        sleep = asyncio.sleep
+        interval = self.config.UPDATE_INTERVAL
+        get_snapshot = self._get_graph_snapshot
+        put = snapshots.put
+
+        while self.is_running:
+            try:
+                graph_data = await get_snapshot()
+            except Exception as e:
+                self.logger.error(f"[ERROR] Failed to collect graph snapshot: {e}", exc_info=True)
+            else:
+                await put(graph_data)
+            await sleep(interval)
+
+        await snapshots.put(None)
+
+    async def _inference_worker(self, snapshots: asyncio.Queue, analyses: asyncio.Queue):
+        """Steps 2-4: Anomaly Detection, Vulnerability Analysis, Graph Update"""
+        while True:
+            graph_data = await snapshots.get()
+            if graph_data is None:
+                break
+
+            self.iteration += 1
+            self.logger.debug(f"[DEBUG] Starting monitoring cycle {self.iteration}")
+
+            try:
+                batch_results = await self.batch_processor.process_graph(
+                    graph_data,
+                    self.gnn_detector,
+                    self.zscore_detector
+                )
 
-        try:
-            # Step 1: Data Collection
-            graph_data = await self._get_graph_snapshot()
-
-            # Step 2: Anomaly Detection
-            batch_results = await self.batch_processor.process_graph(
-                graph_data,
-                self.gnn_detector,
-                self.zscore_detector
-            )
+                analysis = await self._analyze_batch_results(batch_results, graph_data)
 
-            # Step 3: Vulnerability Analysis
-            analysis = await self._analyze_batch_results(batch_results, graph_data)
+                self.graph_analyzer.update_graph(
+                    graph_data['edge_index'],
+                    graph_data['num_nodes']
+                )
+            except Exception as e:
+                self.logger.error(f"[ERROR] Error in monitoring cycle {self.iteration}: {e}", exc_info=True)
+                continue
 
-            # Step 4: Update Graph Intelligence
-            self.graph_analyzer.update_graph(
-                graph_data['edge_index'],
-                graph_data['num_nodes']
-            )
+            await analyses.put(analysis)
+
+        await analyses.put(None)
+
+    async def _reasoning_worker(self, analyses: asyncio.Queue, responses: asyncio.Queue):
+        """Steps 5-7: AI-Powered Reasoning, Automated Actions, Memory Update"""
+        while True:
+            analysis = await analyses.get()
+            if analysis is None:
+                break
+
+            try:
+                agent_response = await self._agent_reasoning(analysis)
+                actions = await self._take_actions(agent_response, analysis)
+                # Memory is updated here, before the next cycle's reasoning
+                # reads it back as context
+                self._update_memory(analysis, agent_response, actions)
+            except Exception as e:
+                self.logger.error(
+                    f"[ERROR] Error in monitoring cycle {analysis['iteration']}: {e}", exc_info=True
+                )
+                continue
 
-            # Step 5: AI-Powered Reasoning
-            agent_response = await self._agent_reasoning(analysis)
+            await responses.put((analysis, agent_response, actions))
 
-            # Step 6: Automated Actions
-            actions = await self._take_actions(agent_response, analysis)
+        await responses.put(None)
 
-            # Step 7: Memory Update
-            self._update_memory(analysis, agent_response, actions)
+    async def _report_worker(self, responses: asyncio.Queue):
+        """Step 8: Report Generation"""
+        while True:
+            item = await responses.get()
+            if item is None:
+                break
 
-            # Step 8: Report Generation
-            await self._generate_report(analysis, agent_response, actions)
+            analysis, agent_response, actions = item
+            try:
+                await self._generate_report(analysis, agent_response, actions)
+            except Exception as e:
+                self.logger.error(
+                    f"[ERROR] Error in monitoring cycle {analysis['iteration']}: {e}", exc_info=True
+                )
+                continue
 
             self.logger.info(
-                f"[OK] Cycle {self.iteration} completed: "
+                f"[OK] Cycle {analysis['iteration']} completed: "
                 f"{analysis['anomalous_nodes']} anomalies detected"
             )
-            
-        except Exception as e:
-            self.logger.error(f"[ERROR] Error in monitoring cycle {self.iteration}: {e}", exc_info=True)
 
     async def _get_graph_snapshot(self) -> Dict[str, Any]:
         """
@@ -251,31 +606,52 @@ class GNNAgent:
             
             if cve_intelligence and cve_intelligence.get('total_cves_found', 0) > 0:
                 cve_report = self.cve_analyzer.generate_cve_report(cve_intelligence)
-                print(cve_report)
+                # A slow console must not stall the event loop; the single
+                # I/O worker also keeps this ordered with report writes
+                loop = asyncio.get_running_loop()
+                await loop.run_in_executor(self._io_executor, sys.stdout.write, cve_report + '\n')
             else:
                 self.logger.info("[INFO] No CVE vulnerabilities found for anomalous nodes")
 
         # Detailed Node Analysis
+        # Gather the top-20 scores in one bulk copy (a single device sync for
+        # GPU tensors) and their graph metrics in one batched call
+        top_ids = np.asarray(valid_anomalous_nodes[:20], dtype=np.int64)
+        if torch.is_tensor(scores):
+            top_scores = scores[torch.from_numpy(top_ids)].cpu().numpy()
+        else:
+            top_scores = np.asarray(scores)[top_ids]
+        if torch.is_tensor(z_scores):
+            top_z_scores = z_scores[torch.from_numpy(top_ids)].cpu().numpy()
+        else:
+            top_z_scores = np.asarray(z_scores)[top_ids]
+
+        metrics = self.graph_analyzer.analyze_nodes_importance(top_ids)
+        node_cve_mapping = cve_intelligence.get('node_cve_mapping', {}) if cve_intelligence else {}
+
         node_details = []
-        for node_id in valid_anomalous_nodes[:20]:
-            if node_id >= graph_data['num_nodes']:
-                continue
-                
-            metrics = self.graph_analyzer.analyze_node_importance(node_id)
-            node_cve_mapping = cve_intelligence.get('node_cve_mapping', {}) if cve_intelligence else {}
-            node_cves = node_cve_mapping.get(int(node_id), [])
+        for node_id, score, z_score, degree, betweenness, clustering, neighbors in zip(
+                top_ids.tolist(),
+                top_scores.tolist(),
+                top_z_scores.tolist(),
+                metrics['degree'].tolist(),
+                metrics['betweenness'].tolist(),
+                metrics['clustering'].tolist(),
+                metrics['num_neighbors'].tolist()
+        ):
+            node_cves = node_cve_mapping.get(node_id, [])
 
             node_details.append({
-                'node_id': int(node_id),
-                'anomaly_score': float(scores[node_id]),
-                'z_score': float(z_scores[node_id]),
-                'degree': int(metrics['degree']),
-                'betweenness': float(metrics['betweenness']),
-                'clustering': float(metrics['clustering']),
-                'neighbors': int(len(metrics['neighbors'])),
+                'node_id': node_id,
+                'anomaly_score': score,
+                'z_score': z_score,
+                'degree': degree,
+                'betweenness': betweenness,
+                'clustering': clustering,
+                'neighbors': neighbors,
                 'cves': node_cves,
-                'cve_count': int(len(node_cves)),
-                'cve_critical_count': int(len([c for c in node_cves if c['severity'] == 'CRITICAL']))
+                'cve_count': len(node_cves),
+                'cve_critical_count': sum(1 for c in node_cves if c['severity'] == 'CRITICAL')
             })
 
         # Identify Critical Attack Paths
@@ -286,7 +662,7 @@ class GNNAgent:
 
         # Compile Comprehensive Analysis
         analysis = {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': _iso_now(),
             'iteration': int(self.iteration),
             'total_nodes': int(graph_data['num_nodes']),
             'total_edges': int(graph_data['num_edges']),
@@ -302,7 +678,10 @@ class GNNAgent:
             'cve_intelligence': cve_intelligence
         }
 
+        # Snapshot the running total with this cycle; the pipelined inference
+        # worker may count the next cycle before this one is reported
         self.total_anomalies_detected += len(valid_anomalous_nodes)
+        analysis['total_anomalies_cumulative'] = int(self.total_anomalies_detected)
         return analysis
 
     async def _agent_reasoning(self, analysis: Dict[str, Any]) -> Dict[str, Any]:
@@ -318,8 +697,16 @@ class GNNAgent:
         Returns:
             Structured threat assessment with recommendations
         """
-        context = self._prepare_context(analysis)
-        token_count = self.token_manager.count_tokens(context)
+        # Fast path: a quiet cycle (anomaly rate well under the alert threshold
+        # and no CVE findings) gets the rule-based assessment without paying
+        # for an LLM round trip
+        cve_intel = analysis.get('cve_intelligence')
+        has_cves = bool(cve_intel) and cve_intel.get('total_cves_found', 0) > 0
+        if analysis['anomaly_rate'] < self.config.ALERT_THRESHOLD / 4 and not has_cves:
+            self.logger.debug("[LLM] Low anomaly rate, skipping LLM analysis")
+            return self._rule_based_reasoning(analysis)
+
+        context, token_count = self._prepare_context(analysis)
 
         if token_count > self.config.MAX_PROMPT_TOKENS:
             context = self.token_manager.truncate_context(
@@ -329,6 +716,10 @@ class GNNAgent:
             self.logger.warning(f"  Context truncated: {token_count} → {self.config.MAX_PROMPT_TOKENS} tokens")
 
         prompt = self._build_agent_prompt(analysis, context)
+        self.logger.debug(
+            f"[LLM] Prompt: {self._prompt_static_tokens} static tokens + "
+            f"{min(token_count, self.config.MAX_PROMPT_TOKENS)} context tokens + analysis data"
+        )
 
         try:
             self.logger.debug("[LLM] Querying LLM for threat analysis...")
@@ -341,7 +732,7 @@ class GNNAgent:
             self.logger.warning(f"[WARN] LLM analysis failed: {e}. Using rule-based fallback.")
             return self._rule_based_reasoning(analysis)
 
-    def _prepare_context(self, analysis: Dict[str, Any]) -> str:
+    def _prepare_context(self, analysis: Dict[str, Any]) -> Tuple[str, int]:
         """
         Prepare contextual information from agent memory
         
@@ -349,26 +740,20 @@ class GNNAgent:
             analysis: Current analysis data
             
         Returns:
-            Formatted context string for LLM
+            Formatted context string for LLM and its (estimated) token count
         """
-        context_parts = []
-
-        # Historical Context
+        # Historical Context: lines and their token counts are cached on each
+        # memory entry by _update_memory, so only new text is tokenized here
+        history_parts = []
+        history_tokens = 0
         if len(self.memory) > 0:
-            context_parts.append("[HISTORY] Recent Events:")
-            for mem in list(self.memory)[-5:]:
-                severity_tag = {
-                    'CRITICAL': '[CRIT]',
-                    'HIGH': '[HIGH]',
-                    'MEDIUM': '[MED]',
-                    'LOW': '[LOW]'
-                }.get(mem.get('severity', 'UNKNOWN'), '[UNK]')
-                
-                context_parts.append(
-                    f"  {severity_tag} Iteration {mem['iteration']}: "
-                    f"{mem['anomalies']} anomalies ({mem['severity']}), "
-                    f"Actions: {', '.join(mem['actions']) if mem['actions'] else 'None'}"
-                )
+            history_parts.append("[HISTORY] Recent Events:")
+            # Iterate the last 5 entries in place instead of copying the deque
+            for mem in islice(self.memory, max(0, len(self.memory) - 5), None):
+                history_parts.append(mem.context_line)
+                history_tokens += mem.context_tokens
+
+        context_parts = []
 
         # Current State
         context_parts.append(f"\n[STATUS] Current State:")
@@ -390,7 +775,24 @@ class GNNAgent:
                 context_parts.append(f"  * High: {len(cve_intel.get('high_cves', []))}")
                 context_parts.append(f"  * Known Exploited: {len(cve_intel.get('kev_listed', []))}")
 
-        return "\n".join(context_parts)
+        current = "\n".join(context_parts)
+        context = "\n".join(history_parts + [current])
+
+        # Cached history counts + the header and current-cycle lines; tokens
+        # can merge across line joins, so this is a close estimate
+        token_count = history_tokens + self.token_manager.count_tokens(
+            "\n".join(history_parts[:1] + [current])
+        )
+        return context, token_count
+
+    def _format_memory_line(self, mem: MemoryEntry) -> str:
+        """One history line of the LLM context for a memory entry"""
+        severity_tag = SEVERITY_TAGS.get(mem.severity, '[UNK]')
+        return (
+            f"  {severity_tag} Iteration {mem.iteration}: "
+            f"{mem.anomalies} anomalies ({mem.severity}), "
+            f"Actions: {', '.join(mem.actions) if mem.actions else 'None'}"
+        )
 
     def _build_agent_prompt(self, analysis: Dict[str, Any], context: str) -> str:
         """
@@ -447,156 +849,16 @@ CRITICAL VULNERABILITY DETAILS:
             }
         }
         
-        prompt = f"""You are {self.config.AGENT_NAME}, an elite cybersecurity AI agent specialized in {self.config.AGENT_ROLE}.
-
-{context}
-
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
- CURRENT NETWORK ANALYSIS (GNN + Statistical Detection):
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-```json
-{json.dumps(prompt_data, indent=2)}
-```
-
-{cve_section}
-
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
- YOUR MISSION: COMPREHENSIVE THREAT ANALYSIS & REMEDIATION PLANNING
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-As an expert security analyst, provide a PROFESSIONAL, ACTIONABLE security assessment:
-
- ANALYSIS REQUIREMENTS:
-
-1. EXECUTIVE SUMMARY (2-3 sentences, plain English):
-   - What's happening right now?
-   - Why does it matter to the business?
-   - What's the immediate risk?
-
-2. CVE VULNERABILITY TRANSLATION (CRITICAL - Required for each CVE):
-   For EVERY vulnerability found, provide:
-   • plain_english_explanation: Explain like talking to a CEO (no jargon)
-   • real_world_impact: Concrete examples of what attackers can do
-   • business_consequences: Money, reputation, legal impact
-   • simple_fix_steps: Clear 1-2-3 instructions
-
-3. THREAT ASSESSMENT:
-   - Correlate GNN anomaly metrics (Z-score, degree, clustering) with CVE severity
-   - Explain HOW the network topology reveals attack patterns
-   - Identify if this is: reconnaissance, exploitation, lateral movement, or data exfiltration
-
-4. ROOT CAUSE ANALYSIS:
-   - What security gaps allowed this?
-   - Why are these systems vulnerable?
-   - Is this a systemic issue or isolated incident?
-
-5. ACTIONABLE REMEDIATION:
-   - Prioritized action plan (immediate, 24hrs, week, month)
-   - Specific technical steps AND business-friendly explanations
-   - Resource requirements and estimated time
-   - Risk of NOT acting
-
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
- REQUIRED RESPONSE FORMAT (JSON):
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-{{
-  "severity": "CRITICAL|HIGH|MEDIUM|LOW",
-  "confidence": 0.0-1.0,
-  
-  "executive_summary": "2-3 sentence plain-English summary for C-suite executives",
-  
-  "cve_explanations": [
-    {{
-      "cve_id": "CVE-XXXX-XXXXX",
-      "cvss_score": 9.8,
-      "technical_description": "Original CVE description",
-      "plain_english_explanation": "Imagine your house lock is broken... [use clear analogies]",
-      "real_world_impact": "Attackers can: [specific actions]",
-      "business_consequences": "This could lead to: [money/reputation/legal impacts]",
-      "affected_nodes": [1, 2, 3],
-      "exploitation_difficulty": "Trivial|Easy|Moderate|Hard",
-      "simple_fix_steps": [
-        "Step 1: [what to do]",
-        "Step 2: [what to do]",
-        "Step 3: [verification]"
-      ],
-      "estimated_fix_time": "30 minutes",
-      "fix_urgency": "Immediate|Today|This Week|This Month"
-    }}
-  ],
-  
-  "threat_analysis": {{
-    "attack_stage": "Reconnaissance|Initial Access|Lateral Movement|Data Exfiltration",
-    "topology_correlation": "How GNN metrics (degree, Z-score) reveal the attack pattern",
-    "severity_rationale": "Why this is CRITICAL/HIGH/MEDIUM/LOW - be specific",
-    "attack_vector_assessment": "How attackers are likely exploiting this",
-    "predicted_next_steps": "What attackers will likely do next"
-  }},
-  
-  "root_cause": {{
-    "primary_vulnerability": "Main security gap",
-    "contributing_factors": ["Factor 1", "Factor 2"],
-    "why_detected_now": "Explanation of detection timing",
-    "systemic_vs_isolated": "Is this widespread or localized?"
-  }},
-  
-  "business_impact": {{
-    "immediate_risks": ["Risk 1", "Risk 2"],
-    "potential_losses": "Financial/Reputational/Legal impact",
-    "compliance_implications": "Regulatory concerns (GDPR, HIPAA, etc.)",
-    "affected_operations": "Which business functions are at risk"
-  }},
-  
-  "recommended_actions": [
-    {{
-      "priority": 1,
-      "urgency": "IMMEDIATE|24hrs|Week|Month",
-      "action_name": "Patch Critical CVEs",
-      "technical_steps": ["Step 1", "Step 2", "Step 3"],
-      "business_friendly_explanation": "Simple explanation for non-technical staff",
-      "estimated_time": "2 hours",
-      "resources_needed": "What/who is needed",
-      "cve_related": ["CVE-XXXX-XXXXX"],
-      "risk_if_delayed": "What happens if we don't do this"
-    }}
-  ],
-  
-  "immediate_mitigations": [
-    "Right now: Action 1 (takes 5 minutes)",
-    "Today: Action 2 (takes 1 hour)",
-    "This week: Action 3 (takes 1 day)"
-  ],
-  
-  "long_term_recommendations": [
-    "Implement automated patch management",
-    "Deploy network segmentation",
-    "Enhance monitoring capabilities"
-  ],
-  
-  "detailed_reasoning": "Multi-paragraph professional analysis connecting GNN anomalies, CVE risks, network topology, and business impact. Write as if for a security audit report.",
-  
-  "questions_for_team": [
-    "Question 1 about current security posture",
-    "Question 2 about incident response readiness"
-  ]
-}}
-
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-  CRITICAL REQUIREMENTS:
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-✓ Write professionally - this report may go to executives and auditors
-✓ Provide SPECIFIC, ACTIONABLE recommendations (not vague advice)
-✓ Use clear language for CVE explanations (test: would your grandma understand?)
-✓ Connect technical findings to business impact
-✓ Prioritize by ACTUAL risk, not just CVSS scores
-✓ Include time estimates and resource requirements
-✓ Respond ONLY with valid JSON (no extra text)
-
-Your analysis will directly influence security decisions and resource allocation."""
-
-        return prompt
+        # Only the context, analysis JSON and CVE section vary per call
+        return ''.join([
+            self._prompt_prefix,
+            context,
+            _PROMPT_ANALYSIS_HEADER,
+            _json_dumps(prompt_data, indent=True).decode('utf-8'),
+            "\n```\n\n",
+            cve_section,
+            _PROMPT_INSTRUCTIONS
+        ])
 
     def _rule_based_reasoning(self, analysis: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -613,7 +875,7 @@ Your analysis will directly influence security decisions and resource allocation
         """
         anomaly_rate = analysis['anomaly_rate']
         max_zscore = analysis['max_zscore']
-        cve_intel = analysis.get('cve_intelligence', {})
+        cve_intel = analysis.get('cve_intelligence') or {}
         
         critical_cves = cve_intel.get('critical_cves', [])
         high_cves = cve_intel.get('high_cves', [])
@@ -889,7 +1151,7 @@ Your analysis will directly influence security decisions and resource allocation
         return {
             "attack_stage": attack_stage,
             "topology_correlation": f"GNN detected {analysis['anomalous_nodes']} nodes with Z-scores above {analysis['threshold']}, indicating {max_zscore:.1f}x deviation from normal behavior. Network topology analysis reveals suspicious communication patterns consistent with {attack_stage.lower()}.",
-            "severity_rationale": f"{analysis['anomalies_nodes']} systems ({anomaly_rate:.1%}) exhibiting anomalous behavior, {critical_count} critical vulnerabilities present, maximum anomaly score {max_zscore:.2f} standard deviations above normal.",
+            "severity_rationale": f"{analysis['anomalous_nodes']} systems ({anomaly_rate:.1%}) exhibiting anomalous behavior, {critical_count} critical vulnerabilities present, maximum anomaly score {max_zscore:.2f} standard deviations above normal.",
             "attack_vector_assessment": stage_explanation,
             "predicted_next_steps": self._predict_attacker_next_steps(attack_stage, kev_count)
         }
@@ -1234,7 +1496,7 @@ THREAT INTELLIGENCE CONTEXT:
 RISK ASSESSMENT RATIONALE:
 The {severity} severity classification is based on multi-factor risk scoring:
 
-• Vulnerability Severity: {len(critical_cves)} CRITICAL + {len(analysis.get('cve_intelligence', {}).get('high_cves', []))} HIGH severity CVEs
+• Vulnerability Severity: {len(critical_cves)} CRITICAL + {len((analysis.get('cve_intelligence') or {}).get('high_cves', []))} HIGH severity CVEs
 • Anomaly Magnitude: {anomaly_rate:.2%} of infrastructure affected with max Z-score {max_zscore:.2f}
 • Exploit Availability: Public exploits available for identified vulnerabilities
 • Business Impact: Potential for data breach, service disruption, and compliance violations
@@ -1261,11 +1523,10 @@ The GNN-based detection has provided early warning - the window for effective de
     def _parse_agent_response(self, response: str) -> Dict[str, Any]:
         """Parse LLM JSON response with robust error handling"""
         try:
-            import re
             # Extract JSON from response
-            json_match = re.search(r'\{.*\}', response, re.DOTALL)
-            if json_match:
-                parsed = json.loads(json_match.group())
+            json_text = _extract_json_object(response)
+            if json_text:
+                parsed = _json_loads(json_text)
                 self.logger.debug("[OK] Successfully parsed LLM response")
                 return parsed
             else:
@@ -1372,7 +1633,7 @@ The GNN-based detection has provided early warning - the window for effective de
             'action': action_name,
             'action_type': action.get('action_name', 'unknown'),
             'status': 'executed',
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': _iso_now(),
             'priority': action.get('priority', 'MEDIUM'),
             'urgency': action.get('urgency', 'Unknown'),
             'details': action.get('business_friendly_explanation', ''),
@@ -1411,7 +1672,7 @@ The GNN-based detection has provided early warning - the window for effective de
         alert = {
             'action': 'send_security_alert',
             'status': 'sent',
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': _iso_now(),
             'severity': severity,
             'message': f"🚨 {severity} ALERT: Anomaly rate {analysis['anomaly_rate']:.2%} exceeds threshold",
             'executive_summary': exec_summary,
@@ -1435,18 +1696,24 @@ The GNN-based detection has provided early warning - the window for effective de
             actions: List[Dict[str, Any]]
     ):
         """Update agent's historical memory"""
-        memory_entry = {
-            'iteration': self.iteration,
-            'timestamp': analysis['timestamp'],
-            'anomalies': analysis['anomalous_nodes'],
-            'anomaly_rate': analysis['anomaly_rate'],
-            'severity': agent_response.get('severity', 'UNKNOWN'),
-            'confidence': agent_response.get('confidence', 0.0),
-            'actions': [a.get('action', a.get('action_type', 'unknown')) for a in actions],
-            'cves_found': analysis.get('cve_intelligence', {}).get('total_cves_found', 0),
-            'critical_cves': len(analysis.get('cve_intelligence', {}).get('critical_cves', [])),
-            'reasoning_summary': agent_response.get('executive_summary', '')[:200]
-        }
+        cve_intel = analysis.get('cve_intelligence') or {}
+        memory_entry = MemoryEntry(
+            iteration=analysis['iteration'],
+            timestamp=analysis['timestamp'],
+            anomalies=analysis['anomalous_nodes'],
+            anomaly_rate=analysis['anomaly_rate'],
+            severity=agent_response.get('severity', 'UNKNOWN'),
+            confidence=agent_response.get('confidence', 0.0),
+            actions=[a.get('action', a.get('action_type', 'unknown')) for a in actions],
+            cves_found=cve_intel.get('total_cves_found', 0),
+            critical_cves=len(cve_intel.get('critical_cves', [])),
+            reasoning_summary=agent_response.get('executive_summary', '')[:200]
+        )
+
+        # Format this entry's context line once and count its tokens so every
+        # later _prepare_context can reuse both
+        memory_entry.context_line = self._format_memory_line(memory_entry)
+        memory_entry.context_tokens = self.token_manager.count_tokens(memory_entry.context_line)
 
         self.memory.append(memory_entry)
         self.logger.debug(f"[MEMORY] Memory updated - {len(self.memory)} entries stored")
@@ -1500,7 +1767,7 @@ The GNN-based detection has provided early warning - the window for effective de
             **analysis,
             'agent_response': agent_response,
             'actions_taken': actions,
-            'total_anomalies_cumulative': self.total_anomalies_detected
+            'total_anomalies_cumulative': analysis['total_anomalies_cumulative']
         }
 
         # Print formatted console report
@@ -1513,29 +1780,37 @@ The GNN-based detection has provided early warning - the window for effective de
     async def _save_report(self, report: Dict[str, Any]):
         """Save report to individual JSON file per iteration"""
         try:
-            import os
-            
-            os.makedirs(self.config.REPORT_DIR, exist_ok=True)
-            
-            # Save individual report file for this iteration
-            report_file = f"{self.config.REPORT_DIR}/report_{self.iteration:06d}.json"
-            
-            # Convert to JSON-serializable format
-            report_serializable = self._convert_to_json_serializable(report)
-            
-            # Save individual report
-            with open(report_file, 'w') as f:
-                json.dump(report_serializable, f, indent=2)
+            report_file = f"{self.config.REPORT_DIR}/report_{report['iteration']:06d}.json"
+
+            # Serialize and write off the event loop
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(self._io_executor, self._write_report_sync, report_file, report)
             
             # Log without emoji (Windows safe)
             self.logger.info(f"[OK] Report saved to {report_file}")
             
-            # Also update consolidated index for easy access (optional)
-            self._update_report_index(report_serializable)
-            
         except Exception as e:
             self.logger.error(f"[ERROR] Failed to save report: {e}", exc_info=True)
 
+    def _write_report_sync(self, report_file: str, report: Dict[str, Any]):
+        """Write one report file and update the index (runs on the I/O executor)"""
+        os.makedirs(self.config.REPORT_DIR, exist_ok=True)
+
+        # Encode the report directly; both encoders handle numpy values, so
+        # the converted deep copy is only built when encoding fails (numpy
+        # dict keys)
+        try:
+            data = _json_dumps(report, indent=True)
+            report_serializable = report
+        except TypeError:
+            report_serializable = self._convert_to_json_serializable(report)
+            data = _json_dumps(report_serializable, indent=True)
+
+        _write_file_atomic(report_file, data)
+
+        # Also update consolidated index for easy access (optional)
+        self._update_report_index(report_serializable)
+
     def _update_report_index(self, report: Dict[str, Any]):
         """Update report index file with metadata"""
         try:
@@ -1546,8 +1821,8 @@ The GNN-based detection has provided early warning - the window for effective de
             index = []
             if os.path.exists(index_file):
                 try:
-                    with open(index_file, 'r') as f:
-                        index = json.load(f)
+                    with open(index_file, 'rb') as f:
+                        index = _json_loads(f.read())
                 except json.JSONDecodeError:
                     index = []
             
@@ -1558,27 +1833,36 @@ The GNN-based detection has provided early warning - the window for effective de
                 'anomalies': report['anomalous_nodes'],
                 'anomaly_rate': report['anomaly_rate'],
                 'severity': report.get('agent_response', {}).get('severity', 'UNKNOWN'),
-                'file': f"report_{self.iteration:06d}.json"
+                'file': f"report_{report['iteration']:06d}.json"
             })
             
-            # Save index
-            with open(index_file, 'w') as f:
-                json.dump(index, f, indent=2)
+            # Save index (atomically: a torn index would be reset to [] on the
+            # next load, losing every earlier entry)
+            _write_file_atomic(index_file, _json_dumps(index, indent=True))
                 
         except Exception as e:
             self.logger.warning(f"[WARN] Failed to update index: {e}")
 
     def _print_report(self, report: Dict[str, Any]):
         """Print beautifully formatted security report to console"""
+        # The console report is INFO-level output: skip building it entirely
+        # when the configured log level hides INFO
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+
         agent_resp = report['agent_response']
-        
-        print("\n" + "━" * 80)
-        print(f"{'  SECURITY ANALYSIS REPORT':^80}")
-        print("━" * 80)
-        print(f"Iteration: {report['iteration']}  |  Timestamp: {report['timestamp']}")
-        print(f"Network: {report['total_nodes']} nodes, {report['total_edges']} edges")
-        print(f"Anomalies: {report['anomalous_nodes']} ({report['anomaly_rate']:.2%})  |  Processing: {report['batch_processing_time']:.3f}s")
-        print("━" * 80)
+        # Collect every line and write the report in one call instead of
+        # taking the stdout lock once per out()
+        lines = []
+        out = lines.append
+        
+        out("\n" + "━" * 80)
+        out(f"{'  SECURITY ANALYSIS REPORT':^80}")
+        out("━" * 80)
+        out(f"Iteration: {report['iteration']}  |  Timestamp: {report['timestamp']}")
+        out(f"Network: {report['total_nodes']} nodes, {report['total_edges']} edges")
+        out(f"Anomalies: {report['anomalous_nodes']} ({report['anomaly_rate']:.2%})  |  Processing: {report['batch_processing_time']:.3f}s")
+        out("━" * 80)
 
         # Severity Indicator
         severity_emoji = {
@@ -1591,80 +1875,83 @@ The GNN-based detection has provided early warning - the window for effective de
         severity = agent_resp.get('severity', 'UNKNOWN')
         emoji = severity_emoji.get(severity, '')
         
-        print(f"\n{emoji} THREAT LEVEL: {severity}")
-        print(f"Confidence: {agent_resp.get('confidence', 0):.0%}")
-        print("─" * 80)
+        out(f"\n{emoji} THREAT LEVEL: {severity}")
+        out(f"Confidence: {agent_resp.get('confidence', 0):.0%}")
+        out("─" * 80)
 
         # Executive Summary
         if agent_resp.get('executive_summary'):
-            print(f"\n EXECUTIVE SUMMARY")
-            print("─" * 80)
-            print(self._wrap_text(agent_resp['executive_summary'], 80))
+            out(f"\n EXECUTIVE SUMMARY")
+            out("─" * 80)
+            out(self._wrap_text(agent_resp['executive_summary'], 80))
 
         # CVE Explanations (Plain English)
         if agent_resp.get('cve_explanations'):
-            print(f"\n VULNERABILITIES EXPLAINED (Plain English)")
-            print("─" * 80)
+            out(f"\n VULNERABILITIES EXPLAINED (Plain English)")
+            out("─" * 80)
             for i, cve_exp in enumerate(agent_resp['cve_explanations'][:3], 1):
-                print(f"\n{i}. {cve_exp['cve_id']} (Score: {cve_exp.get('cvss_score', 'N/A')}/10)")
-                print(f"    What it means: {cve_exp.get('plain_english_explanation', 'N/A')[:200]}...")
-                print(f"    What hackers can do: {cve_exp.get('real_world_impact', 'N/A')[:150]}...")
-                print(f"    How to fix: {cve_exp.get('estimated_fix_time', 'Unknown')} - {cve_exp.get('fix_urgency', 'Unknown')}")
+                out(f"\n{i}. {cve_exp['cve_id']} (Score: {cve_exp.get('cvss_score', 'N/A')}/10)")
+                out(f"    What it means: {cve_exp.get('plain_english_explanation', 'N/A')[:200]}...")
+                out(f"    What hackers can do: {cve_exp.get('real_world_impact', 'N/A')[:150]}...")
+                out(f"    How to fix: {cve_exp.get('estimated_fix_time', 'Unknown')} - {cve_exp.get('fix_urgency', 'Unknown')}")
 
         # Top Vulnerable Nodes
         if report['anomalous_nodes'] > 0:
-            print(f"\n TOP VULNERABLE NODES")
-            print("─" * 80)
+            out(f"\n TOP VULNERABLE NODES")
+            out("─" * 80)
             for node in report['node_details'][:5]:
                 cve_info = ""
                 if node.get('cve_count', 0) > 0:
                     critical = node.get('cve_critical_count', 0)
                     cve_info = f"  |  CVEs: {node['cve_count']} ({critical} CRITICAL)" if critical > 0 else f"  |  CVEs: {node['cve_count']}"
                 
-                print(f"Node {node['node_id']:4d}  |  Score: {node['anomaly_score']:.3f}  |  "
+                out(f"Node {node['node_id']:4d}  |  Score: {node['anomaly_score']:.3f}  |  "
                       f"Z: {node['z_score']:.2f}  |  Degree: {node['degree']:3d}{cve_info}")
 
         # Critical Paths
         if report['vulnerable_paths']:
-            print(f"\n  CRITICAL ATTACK PATHS")
-            print("─" * 80)
+            out(f"\n  CRITICAL ATTACK PATHS")
+            out("─" * 80)
             for i, path in enumerate(report['vulnerable_paths'][:3], 1):
-                print(f"{i}. Node {path['source']} → Node {path['target']} (distance: {path['length']} hops)")
+                out(f"{i}. Node {path['source']} → Node {path['target']} (distance: {path['length']} hops)")
 
         # Recommended Actions
         if agent_resp.get('recommended_actions'):
-            print(f"\n RECOMMENDED ACTIONS")
-            print("─" * 80)
+            out(f"\n RECOMMENDED ACTIONS")
+            out("─" * 80)
             for action in agent_resp['recommended_actions'][:5]:
                 urgency_emoji = {'IMMEDIATE': '', '24hrs': '', 'Week': '', 'Month': ''}.get(action.get('urgency', ''), '')
-                print(f"\n{urgency_emoji} Priority {action.get('priority', '?')}: {action.get('action_name', 'Unknown')}")
-                print(f"   Urgency: {action.get('urgency', 'Unknown')}  |  Time: {action.get('estimated_time', 'Unknown')}")
-                print(f"    {action.get('business_friendly_explanation', 'N/A')[:150]}...")
+                out(f"\n{urgency_emoji} Priority {action.get('priority', '?')}: {action.get('action_name', 'Unknown')}")
+                out(f"   Urgency: {action.get('urgency', 'Unknown')}  |  Time: {action.get('estimated_time', 'Unknown')}")
+                out(f"    {action.get('business_friendly_explanation', 'N/A')[:150]}...")
                 if action.get('risk_if_delayed'):
-                    print(f"     Risk if delayed: {action['risk_if_delayed'][:120]}...")
+                    out(f"     Risk if delayed: {action['risk_if_delayed'][:120]}...")
 
         # Immediate Mitigations
         if agent_resp.get('immediate_mitigations'):
-            print(f"\n IMMEDIATE ACTIONS")
-            print("─" * 80)
+            out(f"\n IMMEDIATE ACTIONS")
+            out("─" * 80)
             for mitigation in agent_resp['immediate_mitigations'][:5]:
-                print(f"  • {mitigation}")
+                out(f"  • {mitigation}")
 
         # Actions Executed
         if report['actions_taken']:
-            print(f"\n⚡ ACTIONS EXECUTED BY SYSTEM")
-            print("─" * 80)
+            out(f"\n⚡ ACTIONS EXECUTED BY SYSTEM")
+            out("─" * 80)
             for action in report['actions_taken']:
                 action_name = action.get('action', action.get('action_type', 'unknown'))
                 urgency = action.get('urgency', '')
                 urgency_tag = f" [{urgency}]" if urgency else ""
-                print(f"  ✓ {action_name}{urgency_tag} - {action['status']}")
+                out(f"  ✓ {action_name}{urgency_tag} - {action['status']}")
 
         # Footer
-        print("\n" + "━" * 80)
-        print(f"Report saved to: {self.config.REPORT_DIR}/report_{self.iteration:06d}.json")
-        print(f"Total anomalies detected (cumulative): {report['total_anomalies_cumulative']}")
-        print("━" * 80 + "\n")
+        out("\n" + "━" * 80)
+        out(f"Report saved to: {self.config.REPORT_DIR}/report_{report['iteration']:06d}.json")
+        out(f"Total anomalies detected (cumulative): {report['total_anomalies_cumulative']}")
+        out("━" * 80 + "\n")
+
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
 
     def _wrap_text(self, text: str, width: int) -> str:
         """Wrap text to specified width"""
@@ -1696,8 +1983,8 @@ The GNN-based detection has provided early warning - the window for effective de
             reports = []
             for report_file in report_files:
                 try:
-                    with open(report_file, 'r') as f:
-                        report = json.load(f)
+                    with open(report_file, 'rb') as f:
+                        report = _json_loads(f.read())
                         reports.append(report)
                 except Exception as e:
                     self.logger.warning(f"[WARN] Failed to load {report_file}: {e}")
@@ -1779,8 +2066,8 @@ The GNN-based detection has provided early warning - the window for effective de
         
         try:
             os.makedirs(self.config.REPORT_DIR, exist_ok=True)
-            with open(filename, 'w') as f:
-                json.dump(summary, f, indent=2)
+            with open(filename, 'wb') as f:
+                f.write(_json_dumps(summary, indent=True))
             self.logger.info(f" Summary exported to {filename}")
             return summary
         except Exception as e:
@@ -32,6 +32,8 @@ class Config:
     # ========================================
     NVD_API_KEY: Optional[str] = os.getenv("NVD_API_KEY", None)
     NVD_CACHE_TIMEOUT: int = 24  # hours
+    NVD_CACHE_DB: str = "data/nvd_cache.db"  # successful lookups survive restarts
+    NVD_CACHE_MAX_ENTRIES: int = 1024  # in-memory LRU cap
     NVD_ENABLED: bool = True
 
     # ========================================
@@ -61,6 +63,8 @@ class Config:
     HIDDEN_CHANNELS: int = 64
     NUM_LAYERS: int = 2
     LEARNING_RATE: float = 0.001
+    # Dynamic int8 quantization of the reconstruction layer (CPU inference only)
+    GNN_INT8_INFERENCE: bool = os.getenv("GNN_INT8_INFERENCE", "false").lower() == "true"
 
     # ========================================
     # CVE Analysis
@@ -73,6 +77,7 @@ class Config:
     # Monitoring
     # ========================================
     UPDATE_INTERVAL: float = float(os.getenv("UPDATE_INTERVAL", "2.0"))
+    PIPELINE_DEPTH: int = 2  # Cycles queued between monitoring stages
     SAVE_REPORTS: bool = True
     REPORT_DIR: str = "reports"
 
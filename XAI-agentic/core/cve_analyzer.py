@@ -1,12 +1,76 @@
-import nvdlib
+import aiohttp
 import asyncio
+import io
 import os
-from typing import List, Dict, Any, Optional
-from datetime import datetime, timedelta
-from collections import defaultdict
+import re
+import sqlite3
+import sys
+import threading
+import time
+from typing import List, Dict, Any, Optional, AsyncIterator
+from datetime import timedelta
+from collections import OrderedDict, defaultdict
 import logging
 import json
-import numpy as np
+
+# Optional: incremental JSON parsing keeps large NVD pages out of memory
+try:
+    import ijson
+    HAS_IJSON = True
+except ImportError:
+    HAS_IJSON = False
+
+# Optional: PEP 440 ordering for CPE version ranges (numeric fallback otherwise)
+try:
+    from packaging.version import Version, InvalidVersion
+    HAS_PACKAGING = True
+except ImportError:
+    HAS_PACKAGING = False
+
+# NVD CVE API 2.0 (queried directly; one keep-alive session for all lookups)
+NVD_API_URL = "https://services.nvd.nist.gov/rest/json/cves/2.0"
+# Rate-limit / overload responses NVD returns routinely; retried with backoff
+NVD_RETRY_STATUSES = (429, 503)
+NVD_MAX_ATTEMPTS = 4
+# Keyword searches pull one modest page (headroom for the version filter
+# without streaming megabytes), then keep the highest-scoring affected CVEs
+NVD_PAGE_SIZE = 100
+MAX_CVES_PER_SOFTWARE = 10
+
+# "/AV:N"-style metric pairs; the leading "CVSS:3.1" prefix has no slash
+_CVSS_RE = re.compile(r'/([^/:]+):([^/]*)')
+
+_VERSION_NUM_RE = re.compile(r'\d+')
+
+
+def _similar(a: str, b: str, max_distance: int = 2) -> bool:
+    """True if the Levenshtein distance between a and b is at most max_distance"""
+    if abs(len(a) - len(b)) > max_distance:
+        return False
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1,
+                               previous[j - 1] + (ca != cb)))
+        if min(current) > max_distance:
+            return False
+        previous = current
+    return previous[-1] <= max_distance
+
+
+def _version_cmp(a: str, b: str) -> int:
+    """Compare two version strings: -1, 0 or 1"""
+    if HAS_PACKAGING:
+        try:
+            va, vb = Version(a), Version(b)
+            return (va > vb) - (va < vb)
+        except InvalidVersion:
+            pass
+    # e.g. "7.4p1" -> (7, 4, 1)
+    ta = tuple(int(n) for n in _VERSION_NUM_RE.findall(a))
+    tb = tuple(int(n) for n in _VERSION_NUM_RE.findall(b))
+    return (ta > tb) - (ta < tb)
 
 
 class CVEAnalyzer:
@@ -20,17 +84,89 @@ class CVEAnalyzer:
         self.logger = logging.getLogger(__name__)
 
         # CVE cache to avoid repeated API calls
-        self.cve_cache = {}
-        self.cache_timeout = timedelta(hours=self.config.NVD_CACHE_TIMEOUT if hasattr(self.config, 'NVD_CACHE_TIMEOUT') else 24)
+        # LRU-ordered and size-capped: expired entries are otherwise only
+        # noticed on read, so a rotating inventory would grow it forever
+        self.cve_cache = OrderedDict()
+        self._cache_max_entries = getattr(self.config, 'NVD_CACHE_MAX_ENTRIES', 1024)
+        self.cache_timeout = timedelta(hours=getattr(self.config, 'NVD_CACHE_TIMEOUT', 24))
+        self._cache_ttl = self.cache_timeout.total_seconds()
+
+        # On-disk copy of successful lookups so restarts don't re-query NVD
+        self._cache_db_lock = threading.Lock()
+        self._cache_db = self._open_cache_db(getattr(self.config, 'NVD_CACHE_DB', None))
 
         # Track which nodes map to which software/services
         self.node_to_software = {}  # node_id -> {'name': 'Apache', 'version': '2.4.49'}
+        self._node_cache_keys = {}  # node_id -> normalized 'apache:2.4.49'
 
         # Known CVE mappings
         self.vulnerability_database = defaultdict(list)
 
+        # Bounds concurrent NVD lookups: unauthenticated clients get ~5
+        # requests per 30s, keyed clients ~50
+        api_key = getattr(self.config, 'NVD_API_KEY', None)
+        self._nvd_sem = asyncio.Semaphore(10 if api_key else 1)
+        # NVD asks for requests spaced 6s apart without a key (0.6s with one)
+        self._request_delay = 0.6 if api_key else 6
+        self._next_request_at = 0.0
+        self.session: Optional[aiohttp.ClientSession] = None
+
         self.logger.info("CVE Analyzer initialized")
 
+    def _open_cache_db(self, path: Optional[str]) -> Optional[sqlite3.Connection]:
+        """Open (or create) the persistent CVE cache; None disables it"""
+        if not path:
+            return None
+        try:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            # Writes happen on a worker thread (asyncio.to_thread)
+            conn = sqlite3.connect(path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cve_cache "
+                "(key TEXT PRIMARY KEY, ts REAL, json BLOB)"
+            )
+            conn.commit()
+            return conn
+        except sqlite3.Error as e:
+            self.logger.warning(f"Persistent CVE cache disabled ({path}): {e}")
+            return None
+
+    def _cache_db_get(self, cache_key: str) -> Optional[tuple]:
+        """Return (stored_at, cve_results) if the lookup is younger than the cache timeout"""
+        if self._cache_db is None:
+            return None
+        # Stale rows are filtered by SQLite rather than loaded and discarded
+        cutoff = time.time() - self._cache_ttl
+        try:
+            with self._cache_db_lock:
+                row = self._cache_db.execute(
+                    "SELECT ts, json FROM cve_cache WHERE key=? AND ts>?", (cache_key, cutoff)
+                ).fetchone()
+        except sqlite3.Error as e:
+            self.logger.warning(f"CVE cache read failed: {e}")
+            return None
+        if row is None:
+            return None
+        return row[0], json.loads(row[1])
+
+    def _cache_db_put(self, cache_key: str, cve_results: List[Dict[str, Any]]):
+        """Store a successful lookup (blocking; run via asyncio.to_thread)"""
+        if self._cache_db is None:
+            return
+        try:
+            with self._cache_db_lock:
+                self._cache_db.execute(
+                    "INSERT OR REPLACE INTO cve_cache (key, ts, json) VALUES (?, ?, ?)",
+                    (cache_key, time.time(),
+                     json.dumps(cve_results, separators=(',', ':')).encode('utf-8'))
+                )
+                self._cache_db.commit()
+        except sqlite3.Error as e:
+            self.logger.warning(f"CVE cache write failed: {e}")
+
     def register_node_software(self, node_id: int, software_info: Dict[str, str]):
         """
         Register what software/service a node is running
@@ -39,6 +175,7 @@ class CVEAnalyzer:
         # 🔧 FIX: Ensure node_id is native Python int
         node_id_int = int(node_id)
         self.node_to_software[node_id_int] = software_info
+        self._node_cache_keys[node_id_int] = self._software_key(software_info)
         self.logger.debug(f"Registered node {node_id_int}: {software_info}")
 
     async def analyze_anomalous_nodes(
@@ -61,78 +198,196 @@ class CVEAnalyzer:
             'recommended_actions': []
         }
 
+        # 🔧 FIX: Convert numpy int64 to native Python int
+        # Unregistered nodes drop out on a single .get(); anomaly order is kept
+        node_software = []
+        for node_id in map(int, anomalous_nodes[:20]):  # Limit to avoid rate limiting
+            software_info = self.node_to_software.get(node_id)
+            if software_info is not None:
+                node_software.append((node_id, software_info, self._node_cache_keys[node_id]))
+
+        # Search each distinct software once, all lookups in flight together
+        # (bounded by the NVD semaphore) instead of one round trip at a time
+        searches = {}
+        for _, software_info, cache_key in node_software:
+            searches.setdefault(cache_key, software_info)
+        results = await asyncio.gather(
+            *(self._bounded_search(software_info, cache_key)
+              for cache_key, software_info in searches.items()),
+            return_exceptions=True
+        )
+        cves_by_software = dict(zip(searches, results))
+
+        # Severity buckets and flag lists, looked up once rather than per CVE
+        severity_buckets = {
+            'CRITICAL': cve_intelligence['critical_cves'],
+            'HIGH': cve_intelligence['high_cves']
+        }
+        exploit_available = cve_intelligence['exploit_available']
+        kev_listed = cve_intelligence['kev_listed']
+
         # Process each anomalous node
-        for node_id in anomalous_nodes[:20]:  # Limit to avoid rate limiting
-            # 🔧 FIX: Convert numpy int64 to native Python int
-            node_id_int = int(node_id)
-            
-            if node_id_int in self.node_to_software:
-                software_info = self.node_to_software[node_id_int]
-
-                # Search for CVEs
-                cves = await self._search_cves_for_software(software_info)
-
-                if cves:
-                    # 🔧 FIX: Use native Python int as key, not numpy int64
-                    cve_intelligence['node_cve_mapping'][node_id_int] = cves
-                    cve_intelligence['total_cves_found'] += len(cves)
-
-                    # Categorize by severity
-                    for cve_data in cves:
-                        if cve_data['severity'] == 'CRITICAL':
-                            cve_intelligence['critical_cves'].append(cve_data)
-                        elif cve_data['severity'] == 'HIGH':
-                            cve_intelligence['high_cves'].append(cve_data)
-
-                        # Check for exploits
-                        if cve_data.get('exploit_available'):
-                            cve_intelligence['exploit_available'].append(cve_data)
-
-                        # Check KEV catalog
-                        if cve_data.get('kev_listed'):
-                            cve_intelligence['kev_listed'].append(cve_data)
+        for node_id_int, software_info, cache_key in node_software:
+            cves = cves_by_software[cache_key]
+            if isinstance(cves, BaseException):
+                self.logger.error(f"CVE search failed for {software_info}: {cves}")
+                continue
+
+            if cves:
+                # 🔧 FIX: Use native Python int as key, not numpy int64
+                cve_intelligence['node_cve_mapping'][node_id_int] = cves
+                cve_intelligence['total_cves_found'] += len(cves)
+
+                # Categorize by severity
+                for cve_data in cves:
+                    bucket = severity_buckets.get(cve_data['severity'])
+                    if bucket is not None:
+                        bucket.append(cve_data)
+
+                    # Check for exploits
+                    if cve_data.get('exploit_available'):
+                        exploit_available.append(cve_data)
+
+                    # Check KEV catalog
+                    if cve_data.get('kev_listed'):
+                        kev_listed.append(cve_data)
 
         # Generate recommendations
         cve_intelligence['recommended_actions'] = self._generate_cve_actions(
             cve_intelligence
         )
 
-        # 🔧 FIX: Ensure all data is JSON serializable before returning
-        cve_intelligence = self._ensure_json_serializable(cve_intelligence)
-
         return cve_intelligence
 
-    def _ensure_json_serializable(self, cve_intelligence: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        Ensure all data in CVE intelligence is JSON serializable
-        Converts numpy types to native Python types
-        """
-        # Convert node_cve_mapping keys from int64 to int
-        if 'node_cve_mapping' in cve_intelligence:
-            cve_intelligence['node_cve_mapping'] = {
-                int(k): v for k, v in cve_intelligence['node_cve_mapping'].items()
-            }
-        
-        # Ensure all numeric values are native Python types
-        for key in ['total_cves_found']:
-            if key in cve_intelligence and isinstance(cve_intelligence[key], np.integer):
-                cve_intelligence[key] = int(cve_intelligence[key])
-        
-        return cve_intelligence
+    @staticmethod
+    def _software_key(software_info: Dict[str, str]) -> str:
+        """Cache key for a software/version pair (case/whitespace-insensitive)"""
+        name = software_info['name'].strip().lower()
+        version = str(software_info.get('version', 'any')).strip().lower()
+        return f"{name}:{version}"
+
+    async def _bounded_search(
+            self,
+            software_info: Dict[str, str],
+            cache_key: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """_search_cves_for_software under the NVD concurrency limit"""
+        async with self._nvd_sem:
+            return await self._search_cves_for_software(software_info, cache_key)
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get or create aiohttp session"""
+        if self.session is None or self.session.closed:
+            api_key = getattr(self.config, 'NVD_API_KEY', None)
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit_per_host=19),
+                headers={"apiKey": api_key} if api_key else {},
+                # Per-phase limits: a slow but steady response isn't cut off
+                timeout=aiohttp.ClientTimeout(total=None, sock_connect=10, sock_read=30)
+            )
+        return self.session
+
+    async def _pace(self):
+        """Reserve the next request slot so concurrent callers stay spaced out"""
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        start = max(now, self._next_request_at)
+        self._next_request_at = start + self._request_delay
+        if start > now:
+            await asyncio.sleep(start - now)
+
+    def _retry_delay(self, response: aiohttp.ClientResponse, attempt: int) -> float:
+        """Seconds to back off: Retry-After when given, else exponential"""
+        retry_after = response.headers.get('Retry-After')
+        if retry_after:
+            try:
+                return float(retry_after)
+            except ValueError:
+                pass  # HTTP-date form; fall through to exponential backoff
+        return self._request_delay * 2 ** attempt
+
+    async def _iter_nvd(self, params: Dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
+        """GET the NVD CVE API and yield the raw 'cve' objects as they are parsed"""
+        session = await self._get_session()
+        for attempt in range(NVD_MAX_ATTEMPTS):
+            await self._pace()
+            async with session.get(NVD_API_URL, params=params) as response:
+                if response.status in NVD_RETRY_STATUSES and attempt < NVD_MAX_ATTEMPTS - 1:
+                    delay = self._retry_delay(response, attempt)
+                    # Push back every pending caller, not just this one
+                    loop = asyncio.get_running_loop()
+                    self._next_request_at = max(self._next_request_at, loop.time() + delay)
+                    self.logger.warning(
+                        f"NVD returned {response.status}, retrying in {delay:.1f}s "
+                        f"(attempt {attempt + 1}/{NVD_MAX_ATTEMPTS})"
+                    )
+                    continue
+                response.raise_for_status()
+                if HAS_IJSON:
+                    # use_float keeps scores JSON-serializable (not Decimal)
+                    async for cve in ijson.items(response.content, 'vulnerabilities.item.cve',
+                                                 use_float=True):
+                        yield cve
+                else:
+                    data = await response.json()
+                    for item in data.get('vulnerabilities', []):
+                        yield item['cve']
+            return
+
+    async def _query_nvd(self, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """GET the NVD CVE API and return the raw 'cve' objects"""
+        return [cve async for cve in self._iter_nvd(params)]
+
+    async def close(self):
+        """Close the aiohttp session and the persistent cache"""
+        if self.session and not self.session.closed:
+            await self.session.close()
+            self.session = None
+        if self._cache_db is not None:
+            with self._cache_db_lock:
+                self._cache_db.close()
+            self._cache_db = None
+
+    def _cache_put(
+            self,
+            cache_key: str,
+            cve_results: List[Dict[str, Any]],
+            timestamp: Optional[float] = None
+    ):
+        """Insert into the in-memory cache, evicting the least recently used entry"""
+        self.cve_cache[cache_key] = {
+            'timestamp': timestamp or time.time(),
+            'data': cve_results
+        }
+        self.cve_cache.move_to_end(cache_key)
+        if len(self.cve_cache) > self._cache_max_entries:
+            self.cve_cache.popitem(last=False)
 
     async def _search_cves_for_software(
             self,
-            software_info: Dict[str, str]
+            software_info: Dict[str, str],
+            cache_key: Optional[str] = None
     ) -> List[Dict[str, Any]]:
         """Search NVD for CVEs related to specific software"""
 
-        cache_key = f"{software_info['name']}:{software_info.get('version', 'any')}"
+        # Registered nodes pass the key computed at registration time
+        cache_key = cache_key or self._software_key(software_info)
 
         # Check cache
-        if cache_key in self.cve_cache:
-            cached = self.cve_cache[cache_key]
-            if datetime.now() - cached['timestamp'] < self.cache_timeout:
+        cached = self.cve_cache.get(cache_key)
+        if cached is not None:
+            # Plain epoch seconds: no datetime objects built per lookup
+            if time.time() - cached['timestamp'] < self._cache_ttl:
+                self.cve_cache.move_to_end(cache_key)
                 return cached['data']
+            del self.cve_cache[cache_key]
+
+        stored = self._cache_db_get(cache_key)
+        if stored is not None:
+            # Keep the original lookup time so the TTL isn't extended on reload
+            stored_at, cve_results = stored
+            self._cache_put(cache_key, cve_results, stored_at)
+            return cve_results
 
         cve_results = []
 
@@ -140,38 +395,28 @@ class CVEAnalyzer:
             # Search by keyword
             keyword = software_info['name']
 
-            # Rate limiting logic
-            api_key = self.config.NVD_API_KEY if hasattr(self.config, 'NVD_API_KEY') else None
-            delay = 0.6 if api_key else 6
-
-            # Run in executor to avoid blocking
-            loop = asyncio.get_event_loop()
-            search_results = await loop.run_in_executor(
-                None,
-                lambda: nvdlib.searchCVE(
-                    keywordSearch=keyword,
-                    key=api_key,
-                    delay=delay,
-                    limit=10  # Limit results per software
-                )
-            )
+            search_results = self._iter_nvd({
+                "keywordSearch": keyword,
+                "resultsPerPage": NVD_PAGE_SIZE
+            })
 
-            # Process results
-            for cve in search_results:
-                cve_data = self._extract_cve_info(cve)
+            # Process results as they stream in; unaffected CVEs are dropped
+            # before extraction so only the survivors are kept
+            async for cve in search_results:
+                # Filter by version if specified
+                if 'version' in software_info and not self._version_affected(
+                        cve, software_info['version'], software_info['name']):
+                    continue
+                cve_results.append(self._extract_cve_info(cve))
 
-                # Filter by version if specified (simplified check)
-                if 'version' in software_info:
-                    if self._version_affected(cve, software_info['version']):
-                        cve_results.append(cve_data)
-                else:
-                    cve_results.append(cve_data)
+            # Limit results per software
+            cve_results.sort(key=lambda c: c['score'], reverse=True)
+            del cve_results[MAX_CVES_PER_SOFTWARE:]
 
             # Cache results
-            self.cve_cache[cache_key] = {
-                'timestamp': datetime.now(),
-                'data': cve_results
-            }
+            self._cache_put(cache_key, cve_results)
+            # Only successful lookups are persisted; failures retry next run
+            await asyncio.to_thread(self._cache_db_put, cache_key, cve_results)
 
             self.logger.info(
                 f"Found {len(cve_results)} CVEs for {software_info['name']}"
@@ -182,189 +427,254 @@ class CVEAnalyzer:
 
         return cve_results
 
-    def _extract_cve_info(self, cve) -> Dict[str, Any]:
-        """Extract relevant information from CVE object with proper type conversion"""
+    def _extract_cve_info(self, cve: Dict[str, Any]) -> Dict[str, Any]:
+        """Extract relevant information from an NVD 2.0 'cve' object with proper type conversion"""
+
+        # The NVD 2.0 schema is fixed, so fields are read straight off their
+        # dict paths; JSON already gives str/bool, only scores need float()
 
-        # Get CVSS score and severity
+        # Get CVSS score and severity: v3.1 if available, fallback to v2
         severity = 'UNKNOWN'
         score = 0.0
         vector = ''
-
-        # Use v3.1 if available, fallback to v2
-        if hasattr(cve, 'v31severity') and cve.v31severity:
-            severity = str(cve.v31severity)
-            score = float(cve.v31score) if hasattr(cve, 'v31score') else 0.0
-            vector = str(cve.v31vector) if hasattr(cve, 'v31vector') else ''
-        elif hasattr(cve, 'v2severity') and cve.v2severity:
-            severity = str(cve.v2severity)
-            score = float(cve.v2score) if hasattr(cve, 'v2score') else 0.0
+        cvss_metrics = cve.get('metrics')
+        if cvss_metrics:
+            v31 = cvss_metrics.get('cvssMetricV31')
+            v2 = cvss_metrics.get('cvssMetricV2')
+            if v31 and 'baseSeverity' in v31[0]['cvssData']:
+                cvss = v31[0]['cvssData']
+                severity = sys.intern(cvss['baseSeverity'])
+                score = float(cvss.get('baseScore', 0.0))
+                vector = cvss.get('vectorString', '')
+            elif v2 and 'baseSeverity' in v2[0]:
+                severity = sys.intern(v2[0]['baseSeverity'])
+                score = float(v2[0].get('cvssData', {}).get('baseScore', 0.0))
 
         # Get description
-        description = ''
-        if hasattr(cve, 'descriptions') and cve.descriptions:
-            description = str(cve.descriptions[0].value)
+        descriptions = cve.get('descriptions')
+        description = descriptions[0]['value'] if descriptions else ''
 
         # Check KEV catalog (simplified)
-        kev_listed = bool(hasattr(cve, 'exploitAdd') and cve.exploitAdd)
+        kev_listed = 'cisaExploitAdd' in cve
 
         # Extract attack complexity and other metrics
         metrics = self._parse_cvss_vector(vector)
 
-        # Get published and modified dates
-        published = None
-        if hasattr(cve, 'published'):
-            published = str(cve.published) if cve.published else None
-        
-        last_modified = None
-        if hasattr(cve, 'lastModified'):
-            last_modified = str(cve.lastModified) if cve.lastModified else None
-
-        # Get references (URLs)
-        references = []
-        if hasattr(cve, 'references') and cve.references:
-            references = [str(ref.url) for ref in cve.references]
-
         # Get CWE
         cwe = None
-        if hasattr(cve, 'cwe') and cve.cwe and len(cve.cwe) > 0:
-            cwe = str(cve.cwe[0].value) if hasattr(cve.cwe[0], 'value') else None
+        weaknesses = cve.get('weaknesses')
+        if weaknesses and weaknesses[0].get('description'):
+            cwe = weaknesses[0]['description'][0]['value']
 
         return {
-            'cve_id': str(cve.id),
+            'cve_id': cve['id'],
             'severity': severity,
-            'score': float(score),
+            'score': score,
             'vector': vector,
             'description': description,
-            'published': published,
-            'lastModified': last_modified,
-            'kev_listed': bool(kev_listed),
-            'exploit_available': bool(kev_listed),  # If in KEV, exploit exists
-            'attack_vector': str(metrics.get('AV', 'UNKNOWN')),
-            'attack_complexity': str(metrics.get('AC', 'UNKNOWN')),
-            'privileges_required': str(metrics.get('PR', 'UNKNOWN')),
-            'user_interaction': str(metrics.get('UI', 'UNKNOWN')),
-            'references': references,
+            'published': cve.get('published') or None,
+            'lastModified': cve.get('lastModified') or None,
+            'kev_listed': kev_listed,
+            'exploit_available': kev_listed,  # If in KEV, exploit exists
+            'attack_vector': metrics.get('AV', 'UNKNOWN'),
+            'attack_complexity': metrics.get('AC', 'UNKNOWN'),
+            'privileges_required': metrics.get('PR', 'UNKNOWN'),
+            'user_interaction': metrics.get('UI', 'UNKNOWN'),
+            'references': [ref['url'] for ref in cve.get('references', ())],
             'cwe': cwe
         }
 
     def _parse_cvss_vector(self, vector: str) -> Dict[str, str]:
         """Parse CVSS vector string into components"""
-        metrics = {}
-        if vector:
-            parts = vector.split('/')
-            for part in parts[1:]:  # Skip CVSS:3.1
-                if ':' in part:
-                    key, value = part.split(':')
-                    metrics[key] = value
-        return metrics
-
-    def _version_affected(self, cve, version: str) -> bool:
-        """Check if specific version is affected (simplified)"""
-        if not hasattr(cve, 'cpe'):
+        return dict(_CVSS_RE.findall(vector)) if vector else {}
+
+    @staticmethod
+    def _cpe_matches(cve: Dict[str, Any]) -> List[tuple]:
+        """
+        Vulnerable CPE matches of an NVD 'cve' object as
+        (vendor, product, version, start_incl, start_excl, end_incl, end_excl),
+        parsed once and kept on the object
+        """
+        matches = cve.get('_cpe_matches')
+        if matches is None:
+            matches = []
+            for configuration in cve.get('configurations') or []:
+                for node in configuration.get('nodes') or []:
+                    for match in node.get('cpeMatch') or []:
+                        if not match.get('vulnerable'):
+                            continue
+                        # cpe:2.3:part:vendor:product:version:...
+                        parts = match.get('criteria', '').split(':')
+                        if len(parts) < 6:
+                            continue
+                        matches.append((
+                            parts[3].lower(), parts[4].lower(), parts[5],
+                            match.get('versionStartIncluding'),
+                            match.get('versionStartExcluding'),
+                            match.get('versionEndIncluding'),
+                            match.get('versionEndExcluding')
+                        ))
+            cve['_cpe_matches'] = matches
+        return matches
+
+    def _version_affected(self, cve: Dict[str, Any], version: str, name: Optional[str] = None) -> bool:
+        """
+        Check if a specific version is affected using the CVE's CPE configurations
+
+        Matches the software name against CPE vendor/product (allowing small
+        spelling differences), then checks the version against the exact CPE
+        version or its start/end range. CVEs without CPE data are assumed to
+        apply; CVEs whose CPEs name only other products (e.g. a plugin for
+        this software) are not.
+        """
+        matches = self._cpe_matches(cve)
+        if not matches:
             return True  # Assume affected if no CPE data
-        return True  # Simplified check
+
+        wanted = name.strip().lower().replace(' ', '_') if name else None
+        for vendor, product, cpe_version, start_incl, start_excl, end_incl, end_excl in matches:
+            if wanted is not None and not (
+                    _similar(wanted, product)
+                    or _similar(wanted, f"{vendor}_{product}")
+                    or wanted == vendor):
+                continue
+
+            if start_incl or start_excl or end_incl or end_excl:
+                if start_incl and _version_cmp(version, start_incl) < 0:
+                    continue
+                if start_excl and _version_cmp(version, start_excl) <= 0:
+                    continue
+                if end_incl and _version_cmp(version, end_incl) > 0:
+                    continue
+                if end_excl and _version_cmp(version, end_excl) >= 0:
+                    continue
+                return True
+
+            # '*' (any) and '-' (not applicable) don't pin a version
+            if cpe_version in ('*', '-') or _version_cmp(version, cpe_version) == 0:
+                return True
+
+        return False
 
     def _generate_cve_actions(self, cve_intelligence: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Generate recommended actions based on CVE findings"""
 
         actions = []
+        critical = cve_intelligence['critical_cves']
+        kev_listed = cve_intelligence['kev_listed']
+        exploitable = cve_intelligence['exploit_available']
+        high = cve_intelligence['high_cves']
 
         # Critical CVEs - immediate action
-        if cve_intelligence['critical_cves']:
+        if critical:
             actions.append({
                 'priority': 'CRITICAL',
                 'action': 'patch_critical_vulnerabilities',
-                'reason': f"{len(cve_intelligence['critical_cves'])} critical CVEs found",
-                'cves': [cve['cve_id'] for cve in cve_intelligence['critical_cves'][:5]],
+                'reason': f"{len(critical)} critical CVEs found",
+                'cves': [cve['cve_id'] for cve in critical[:5]],
                 'timeline': 'Immediate - within 24 hours'
             })
 
         # KEV-listed CVEs - high priority
-        if cve_intelligence['kev_listed']:
+        if kev_listed:
             actions.append({
                 'priority': 'HIGH',
                 'action': 'address_known_exploited_vulnerabilities',
-                'reason': f"{len(cve_intelligence['kev_listed'])} CVEs in CISA KEV catalog",
-                'cves': [cve['cve_id'] for cve in cve_intelligence['kev_listed'][:5]],
+                'reason': f"{len(kev_listed)} CVEs in CISA KEV catalog",
+                'cves': [cve['cve_id'] for cve in kev_listed[:5]],
                 'timeline': 'High priority - within 72 hours'
             })
 
         # Exploits available - high priority
-        if cve_intelligence['exploit_available']:
+        if exploitable:
             actions.append({
                 'priority': 'HIGH',
                 'action': 'mitigate_exploitable_vulnerabilities',
                 'reason': 'Public exploits available',
-                'cves': [cve['cve_id'] for cve in cve_intelligence['exploit_available'][:5]],
+                'cves': [cve['cve_id'] for cve in exploitable[:5]],
                 'timeline': 'Within 1 week'
             })
 
         # High severity CVEs - medium priority
-        if cve_intelligence['high_cves']:
+        if high:
             actions.append({
                 'priority': 'MEDIUM',
                 'action': 'schedule_high_severity_patches',
-                'reason': f"{len(cve_intelligence['high_cves'])} high severity CVEs",
-                'cves': [cve['cve_id'] for cve in cve_intelligence['high_cves'][:5]],
+                'reason': f"{len(high)} high severity CVEs",
+                'cves': [cve['cve_id'] for cve in high[:5]],
                 'timeline': 'Within 30 days'
             })
 
         return actions
 
-    def get_cve_details(self, cve_id: str) -> Optional[Dict[str, Any]]:
+    async def get_cve_details(self, cve_id: str) -> Optional[Dict[str, Any]]:
         """Get detailed information about a specific CVE"""
         try:
-            api_key = self.config.NVD_API_KEY if hasattr(self.config, 'NVD_API_KEY') else None
-            cve = nvdlib.searchCVE(cveId=cve_id, key=api_key)[0]
+            cve = (await self._query_nvd({"cveId": cve_id}))[0]
             return self._extract_cve_info(cve)
         except Exception as e:
             self.logger.error(f"Failed to get CVE {cve_id}: {e}")
             return None
 
+    async def get_cve_details_batch(self, cve_ids: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Get details for several CVEs concurrently (bounded by the NVD semaphore)"""
+
+        async def fetch(cve_id: str) -> Optional[Dict[str, Any]]:
+            async with self._nvd_sem:
+                return await self.get_cve_details(cve_id)
+
+        results = await asyncio.gather(*(fetch(cve_id) for cve_id in cve_ids))
+        return dict(zip(cve_ids, results))
+
     def generate_cve_report(self, cve_intelligence: Dict[str, Any]) -> str:
         """Generate human-readable CVE report"""
 
-        report = []
-        report.append("=" * 80)
-        report.append("CVE INTELLIGENCE REPORT")
-        report.append("=" * 80)
-        report.append(f"Total CVEs Found: {cve_intelligence['total_cves_found']}")
-        report.append(f"Critical: {len(cve_intelligence['critical_cves'])}")
-        report.append(f"High: {len(cve_intelligence['high_cves'])}")
-        report.append(f"Known Exploited (KEV): {len(cve_intelligence['kev_listed'])}")
-        report.append("")
+        buf = io.StringIO()
+        w = buf.write
+        rule = "=" * 80 + "\n"
+        divider = "-" * 80 + "\n"
+
+        w(rule)
+        w("CVE INTELLIGENCE REPORT\n")
+        w(rule)
+        w(f"Total CVEs Found: {cve_intelligence['total_cves_found']}\n"
+          f"Critical: {len(cve_intelligence['critical_cves'])}\n"
+          f"High: {len(cve_intelligence['high_cves'])}\n"
+          f"Known Exploited (KEV): {len(cve_intelligence['kev_listed'])}\n"
+          "\n")
 
         # Critical CVEs
         if cve_intelligence['critical_cves']:
-            report.append("CRITICAL VULNERABILITIES:")
-            report.append("-" * 80)
+            w("CRITICAL VULNERABILITIES:\n")
+            w(divider)
             for cve in cve_intelligence['critical_cves'][:5]:
-                report.append(f"  {cve['cve_id']} - Score: {cve['score']}")
-                report.append(f"  Attack Vector: {cve['attack_vector']} | "
-                              f"Complexity: {cve['attack_complexity']}")
-                report.append(f"  {cve['description'][:100]}...")
-                report.append("")
+                w(f"  {cve['cve_id']} - Score: {cve['score']}\n"
+                  f"  Attack Vector: {cve['attack_vector']} | "
+                  f"Complexity: {cve['attack_complexity']}\n"
+                  f"  {cve['description'][:100]}...\n"
+                  "\n")
 
         # KEV Listed
         if cve_intelligence['kev_listed']:
-            report.append("KNOWN EXPLOITED VULNERABILITIES (CISA KEV):")
-            report.append("-" * 80)
+            w("KNOWN EXPLOITED VULNERABILITIES (CISA KEV):\n")
+            w(divider)
             for cve in cve_intelligence['kev_listed'][:5]:
-                report.append(f"  ⚠️  {cve['cve_id']} - EXPLOIT EXISTS IN THE WILD")
-                report.append(f"  {cve['description'][:100]}...")
-                report.append("")
+                w(f"  ⚠️  {cve['cve_id']} - EXPLOIT EXISTS IN THE WILD\n"
+                  f"  {cve['description'][:100]}...\n"
+                  "\n")
 
         # Recommended Actions
         if cve_intelligence['recommended_actions']:
-            report.append("RECOMMENDED ACTIONS:")
-            report.append("-" * 80)
+            w("RECOMMENDED ACTIONS:\n")
+            w(divider)
             for action in cve_intelligence['recommended_actions']:
-                report.append(f"  [{action['priority']}] {action['action']}")
-                report.append(f"  Reason: {action['reason']}")
-                report.append(f"  Timeline: {action['timeline']}")
-                report.append(f"  CVEs: {', '.join(action['cves'][:3])}")
-                report.append("")
+                w(f"  [{action['priority']}] {action['action']}\n"
+                  f"  Reason: {action['reason']}\n"
+                  f"  Timeline: {action['timeline']}\n"
+                  f"  CVEs: {', '.join(action['cves'][:3])}\n"
+                  "\n")
 
-        report.append("=" * 80)
+        # Closing rule has no trailing newline
+        w("=" * 80)
 
-        return "\n".join(report)
\ No newline at end of file
+        return buf.getvalue()
@@ -19,7 +19,21 @@ class GroqClient:
     async def _get_session(self) -> aiohttp.ClientSession:
         """Get or create aiohttp session"""
         if self.session is None or self.session.closed:
-            self.session = aiohttp.ClientSession()
+            # One host: keep a small pool of warm TLS connections alive between
+            # analysis cycles and cache its DNS lookup, and send the fixed
+            # headers from the session instead of rebuilding them per call
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit_per_host=32,
+                    keepalive_timeout=120,
+                    ttl_dns_cache=300
+                ),
+                headers={
+                    "Authorization": f"Bearer {self.config.GROQ_API_KEY}",
+                    "Content-Type": "application/json"
+                },
+                timeout=aiohttp.ClientTimeout(total=30)
+            )
         return self.session
 
     async def generate(
@@ -32,11 +46,6 @@ class GroqClient:
 
         session = await self._get_session()
 
-        headers = {
-            "Authorization": f"Bearer {self.config.GROQ_API_KEY}",
-            "Content-Type": "application/json"
-        }
-
         payload = {
             "model": self.config.GROQ_MODEL,
             "messages": [{"role": "user", "content": prompt}],
@@ -45,12 +54,7 @@ class GroqClient:
         }
 
         try:
-            async with session.post(
-                    self.config.GROQ_URL,
-                    headers=headers,
-                    json=payload,
-                    timeout=aiohttp.ClientTimeout(total=30)
-            ) as response:
+            async with session.post(self.config.GROQ_URL, json=payload) as response:
 
                 if response.status == 200:
                     data = await response.json()
@@ -29,16 +29,27 @@ class TokenManager:
 
     def truncate_context(self, text: str, max_tokens: int) -> str:
         """Truncate text to max tokens"""
-        if self.count_tokens(text) <= max_tokens:
-            return text
-
         if self.encoding:
-            tokens = self.encoding.encode(text)
-            truncated = tokens[:max_tokens]
-            return self.encoding.decode(truncated)
-        else:
-            return text[:max_tokens * 4]
+            try:
+                # Encode once; the token list serves both the check and the cut
+                tokens = self.encoding.encode(text)
+            except Exception as e:
+                self.logger.warning(f"Token counting failed: {e}")
+            else:
+                if len(tokens) <= max_tokens:
+                    return text
+                return self.encoding.decode(tokens[:max_tokens])
+
+        if len(text) // 4 <= max_tokens:
+            return text
+        return text[:max_tokens * 4]
 
     def batch_token_counts(self, texts: List[str]) -> List[int]:
         """Count tokens for multiple texts"""
+        if self.encoding:
+            try:
+                # One call into tiktoken, which encodes the texts in parallel
+                return [len(tokens) for tokens in self.encoding.encode_batch(texts)]
+            except Exception as e:
+                self.logger.warning(f"Batch token counting failed: {e}")
         return [self.count_tokens(text) for text in texts]
\ No newline at end of file
@@ -74,7 +74,7 @@ async def main():
             print(f"CVE Analysis: Enabled ✓")
             print(f"NVD API: {'Configured ✓' if config.NVD_API_KEY else 'Not configured (rate limited)'}")
         else:
-            print(f"CVE Analysis: Disabled (check nvdlib installation)")
+            print(f"CVE Analysis: Disabled (check NVD API connectivity)")
 
         print("=" * 80)
         print()
@@ -22,6 +22,12 @@ class GNNAnomalyDetector(torch.nn.Module):
             out_channels=self.config.HIDDEN_CHANNELS
         )
         self.reconstruction = torch.nn.Linear(self.config.HIDDEN_CHANNELS, in_channels)
+        if getattr(self.config, 'GNN_INT8_INFERENCE', False):
+            # int8 weights with per-batch activation scaling; inference only
+            # (the quantized layer has no autograd), scores stay float32
+            self.reconstruction = torch.ao.quantization.quantize_dynamic(
+                torch.nn.Sequential(self.reconstruction), {torch.nn.Linear}, dtype=torch.qint8
+            )
         self.initialized = True
 
     def forward(self, x, edge_index):
@@ -32,4 +38,9 @@ class GNNAnomalyDetector(torch.nn.Module):
         return z, x_recon
 
     def compute_anomaly_scores(self, x, x_recon):
-        return torch.mean((x - x_recon) ** 2, dim=1)
\ No newline at end of file
+        diff = x - x_recon
+        if diff.requires_grad:
+            return torch.mean(diff ** 2, dim=1)
+        # Inference: square in place so only one (N, F) temporary is allocated
+        diff.square_()
+        return diff.mean(dim=1)
\ No newline at end of file
@@ -1,6 +1,5 @@
 import numpy as np
 import torch
-from collections import deque
 
 
 class ZScoreAnomalyDetector:
@@ -8,25 +7,52 @@ class ZScoreAnomalyDetector:
 
     def __init__(self, threshold=3.0, window_size=100):
         self.threshold = threshold
-        self.window = deque(maxlen=window_size)
+        self.window_size = window_size
+        # Fixed-size ring buffer of the most recent scores: updates are slice
+        # writes and the statistics reduce over one contiguous array
+        self.buf = np.empty(window_size, dtype=np.float64)
+        self.head = 0
+        self.filled = 0
 
     def update(self, scores):
         """Update with new scores"""
         scores_np = scores.cpu().numpy() if torch.is_tensor(scores) else scores
-        self.window.extend(scores_np)
+        scores_np = np.ravel(scores_np)
+        n = len(scores_np)
+        size = self.window_size
+
+        if n >= size:
+            # Only the newest window_size scores survive
+            self.buf[:] = scores_np[-size:]
+            self.head = 0
+            self.filled = size
+            return
+
+        end = self.head + n
+        if end <= size:
+            self.buf[self.head:end] = scores_np
+        else:
+            split = size - self.head
+            self.buf[self.head:] = scores_np[:split]
+            self.buf[:end - size] = scores_np[split:]
+        self.head = end % size
+        self.filled = min(size, self.filled + n)
 
     def detect_anomalies(self, scores):
         """Detect anomalies using Z-score"""
         scores_np = scores.cpu().numpy() if torch.is_tensor(scores) else scores
 
-        if len(self.window) < 10:
+        if self.filled < 10:
             return np.zeros(len(scores_np), dtype=bool), scores_np
 
-        mean = np.mean(self.window)
-        std = np.std(self.window)
+        # Mean/std don't depend on order, so the (possibly wrapped) filled
+        # prefix can be used as-is
+        window = self.buf[:self.filled]
+        mean = window.mean()
+        std = window.std()
         std = std if std > 0 else 1e-6
 
         z_scores = np.abs((scores_np - mean) / std)
         anomalies = z_scores > self.threshold
 
-        return anomalies, z_scores
\ No newline at end of file
+        return anomalies, z_scores
@@ -1,3 +1,4 @@
+import asyncio
 import torch
 import numpy as np
 import time
@@ -14,6 +15,12 @@ class BatchProcessor:
         self.batch_size = config.BATCH_SIZE
 
     async def process_graph(self, graph_data: Dict, gnn_model, zscore_detector) -> Dict:
+        """Process entire graph in batches without blocking the event loop"""
+        # The forward passes are CPU/GPU-bound and torch releases the GIL while
+        # they run, so a worker thread lets the loop serve the LLM call meanwhile
+        return await asyncio.to_thread(self.process_graph_sync, graph_data, gnn_model, zscore_detector)
+
+    def process_graph_sync(self, graph_data: Dict, gnn_model, zscore_detector) -> Dict:
         """Process entire graph in batches"""
         start_time = time.time()
 
@@ -293,7 +293,8 @@ def generate_synthetic_graph(num_nodes=100, num_features=16, anomaly_rate=0.05):
 
     # Generate Barabasi-Albert graph (scale-free network)
     G = nx.barabasi_albert_graph(num_nodes, 3)
-    edge_index = torch.tensor(list(G.edges())).t().contiguous()
+    edges = np.asarray(G.edges(), dtype=np.int64).reshape(-1, 2)
+    edge_index = torch.from_numpy(edges.T).contiguous()
     edge_index = torch.cat([edge_index, edge_index.flip(0)], dim=1)
 
     # Normal node features
@@ -301,11 +302,15 @@ def generate_synthetic_graph(num_nodes=100, num_features=16, anomaly_rate=0.05):
 
     # Inject anomalies
     num_anomalies = max(1, int(num_nodes * anomaly_rate))
-    anomaly_nodes = np.random.choice(num_nodes, num_anomalies, replace=False)
-
-    # Make anomalies stand out (higher magnitude features)
-    for node in anomaly_nodes:
-        x[node] = x[node] * 3 + torch.randn(num_features) * 2
+    # shuffle=False skips permuting the draw; the Generator samples k of N
+    # without building a full permutation of all N nodes
+    anomaly_nodes = np.random.default_rng().choice(
+        num_nodes, num_anomalies, replace=False, shuffle=False
+    )
+
+    # Make anomalies stand out (higher magnitude features), all rows at once
+    idx = torch.from_numpy(anomaly_nodes)
+    x[idx] = x[idx] * 3 + torch.randn(num_anomalies, num_features) * 2
 
     return Data(x=x, edge_index=edge_index)
 
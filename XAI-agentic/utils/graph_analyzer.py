@@ -2,11 +2,24 @@
 utils/graph_analyzer.py - Graph Structure Analysis
 """
 
+import hashlib
 import networkx as nx
 import torch
 import numpy as np
 import logging
 
+# Optional: igraph's C core computes exact betweenness far faster than
+# networkx can estimate it; networkx stays the graph store either way
+try:
+    import igraph
+    HAS_IGRAPH = True
+except ImportError:
+    HAS_IGRAPH = False
+
+# Betweenness is estimated from this many sampled source nodes (O(kE) instead
+# of O(NE)); graphs this small or smaller get the exact value
+BETWEENNESS_SAMPLES = 50
+
 
 class GraphAnalyzer:
     """Analyze graph structure for vulnerabilities"""
@@ -14,18 +27,63 @@ class GraphAnalyzer:
     def __init__(self):
         self.G = None
         self.logger = logging.getLogger(__name__)
+        # Topology fingerprint of self.G, its betweenness (computed lazily)
+        # and the per-node clustering coefficients computed so far
+        self._last_hash = None
+        self._betweenness = None
+        self._clustering = {}
 
     def update_graph(self, edge_index, num_nodes):
-        """Update NetworkX graph"""
-        self.G = nx.Graph()
-        self.G.add_nodes_from(range(num_nodes))
-
+        """Update NetworkX graph (skipped when the topology is unchanged)"""
         if torch.is_tensor(edge_index):
             edges = edge_index.t().cpu().numpy()
         else:
             edges = edge_index.T
 
-        self.G.add_edges_from(edges)
+        topo_hash = hashlib.blake2b(digest_size=16)
+        topo_hash.update(f"{num_nodes}:{edges.shape}:{edges.dtype}".encode())
+        topo_hash.update(np.ascontiguousarray(edges).tobytes())
+        topo_hash = topo_hash.digest()
+        if self.G is not None and topo_hash == self._last_hash:
+            return
+
+        self.G = nx.Graph()
+        self.G.add_nodes_from(range(num_nodes))
+        # tolist() converts the whole array to Python ints in C; iterating the
+        # array directly builds numpy rows/scalars per edge and leaves
+        # numpy-int neighbour keys in the graph
+        self.G.add_edges_from(edges.tolist())
+        self._last_hash = topo_hash
+        self._betweenness = None
+        self._clustering = {}
+
+    def _get_betweenness(self):
+        """Betweenness centrality of the current graph, cached until it changes"""
+        if self._betweenness is None:
+            if HAS_IGRAPH:
+                self._betweenness = self._igraph_betweenness()
+            else:
+                k = BETWEENNESS_SAMPLES if self.G.number_of_nodes() > BETWEENNESS_SAMPLES else None
+                # Fixed seed so the estimate is stable for a given topology
+                self._betweenness = nx.betweenness_centrality(self.G, k=k, seed=0)
+        return self._betweenness
+
+    def _igraph_betweenness(self):
+        """Exact normalized betweenness of self.G computed by igraph"""
+        num_nodes = max(self.G) + 1
+        edges = np.asarray(list(self.G.edges()), dtype=np.int64).reshape(-1, 2)
+        g = igraph.Graph(n=num_nodes, edges=edges.tolist(), directed=False)
+        raw = g.betweenness(directed=False)
+        # Same normalization as nx.betweenness_centrality for undirected graphs
+        scale = 2.0 / ((num_nodes - 1) * (num_nodes - 2)) if num_nodes > 2 else 1.0
+        return {int(node): raw[int(node)] * scale for node in self.G}
+
+    def _get_clustering(self, nodes):
+        """Clustering coefficients for nodes, computing only the ones not yet cached"""
+        missing = [n for n in nodes if n not in self._clustering]
+        if missing:
+            self._clustering.update(nx.clustering(self.G, missing))
+        return self._clustering
 
     def find_vulnerable_paths(self, anomalous_nodes, top_k=5):
         """Find critical paths between anomalous nodes"""
@@ -37,25 +95,62 @@ class GraphAnalyzer:
         # Convert all nodes to Python int
         anomalous_nodes_list = [int(n) for n in anomalous_nodes[:top_k]]
 
+        # One BFS per source covers all of its later targets (instead of a
+        # has_path + shortest_path search per pair)
         for i, n1 in enumerate(anomalous_nodes_list):
-            for n2 in anomalous_nodes_list[i + 1:]:
-                try:
-                    if nx.has_path(self.G, n1, n2):
-                        path = nx.shortest_path(self.G, n1, n2)
-                        if len(path) > 2:
-                            paths.append({
-                                'path': [int(n) for n in path],
-                                'length': len(path),
-                                'source': int(n1),
-                                'target': int(n2)
-                            })
-                except Exception as e:
-                    self.logger.debug(f"Path finding failed for {n1}->{n2}: {e}")
-                    continue
+            targets = anomalous_nodes_list[i + 1:]
+            try:
+                found = self._shortest_paths_to(n1, targets)
+            except Exception as e:
+                self.logger.debug(f"Path finding failed for {n1}: {e}")
+                continue
+
+            for n2 in targets:
+                path = found.get(n2)
+                if path is not None and len(path) > 2:
+                    paths.append({
+                        'path': path,
+                        'length': len(path),
+                        'source': n1,
+                        'target': n2
+                    })
 
         paths.sort(key=lambda x: x['length'])
         return paths[:top_k]
 
+    def _shortest_paths_to(self, source, targets):
+        """
+        Shortest paths from source to each reachable target, via a single BFS
+        that stops as soon as every target has been reached
+        """
+        if source not in self.G:
+            raise nx.NodeNotFound(f"Source {source} is not in G")
+
+        adj = self.G.adj
+        parent = {source: None}
+        remaining = set(targets) - {source}
+        frontier = [source]
+        while frontier and remaining:
+            next_frontier = []
+            for u in frontier:
+                for v in adj[u]:
+                    if v not in parent:
+                        parent[v] = u
+                        next_frontier.append(v)
+                        remaining.discard(v)
+            frontier = next_frontier
+
+        found = {}
+        for target in targets:
+            if target not in parent:
+                continue
+            path = [target]
+            while path[-1] != source:
+                path.append(parent[path[-1]])
+            # Neighbour keys can be numpy ints (edges come from arrays)
+            found[target] = [int(n) for n in reversed(path)]
+        return found
+
     def analyze_node_importance(self, node_id):
         """Analyze node metrics"""
         # ✅ FIX: Convert numpy.int64 to Python int
@@ -87,8 +182,8 @@ class GraphAnalyzer:
         }
 
         try:
-            # Calculate betweenness centrality for all nodes
-            betweenness_dict = nx.betweenness_centrality(self.G)
+            # Betweenness for all nodes, reused across calls on the same graph
+            betweenness_dict = self._get_betweenness()
             metrics['betweenness'] = float(betweenness_dict.get(node_id, 0.0))
         except Exception as e:
             self.logger.debug(f"Betweenness calculation failed: {e}")
@@ -96,9 +191,55 @@ class GraphAnalyzer:
 
         try:
             # Calculate clustering coefficient
-            metrics['clustering'] = float(nx.clustering(self.G, node_id))
+            metrics['clustering'] = float(self._get_clustering((node_id,))[node_id])
         except Exception as e:
             self.logger.debug(f"Clustering calculation failed: {e}")
             metrics['clustering'] = 0.0
 
-        return metrics
\ No newline at end of file
+        return metrics
+
+    def analyze_nodes_importance(self, node_ids):
+        """
+        Analyze metrics for several nodes at once
+
+        Returns a dict of arrays aligned with node_ids (zeros for nodes
+        missing from the graph).
+        """
+        node_ids = [int(n) for n in node_ids]
+        count = len(node_ids)
+        metrics = {
+            'degree': np.zeros(count, dtype=np.int64),
+            'betweenness': np.zeros(count, dtype=np.float64),
+            'clustering': np.zeros(count, dtype=np.float64),
+            'num_neighbors': np.zeros(count, dtype=np.int64)
+        }
+
+        if self.G is None:
+            return metrics
+
+        present = [i for i, node_id in enumerate(node_ids) if node_id in self.G]
+        if len(present) < count:
+            self.logger.warning(f"{count - len(present)} nodes not in graph")
+        if not present:
+            return metrics
+
+        nodes = [node_ids[i] for i in present]
+        idx = np.asarray(present, dtype=np.int64)
+
+        degrees = dict(self.G.degree(nodes))
+        metrics['degree'][idx] = [degrees[n] for n in nodes]
+        metrics['num_neighbors'][idx] = [len(self.G[n]) for n in nodes]
+
+        try:
+            betweenness_dict = self._get_betweenness()
+            metrics['betweenness'][idx] = [betweenness_dict.get(n, 0.0) for n in nodes]
+        except Exception as e:
+            self.logger.debug(f"Betweenness calculation failed: {e}")
+
+        try:
+            clustering_dict = self._get_clustering(nodes)
+            metrics['clustering'][idx] = [clustering_dict.get(n, 0.0) for n in nodes]
+        except Exception as e:
+            self.logger.debug(f"Clustering calculation failed: {e}")
+
+        return metrics
@@ -0,0 +1,21 @@
+"""
+utils/json_encoder.py - JSON encoding for numpy values
+"""
+
+import json
+import numpy as np
+
+
+class NumpyEncoder(json.JSONEncoder):
+    """json.JSONEncoder that converts numpy scalars and arrays to Python types"""
+
+    def default(self, obj):
+        if isinstance(obj, np.integer):
+            return int(obj)
+        if isinstance(obj, np.floating):
+            return float(obj)
+        if isinstance(obj, np.bool_):
+            return bool(obj)
+        if isinstance(obj, np.ndarray):
+            return obj.tolist()
+        return super().default(obj)
@@ -814,8 +814,12 @@ def ingest_file():
 
 @app.route("/ingest_text", methods=["POST"])
 def ingest_text():
-    """Ingest from request body"""
-    raw = request.json.get("logs", "")
+    """Ingest from request body (JSON {"logs": ...} or a raw text/plain body)"""
+    if request.is_json:
+        raw = request.json.get("logs", "")
+    else:
+        # Plain-text upload: the log is the body, no JSON escaping round trip
+        raw = request.get_data(as_text=True)
     if not raw:
         return jsonify({"status": "error", "message": "No logs provided"}), 400
     
@@ -10,7 +10,7 @@ from graph_builder import build_graph
 from anomaly_detector import compute_node_risk, zscore_anomaly_detection, llm_consensus_check
 from gnn_trainer import train_on_examples
 from utils.data_store import save_report
-from redis_cache import RedisCache
+from redis_cache import RedisCache, RESULTS_PREFIX
 
 app = Flask(__name__)
 
@@ -34,11 +34,17 @@ redis_cache = RedisCache(
     port=int(os.getenv("REDIS_PORT", 6379)),
     db=int(os.getenv("REDIS_DB", 0)),
     password=os.getenv("REDIS_PASSWORD"),
-    default_ttl=int(os.getenv("CACHE_TTL", 3600)),  # 1 hour default
-    max_memory=os.getenv("REDIS_MAX_MEMORY", "256mb"),
-    eviction_policy=os.getenv("REDIS_EVICTION_POLICY", "allkeys-lru")
+    default_ttl=int(os.getenv("CACHE_TTL", 3600))  # 1 hour default
 )
 
+# Server-wide memory limits belong in redis.conf; only push them from here
+# when explicitly configured for this deployment
+if os.getenv("REDIS_MAX_MEMORY") or os.getenv("REDIS_EVICTION_POLICY"):
+    redis_cache.configure_server(
+        max_memory=os.getenv("REDIS_MAX_MEMORY", "256mb"),
+        eviction_policy=os.getenv("REDIS_EVICTION_POLICY", "allkeys-lru")
+    )
+
 
 def convert_to_ist(timestamp):
     """Convert Unix timestamp to IST format"""
@@ -490,8 +496,12 @@ def ingest_file():
 
 @app.route("/ingest_text", methods=["POST"])
 def ingest_text():
-    """Ingest logs from HTTP request body"""
-    raw = request.json.get("logs", "")
+    """Ingest logs from HTTP request body (JSON {"logs": ...} or raw text/plain)"""
+    if request.is_json:
+        raw = request.json.get("logs", "")
+    else:
+        # Plain-text upload: the log is the body, no JSON escaping round trip
+        raw = request.get_data(as_text=True)
     if not raw:
         return jsonify({
             "status": "error",
@@ -706,7 +716,7 @@ def process_and_emit(raw_logs):
     # ================================================================
     # STEP 7: Save report
     # ================================================================
-    report_path = save_report(report)
+    report_path = save_report(report, wait=True)
     report["report_path"] = report_path
 
     print(f"\n📄 Report saved to: {report_path}")
@@ -742,7 +752,7 @@ def process_and_emit(raw_logs):
             )
             
             if cached:
-                print(f"✅ D3 results cached in Redis with key: results:{cache_key}")
+                print(f"✅ D3 results cached in Redis with key: {RESULTS_PREFIX}{cache_key}")
                 report["cache_key"] = cache_key
             
             # Auto-flush old entries to keep cache dynamic
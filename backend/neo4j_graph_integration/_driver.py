@@ -0,0 +1,57 @@
+"""
+_driver.py - Shared Neo4j driver
+--------------------------------
+One driver (one connection pool, one TLS handshake) per process, shared by
+GraphBuilder, FeatureComputer and Neo4jUploader instead of each opening its own.
+"""
+
+import os
+
+from neo4j import GraphDatabase
+
+# key -> [driver, number of holders]
+_drivers = {}
+
+
+# Pool-level settings, sized for the heaviest user (the uploader's writer
+# threads); per-query tuning such as fetch_size belongs on the session
+DEFAULT_CONFIG = {
+    "max_connection_lifetime": 3600,
+    "max_connection_pool_size": int(os.getenv("NEO4J_POOL_SIZE", 50)),
+    "connection_timeout": float(os.getenv("NEO4J_CONNECT_TIMEOUT", 15)),
+    "keep_alive": True,
+}
+
+
+def get_driver(uri, user, password, **config):
+    """Return the process-wide driver for these credentials, creating it lazily.
+
+    Extra keyword arguments are passed to GraphDatabase.driver() on top of
+    DEFAULT_CONFIG; differently-tuned callers get separate drivers. Every
+    call must be paired with a close_driver().
+    """
+    config = {**DEFAULT_CONFIG, **config}
+    key = (uri, user, password, tuple(sorted(config.items())))
+    entry = _drivers.get(key)
+    if entry is None:
+        driver = GraphDatabase.driver(uri, auth=(user, password), **config)
+        try:
+            driver.verify_connectivity()
+        except Exception:
+            # Don't cache a driver that never connected
+            driver.close()
+            raise
+        entry = _drivers[key] = [driver, 0]
+    entry[1] += 1
+    return entry[0]
+
+
+def close_driver(driver):
+    """Release one holder's reference; the driver closes when the last one lets go"""
+    for key, entry in list(_drivers.items()):
+        if entry[0] is driver:
+            entry[1] -= 1
+            if entry[1] > 0:
+                return
+            del _drivers[key]
+    driver.close()
@@ -5,7 +5,6 @@ Works with unified results.json schema
 Computes graph metrics without GDS plugin (AuraDB Free compatible)
 """
 
-from neo4j import GraphDatabase
 from neo4j.exceptions import ServiceUnavailable, AuthError
 from pathlib import Path
 from datetime import datetime, timezone, timedelta
@@ -14,6 +13,8 @@ import re
 
 sys.path.append(str(Path(__file__).parent))
 
+from _driver import get_driver, close_driver
+
 
 # Load from .env
 from dotenv import load_dotenv
@@ -32,12 +33,7 @@ class FeatureComputer:
     def __init__(self):
         try:
             print("🔌 Connecting to Neo4j...")
-            self.driver = GraphDatabase.driver(
-                NEO4J_URI,
-                auth=(NEO4J_USER, NEO4J_PASSWORD),
-                max_connection_lifetime=3600
-            )
-            self.driver.verify_connectivity()
+            self.driver = get_driver(NEO4J_URI, NEO4J_USER, NEO4J_PASSWORD)
             print("✅ Connected successfully!\n")
         except (AuthError, ServiceUnavailable) as e:
             print(f"❌ Connection error: {e}")
@@ -45,7 +41,7 @@ class FeatureComputer:
 
     def close(self):
         if self.driver:
-            self.driver.close()
+            close_driver(self.driver)
             print("\n🔌 Connection closed")
 
     
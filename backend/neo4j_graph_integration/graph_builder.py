@@ -1,4 +1,3 @@
-from neo4j import GraphDatabase
 from neo4j.exceptions import ServiceUnavailable, AuthError
 from pathlib import Path
 import sys
@@ -6,17 +5,13 @@ import sys
 sys.path.append(str(Path(__file__).parent))
 
 from config import NEO4J_URI, NEO4J_USER, NEO4J_PASSWORD
+from _driver import get_driver, close_driver
 
 class GraphBuilder:
     def __init__(self):
         try:
             print("🔌 Connecting to Neo4j...")
-            self.driver = GraphDatabase.driver(
-                NEO4J_URI,
-                auth=(NEO4J_USER, NEO4J_PASSWORD),
-                max_connection_lifetime=3600
-            )
-            self.driver.verify_connectivity()
+            self.driver = get_driver(NEO4J_URI, NEO4J_USER, NEO4J_PASSWORD)
             print("✅ Connected to Neo4j successfully!\n")
             
         except (AuthError, ServiceUnavailable) as e:
@@ -25,57 +20,79 @@ class GraphBuilder:
     
     def close(self):
         if self.driver:
-            self.driver.close()
+            close_driver(self.driver)
             print("\n🔌 Connection closed")
     
     def create_indexes(self):
         """Create indexes for faster querying on IP and PROCESS nodes"""
         print("Creating indexes...")
+        # IF NOT EXISTS makes these idempotent, so no existence checks needed.
+        # id lookups are served by the uniqueness constraints' own indexes.
+        indexes = [
+            "CREATE INDEX ip_name_index IF NOT EXISTS FOR (n:IP) ON (n.name)",
+            "CREATE INDEX process_name_index IF NOT EXISTS FOR (n:PROCESS) ON (n.name)",
+            "CREATE INDEX risk_score_index IF NOT EXISTS FOR (n:IP) ON (n.risk_score)",
+            "CREATE INDEX risk_score_process_index IF NOT EXISTS FOR (n:PROCESS) ON (n.risk_score)"
+        ]
+
         with self.driver.session() as session:
-            indexes = [
-                "CREATE INDEX ip_id_index IF NOT EXISTS FOR (n:IP) ON (n.id)",
-                "CREATE INDEX ip_name_index IF NOT EXISTS FOR (n:IP) ON (n.name)",
-                "CREATE INDEX process_id_index IF NOT EXISTS FOR (n:PROCESS) ON (n.id)",
-                "CREATE INDEX process_name_index IF NOT EXISTS FOR (n:PROCESS) ON (n.name)",
-                "CREATE INDEX risk_score_index IF NOT EXISTS FOR (n:IP) ON (n.risk_score)",
-                "CREATE INDEX risk_score_process_index IF NOT EXISTS FOR (n:PROCESS) ON (n.risk_score)"
-            ]
-            
-            for idx_query in indexes:
-                try:
-                    session.run(idx_query)
-                except Exception:
-                    pass  # Index already exists
-            
-            print("✅ Indexes created\n")
-    
+            with session.begin_transaction() as tx:
+                for idx_query in indexes:
+                    tx.run(idx_query)
+                tx.commit()
+
+        print("✅ Indexes created\n")
+
     def create_constraints(self):
         """Create uniqueness constraints for node IDs"""
         print("Creating constraints...")
+        constraints = [
+            "CREATE CONSTRAINT ip_id_unique IF NOT EXISTS FOR (n:IP) REQUIRE n.id IS UNIQUE",
+            "CREATE CONSTRAINT process_id_unique IF NOT EXISTS FOR (n:PROCESS) REQUIRE n.id IS UNIQUE",
+            "CREATE CONSTRAINT service_id_unique IF NOT EXISTS FOR (n:SERVICE) REQUIRE n.id IS UNIQUE"
+        ]
+
+        # Plain id indexes (from earlier runs or the uploader) block constraints
+        # on the same label/property, and IF NOT EXISTS doesn't cover that
+        legacy_indexes = ["ip_id", "process_id", "service_id", "ip_id_index", "process_id_index"]
+
         with self.driver.session() as session:
-            constraints = [
-                "CREATE CONSTRAINT ip_id_unique IF NOT EXISTS FOR (n:IP) REQUIRE n.id IS UNIQUE",
-                "CREATE CONSTRAINT process_id_unique IF NOT EXISTS FOR (n:PROCESS) REQUIRE n.id IS UNIQUE"
-                "CREATE CONSTRAINT service_id_unique IF NOT EXISTS FOR (n:SERVICE) REQUIRE n.id IS UNIQUE"
-            ]
-            
-            for const_query in constraints:
-                try:
-                    session.run(const_query)
-                except Exception:
-                    pass  # Constraint already exists
-            
-            print("✅ Constraints created\n")
-    
+            with session.begin_transaction() as tx:
+                for name in legacy_indexes:
+                    tx.run(f"DROP INDEX {name} IF EXISTS")
+                tx.commit()
+
+            with session.begin_transaction() as tx:
+                for const_query in constraints:
+                    tx.run(const_query)
+                tx.commit()
+
+        print("✅ Constraints created\n")
+
     def create_derived_relationships(self):
         """Create additional relationships based on analysis"""
         print("Creating derived relationships...")
         with self.driver.session() as session:
+            # Collect the high-risk nodes once (label-scoped so the risk_score
+            # indexes apply) and pair them by list position instead of a
+            # second MATCH, which would build an N x N cartesian product.
+            # Sorting by elementId keeps each pair's direction stable across
+            # reruns, so MERGE never adds a reversed duplicate.
             query = """
-            MATCH (a)
-            WHERE a.risk_score >= 9.0
-            MATCH (b)
-            WHERE b.risk_score >= 9.0 AND elementId(a) < elementId(b)
+            CALL {
+                MATCH (n:IP) WHERE n.risk_score >= 9.0 RETURN n
+                UNION
+                MATCH (n:PROCESS) WHERE n.risk_score >= 9.0 RETURN n
+                UNION
+                MATCH (n:SERVICE) WHERE n.risk_score >= 9.0 RETURN n
+                UNION
+                MATCH (n:NODE) WHERE n.risk_score >= 9.0 RETURN n
+            }
+            WITH n ORDER BY elementId(n)
+            WITH collect(n) AS hrs
+            UNWIND range(0, size(hrs) - 2) AS i
+            UNWIND range(i + 1, size(hrs) - 1) AS j
+            WITH hrs[i] AS a, hrs[j] AS b
             MERGE (a)-[r:HIGH_RISK_CLUSTER]->(b)
             SET r.created_at = timestamp()
             RETURN count(r) as relationships_created
@@ -97,8 +114,8 @@ class GraphBuilder:
         print("=" * 50)
         print()
         
-        self.create_indexes()
         self.create_constraints()
+        self.create_indexes()
         self.create_derived_relationships()
         
         print("=" * 50)
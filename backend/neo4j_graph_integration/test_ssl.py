@@ -4,7 +4,9 @@ uri = "neo4j+s://your-neo4j-aura-instance.databases.neo4j.io"
 user = "neo4j"
 password = "YOUR_PASSWORD_HERE"
 
-driver = GraphDatabase.driver(uri, auth=(user, password))
-driver.verify_connectivity()
-print("✅ Connected to Neo4j Aura securely!")
-driver.close()
+# Manual connectivity check only; the pipeline uses the shared driver in _driver.py
+if __name__ == "__main__":
+    driver = GraphDatabase.driver(uri, auth=(user, password))
+    driver.verify_connectivity()
+    print("✅ Connected to Neo4j Aura securely!")
+    driver.close()
@@ -9,12 +9,43 @@ uploader.py — Neo4j Aura Data Uploader (FIXED VERSION)
 
 import os
 import sys
+import csv
 import json
+import logging
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice, product
 from pathlib import Path
-from neo4j import GraphDatabase
+import numpy as np
+from tqdm import tqdm
 from neo4j.exceptions import ServiceUnavailable, AuthError, ConfigurationError
 from dotenv import load_dotenv
 
+sys.path.append(str(Path(__file__).parent))
+
+from _driver import get_driver, close_driver
+
+# Per-chunk progress for non-interactive runs (the tqdm bars cover terminals).
+# Configured here because this module runs as a script and nothing else sets
+# up logging, which would leave INFO lines to the WARNING-only fallback.
+logger = logging.getLogger(__name__)
+if not logger.handlers:
+    _console = logging.StreamHandler(sys.stdout)
+    _console.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s',
+                                            datefmt='%H:%M:%S'))
+    logger.addHandler(_console)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+# Optional: incremental JSON parsing keeps large results.json files out of memory
+try:
+    import ijson
+    HAS_IJSON = True
+    JSON_ERRORS = (json.JSONDecodeError, ijson.JSONError)
+except ImportError:
+    HAS_IJSON = False
+    JSON_ERRORS = (json.JSONDecodeError,)
+
 # Load environment
 BASE_DIR = Path(__file__).resolve().parent
 BACKEND_DIR = BASE_DIR.parent
@@ -23,30 +54,159 @@ load_dotenv(BACKEND_DIR / ".env")
 NEO4J_URI = os.getenv("NEO4J_URI")
 NEO4J_USER = os.getenv("NEO4J_USER") or os.getenv("NEO4J_USERNAME")
 NEO4J_PASSWORD = os.getenv("NEO4J_PASSWORD")
+# Naming the database explicitly skips the home-database lookup round-trip
+NEO4J_DATABASE = os.getenv("NEO4J_DATABASE", "neo4j")
 
 if not all([NEO4J_URI, NEO4J_USER, NEO4J_PASSWORD]):
     print("❌ Missing Neo4j credentials in .env file.")
     sys.exit(1)
 
+# Server-side import/ directory for cold LOAD CSV imports (self-hosted Neo4j only)
+NEO4J_IMPORT_DIR = os.getenv("NEO4J_IMPORT_DIR")
+CSV_TX_ROWS = 10000
+
+# Plain id indexes created by earlier versions of this script and GraphBuilder;
+# they conflict with the uniqueness constraints that now back those lookups
+LEGACY_ID_INDEXES = ["ip_id", "process_id", "service_id", "ip_id_index", "process_id_index"]
+
+# Cypher conversion applied to typed CSV columns (everything else stays a string)
+NODE_CSV_CASTS = {
+    "node_number": "toInteger", "cve_count": "toInteger", "group": "toInteger",
+    "gnn_predicted_label": "toInteger", "gnn_actual_label": "toInteger",
+    "risk_score": "toFloat", "cve_risk": "toFloat", "behavioral_risk": "toFloat",
+    "anomaly_probability": "toFloat", "enhanced_anomaly_score": "toFloat", "size": "toFloat",
+    "has_critical_cve": "toBoolean", "has_high_cve": "toBoolean", "is_anomaly": "toBoolean",
+    "is_detected_anomaly": "toBoolean", "is_confirmed_anomaly": "toBoolean",
+}
+REL_CSV_COLUMNS = ["id", "source", "target", "type", "connection_type", "weight", "count"]
+
+# Rows per UNWIND write transaction (lower it if the server runs out of heap);
+# relationships share one fixed schema, so each batch is also coerced column-wise
+BATCH_SIZE = int(os.getenv("NEO4J_BATCH_SIZE", 20000))
+# Concurrent node writers; each label's batch touches disjoint nodes, so
+# separate sessions don't contend for locks (1 = reuse the pipeline session)
+UPLOAD_WORKERS = int(os.getenv("NEO4J_UPLOAD_WORKERS", 4))
+# Session settings for a write-only upload: nothing is streamed back, so
+# fetch everything at once. They live on the session rather than the driver
+# so the uploader shares the pool GraphBuilder and FeatureComputer use.
+SESSION_CONFIG = {
+    "database": NEO4J_DATABASE,
+    "connection_acquisition_timeout": float(os.getenv("NEO4J_ACQUIRE_TIMEOUT", 120)),
+    "max_transaction_retry_time": float(os.getenv("NEO4J_RETRY_TIME", 30)),
+    "fetch_size": -1,
+}
+# Numeric node properties: (field, Python cast, numpy dtype, default)
+NODE_NUMERIC_FIELDS = (
+    ("node_number", int, np.int64, 0),
+    ("risk_score", float, np.float64, 0),
+    ("cve_risk", float, np.float64, 0),
+    ("behavioral_risk", float, np.float64, 0),
+    ("cve_count", int, np.int64, 0),
+    ("has_critical_cve", bool, np.bool_, False),
+    ("has_high_cve", bool, np.bool_, False),
+    ("is_anomaly", bool, np.bool_, False),
+    ("is_detected_anomaly", bool, np.bool_, False),
+    ("is_confirmed_anomaly", bool, np.bool_, False),
+    ("anomaly_probability", float, np.float64, 0),
+    ("enhanced_anomaly_score", float, np.float64, 0),
+    ("gnn_predicted_label", int, np.int64, 0),
+    ("gnn_actual_label", int, np.int64, 0),
+    ("size", float, np.float64, 10),
+    ("group", int, np.int64, 0),
+)
+REL_DTYPE = np.dtype([
+    ("id", object), ("source", object), ("target", object),
+    ("type", object), ("connection_type", object),
+    ("weight", np.float64), ("count", np.int64),
+])
+
 print(f"📋 Configuration:")
 print(f"   URI: {NEO4J_URI[:40]}...")
 print(f"   User: {NEO4J_USER}\n")
 
 
+def _intern(value):
+    """
+    Intern low-cardinality string properties (category, severity, color...)
+    so every node shares one object per distinct value instead of a fresh
+    string per parsed row.
+    """
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _chunks(iterable, size):
+    """Yield lists of at most `size` items from any iterable"""
+    it = iter(iterable)
+    while True:
+        chunk = list(islice(it, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+# Fixed label set: one prebuilt statement per label (and per endpoint-label
+# pair) keeps the server's query-plan cache small and always warm. Labels
+# outside this set are stored as NODE.
+NODE_LABELS = ("IP", "PROCESS", "SERVICE", "NODE")
+
+NODE_CYPHERS = {
+    label: f"UNWIND $rows AS r MERGE (n:{label} {{id: r.id}}) SET n += r.props RETURN count(n) AS written"
+    for label in NODE_LABELS
+}
+
+
+def _relationship_cypher(source_label, target_label):
+    """UNWIND relationship write; unknown endpoint labels fall back to a label-less MATCH"""
+    source = f"a:{source_label}" if source_label else "a"
+    target = f"b:{target_label}" if target_label else "b"
+    return f"""
+    UNWIND $rows AS r
+    MATCH ({source} {{id: r.source}})
+    MATCH ({target} {{id: r.target}})
+    MERGE (a)-[e:CONNECTED_TO]->(b)
+    SET e.id = r.id,
+        e.type = r.type,
+        e.connection_type = r.connection_type,
+        e.weight = r.weight,
+        e.count = r.count
+    RETURN count(e) AS written
+    """
+
+
+REL_CYPHERS = {
+    (source, target): _relationship_cypher(source, target)
+    for source, target in product(NODE_LABELS + (None,), repeat=2)
+}
+
+
+# Single parameter map: one plan, and no result records to stream back
+METADATA_CYPHER = "MERGE (m:METADATA {id: 'analysis_metadata'}) SET m += $m"
+
+
+def _write_chunk(tx, cypher, rows):
+    """Run one UNWIND batch in a managed write transaction; returns rows written"""
+    return tx.run(cypher, rows=rows).single()["written"]
+
+
 class Neo4jUploader:
-    def __init__(self, uri, user, password):
+    def __init__(self, uri, user, password, **driver_config):
         self.uri = uri
         self.user = user
         self.password = password
+        # Extra driver settings; any override gets its own pool instead of
+        # the shared one
+        self.driver_config = driver_config
         self.driver = None
+        # id -> label of every node uploaded in this run, so relationship
+        # endpoints can be matched through the per-label id indexes
+        self._node_labels = {}
         self._connect()
 
     def _connect(self):
         """Connect to Neo4j with fallback"""
         try:
             print(f"🔌 Connecting to Neo4j...")
-            self.driver = GraphDatabase.driver(self.uri, auth=(self.user, self.password))
-            self.driver.verify_connectivity()
+            self.driver = get_driver(self.uri, self.user, self.password, **self.driver_config)
             print("✅ Connected successfully!\n")
 
         except (ServiceUnavailable, ConfigurationError) as e:
@@ -55,8 +215,7 @@ class Neo4jUploader:
                 host = self.uri.split("://")[1]
                 fallback_uri = f"bolt+s://{host}"
                 try:
-                    self.driver = GraphDatabase.driver(fallback_uri, auth=(self.user, self.password))
-                    self.driver.verify_connectivity()
+                    self.driver = get_driver(fallback_uri, self.user, self.password, **self.driver_config)
                     print("✅ Connected with fallback!\n")
                 except Exception as inner_e:
                     self._connection_error(inner_e)
@@ -74,41 +233,66 @@ class Neo4jUploader:
 
     def close(self):
         if self.driver:
-            self.driver.close()
+            close_driver(self.driver)
             print("🔌 Connection closed.\n")
 
     def clear_database(self):
         """⚠️ Clear entire database"""
         print("⚠️ Clearing database...")
-        with self.driver.session() as session:
+        with self.driver.session(**SESSION_CONFIG) as session:
             session.run("MATCH (n) DETACH DELETE n")
         print("✅ Database cleared.\n")
 
-    def create_indexes(self):
-        """Create indexes for performance"""
+    def create_indexes(self, session):
+        """Create indexes for performance (one transaction, then wait for them)"""
         print("📇 Creating indexes...")
-        with self.driver.session() as session:
-            # Using proper uppercase labels
-            indexes = [
-                "CREATE INDEX node_id IF NOT EXISTS FOR (n:NODE) ON (n.id)",
-                "CREATE INDEX ip_id IF NOT EXISTS FOR (n:IP) ON (n.id)",
-                "CREATE INDEX process_id IF NOT EXISTS FOR (n:PROCESS) ON (n.id)",
-                "CREATE INDEX service_id IF NOT EXISTS FOR (n:SERVICE) ON (n.id)",
-                "CREATE INDEX risk_score IF NOT EXISTS FOR (n:NODE) ON (n.risk_score)",
-                "CREATE INDEX anomaly IF NOT EXISTS FOR (n:NODE) ON (n.is_anomaly)",
-                "CREATE INDEX node_number IF NOT EXISTS FOR (n:NODE) ON (n.node_number)"
-            ]
-            
+        # Using proper uppercase labels; IF NOT EXISTS keeps these idempotent.
+        # IP/PROCESS/SERVICE ids get the same uniqueness constraints as
+        # GraphBuilder (their backing indexes serve the MERGEs); a plain index
+        # on the same label/property would make those constraints fail.
+        indexes = [
+            "CREATE INDEX node_id IF NOT EXISTS FOR (n:NODE) ON (n.id)",
+            "CREATE CONSTRAINT ip_id_unique IF NOT EXISTS FOR (n:IP) REQUIRE n.id IS UNIQUE",
+            "CREATE CONSTRAINT process_id_unique IF NOT EXISTS FOR (n:PROCESS) REQUIRE n.id IS UNIQUE",
+            "CREATE CONSTRAINT service_id_unique IF NOT EXISTS FOR (n:SERVICE) REQUIRE n.id IS UNIQUE",
+            "CREATE INDEX risk_score IF NOT EXISTS FOR (n:NODE) ON (n.risk_score)",
+            "CREATE INDEX anomaly IF NOT EXISTS FOR (n:NODE) ON (n.is_anomaly)",
+            "CREATE INDEX node_number IF NOT EXISTS FOR (n:NODE) ON (n.node_number)"
+        ]
+
+        # Plain id indexes left by earlier versions block those constraints
+        with session.begin_transaction() as tx:
+            for name in LEGACY_ID_INDEXES:
+                tx.run(f"DROP INDEX {name} IF EXISTS")
+            tx.commit()
+
+        with session.begin_transaction() as tx:
             for idx_query in indexes:
-                try:
-                    session.run(idx_query)
-                except Exception:
-                    pass  # Already exists
-            
+                tx.run(idx_query)
+            tx.commit()
+
+        # Make sure the indexes are online before the bulk load uses them
+        session.run("CALL db.awaitIndexes()").consume()
+
         print("✅ Indexes created.\n")
 
+    def warm_up(self, session):
+        """
+        Touch the schema and every id index once so the first MERGE batches
+        don't pay for a cold page cache (Community has no prewarm procedure).
+        """
+        queries = ["SHOW INDEXES YIELD name RETURN count(*) AS n"] + [
+            f"MATCH (n:{label}) WHERE n.id IS NOT NULL RETURN count(n) AS n"
+            for label in NODE_LABELS
+        ]
+        elapsed = 0
+        for query in queries:
+            summary = session.run(query).consume()
+            elapsed += summary.result_available_after or 0
+        print(f"🔥 Page cache warmed ({elapsed} ms)\n")
+
     def normalize_label(self, label):
-        """Convert label to proper Neo4j convention (UPPERCASE)"""
+        """Convert label to proper Neo4j convention (UPPERCASE), one of NODE_LABELS"""
         label_map = {
             "Ip": "IP",
             "Process": "PROCESS",
@@ -116,205 +300,410 @@ class Neo4jUploader:
             "Node": "NODE",
             "Unknown": "NODE"
         }
-        return label_map.get(label, label.upper())
+        label = label_map.get(label, label.upper())
+        return label if label in NODE_LABELS else "NODE"
+
+    def _node_text_params(self, node):
+        """Non-numeric node properties (categorical strings are interned)"""
+        return {
+            "id": node.get("id"),
+            "name": node.get("id"),  # Use ID as name for display
+            "type": _intern(node.get("type")),
+            "description": node.get("description"),
+            "cloud_platform": _intern(node.get("cloud_platform")),
+            "category": _intern(node.get("category")),
+            "categorization_method": _intern(node.get("categorization_method")),
+            "categorization_reasoning": node.get("categorization_reasoning"),
+            "cve_ids": node.get("cve_ids", []),
+            "anomaly_confidence": _intern(node.get("anomaly_confidence", "none")),
+            "anomaly_threat_type": _intern(node.get("anomaly_threat_type", "none")),
+            "anomaly_reason": node.get("anomaly_reason", "N/A"),
+            "anomaly_severity": _intern(node.get("anomaly_severity", "none")),
+            "last_seen": node.get("last_seen"),
+            "color": _intern(node.get("color", "#888")),
+        }
 
-    def upload_nodes(self, nodes):
-        """Upload nodes with ALL properties"""
-        if not nodes:
+    def _node_params(self, node):
+        """Coerce a results.json node into Cypher parameters (row-wise)"""
+        params = self._node_text_params(node)
+        for field, cast, _, default in NODE_NUMERIC_FIELDS:
+            params[field] = cast(node.get(field, default))
+        return params
+
+    def _node_columns(self, nodes):
+        """
+        Coerce the numeric fields of a list of nodes column-wise.
+
+        Each field is built with np.fromiter and converted back with tolist(),
+        so the casts run in C instead of once per row; a column with a value
+        numpy can't convert falls back to the plain Python cast. numpy turns
+        None into NaN where float()/int() reject it, so such columns take the
+        Python path too (and raise there, as before).
+        """
+        columns = {}
+        for field, cast, dtype, default in NODE_NUMERIC_FIELDS:
+            values = [node.get(field, default) for node in nodes]
+            try:
+                if cast is not bool and None in values:
+                    raise TypeError(f"{field} contains None")
+                columns[field] = np.fromiter(values, dtype=dtype, count=len(values)).tolist()
+            except (ValueError, TypeError, OverflowError):
+                columns[field] = [cast(v) for v in values]
+        return columns
+
+    def upload_nodes(self, session, nodes):
+        """
+        Upload nodes with ALL properties (accepts any iterable, incl. a stream).
+
+        Nodes are bucketed by label and written with one UNWIND ... MERGE per
+        label per BATCH_SIZE chunk; each chunk commits once (with the driver's
+        retry on transient errors) instead of once per row. The label buckets
+        of a chunk are written concurrently from UPLOAD_WORKERS sessions. An
+        id already sent earlier in this upload is skipped (first occurrence wins).
+        """
+        print("📤 Uploading nodes...")
+
+        # The id -> label map doubles as an exact "seen" set for this upload
+        self._node_labels = {}
+        total = 0
+        duplicates = 0
+        pool = ThreadPoolExecutor(max_workers=UPLOAD_WORKERS) if UPLOAD_WORKERS > 1 else None
+        progress = tqdm(desc="   Nodes", unit="node", mininterval=0.5)
+        try:
+            for chunk in _chunks(nodes, BATCH_SIZE):
+                fresh = []
+                for node in chunk:
+                    node_id = node.get("id")
+                    if node_id in self._node_labels:
+                        duplicates += 1
+                        continue
+                    label = self.normalize_label(node.get("labels", ["NODE"])[0])
+                    self._node_labels[node_id] = label
+                    fresh.append((node_id, label, node))
+
+                columns = self._node_columns([node for _, _, node in fresh])
+                rows_by_label = defaultdict(list)
+                for i, (node_id, label, node) in enumerate(fresh):
+                    props = self._node_text_params(node)
+                    del props["id"]
+                    for field, values in columns.items():
+                        props[field] = values[i]
+                    rows_by_label[label].append({"id": node_id, "props": props})
+
+                if pool:
+                    # Wait per chunk so at most one chunk of rows is in flight
+                    futures = [
+                        pool.submit(self._write_label_rows, label, rows)
+                        for label, rows in rows_by_label.items()
+                    ]
+                    for future in futures:
+                        future.result()
+                else:
+                    for label, rows in rows_by_label.items():
+                        session.execute_write(_write_chunk, NODE_CYPHERS[label], rows)
+
+                total += len(chunk)
+                progress.update(len(chunk))
+                logger.info("uploaded %d nodes (%d duplicates skipped)", total, duplicates)
+        finally:
+            progress.close()
+            if pool:
+                pool.shutdown()
+
+        if total == 0:
             print("⚠️ No nodes to upload.")
-            return
+            return 0
 
-        print(f"📤 Uploading {len(nodes)} nodes...")
-        
-        with self.driver.session() as session:
-            for i, node in enumerate(nodes, 1):
-                # Get and normalize label
-                raw_labels = node.get("labels", ["NODE"])
-                label = self.normalize_label(raw_labels[0])
-                
-                # Extract CVE IDs
-                cve_ids = node.get("cve_ids", [])
-                
-                # Comprehensive property mapping
-                query = f"""
-                MERGE (n:{label} {{id: $id}})
-                SET n.node_number = $node_number,
-                    n.name = $name,
-                    n.type = $type,
-                    n.description = $description,
-                    n.cloud_platform = $cloud_platform,
-                    n.category = $category,
-                    n.categorization_method = $categorization_method,
-                    n.categorization_reasoning = $categorization_reasoning,
-                    n.risk_score = $risk_score,
-                    n.cve_risk = $cve_risk,
-                    n.behavioral_risk = $behavioral_risk,
-                    n.cve_ids = $cve_ids,
-                    n.cve_count = $cve_count,
-                    n.has_critical_cve = $has_critical_cve,
-                    n.has_high_cve = $has_high_cve,
-                    n.is_anomaly = $is_anomaly,
-                    n.is_detected_anomaly = $is_detected_anomaly,
-                    n.is_confirmed_anomaly = $is_confirmed_anomaly,
-                    n.anomaly_probability = $anomaly_probability,
-                    n.anomaly_confidence = $anomaly_confidence,
-                    n.anomaly_threat_type = $anomaly_threat_type,
-                    n.anomaly_reason = $anomaly_reason,
-                    n.anomaly_severity = $anomaly_severity,
-                    n.enhanced_anomaly_score = $enhanced_anomaly_score,
-                    n.gnn_predicted_label = $gnn_predicted_label,
-                    n.gnn_actual_label = $gnn_actual_label,
-                    n.last_seen = $last_seen,
-                    n.color = $color,
-                    n.size = $size,
-                    n.group = $group
-                RETURN n.id as id
-                """
-
-                session.run(
-                    query,
-                    id=node.get("id"),
-                    node_number=int(node.get("node_number", 0)),
-                    name=node.get("id"),  # Use ID as name for display
-                    type=node.get("type"),
-                    description=node.get("description"),
-                    cloud_platform=node.get("cloud_platform"),
-                    category=node.get("category"),
-                    categorization_method=node.get("categorization_method"),
-                    categorization_reasoning=node.get("categorization_reasoning"),
-                    risk_score=float(node.get("risk_score", 0)),
-                    cve_risk=float(node.get("cve_risk", 0)),
-                    behavioral_risk=float(node.get("behavioral_risk", 0)),
-                    cve_ids=cve_ids,
-                    cve_count=int(node.get("cve_count", 0)),
-                    has_critical_cve=bool(node.get("has_critical_cve", False)),
-                    has_high_cve=bool(node.get("has_high_cve", False)),
-                    is_anomaly=bool(node.get("is_anomaly", False)),
-                    is_detected_anomaly=bool(node.get("is_detected_anomaly", False)),
-                    is_confirmed_anomaly=bool(node.get("is_confirmed_anomaly", False)),
-                    anomaly_probability=float(node.get("anomaly_probability", 0)),
-                    anomaly_confidence=node.get("anomaly_confidence", "none"),
-                    anomaly_threat_type=node.get("anomaly_threat_type", "none"),
-                    anomaly_reason=node.get("anomaly_reason", "N/A"),
-                    anomaly_severity=node.get("anomaly_severity", "none"),
-                    enhanced_anomaly_score=float(node.get("enhanced_anomaly_score", 0)),
-                    gnn_predicted_label=int(node.get("gnn_predicted_label", 0)),
-                    gnn_actual_label=int(node.get("gnn_actual_label", 0)),
-                    last_seen=node.get("last_seen"),
-                    color=node.get("color", "#888"),
-                    size=float(node.get("size", 10)),
-                    group=int(node.get("group", 0))
-                )
-
-                if i % 50 == 0 or i == len(nodes):
-                    print(f"   Uploaded {i}/{len(nodes)} nodes...")
-
-        print(f"✅ All {len(nodes)} nodes uploaded.\n")
-
-    def upload_relationships(self, relationships):
-        """Upload relationships"""
-        if not relationships:
-            print("⚠️ No relationships to upload.")
-            return
+        if duplicates:
+            print(f"ℹ️ Skipped {duplicates} duplicate node ids")
+        print(f"✅ All {total} nodes uploaded.\n")
+        return total
 
-        print(f"🔗 Uploading {len(relationships)} relationships...")
-        
-        query = """
-        MATCH (a {id: $source})
-        MATCH (b {id: $target})
-        MERGE (a)-[r:CONNECTED_TO]->(b)
-        SET r.id = $rel_id,
-            r.type = $type,
-            r.connection_type = $connection_type,
-            r.weight = $weight,
-            r.count = $count
-        RETURN r
+    def _write_label_rows(self, label, rows):
+        """Worker: write one label's rows from its own session (sessions aren't thread-safe)"""
+        with self.driver.session(**SESSION_CONFIG) as session:
+            return session.execute_write(_write_chunk, NODE_CYPHERS[label], rows)
+
+    def upload_relationships(self, session, relationships):
         """
+        Upload relationships (accepts any iterable, incl. a stream).
 
-        with self.driver.session() as session:
-            successful = 0
-            failed = 0
-            
-            for i, rel in enumerate(relationships, 1):
+        Each BATCH_SIZE chunk is grouped by the labels of its endpoints (known
+        from upload_nodes) and written with one UNWIND per label pair, so both
+        MATCHes are index seeks on :LABEL(id) rather than full scans.
+        """
+        print("🔗 Uploading relationships...")
+
+        successful = 0
+        failed = 0
+        errors = 0
+        progress = tqdm(desc="   Relationships", unit="rel", mininterval=0.5)
+        for batch, invalid in self._relationship_batches(relationships):
+            failed += invalid
+
+            rows_by_labels = defaultdict(list)
+            for row in batch.tolist():
+                rel = dict(zip(REL_CSV_COLUMNS, row))
+                key = (self._node_labels.get(rel["source"]), self._node_labels.get(rel["target"]))
+                rows_by_labels[key].append(rel)
+
+            for (source_label, target_label), rows in rows_by_labels.items():
                 try:
-                    result = session.run(
-                        query,
-                        rel_id=rel.get("id"),
-                        source=rel.get("source"),
-                        target=rel.get("target"),
-                        type=rel.get("type", "CONNECTION"),
-                        connection_type=rel.get("connection_type", "connection"),
-                        weight=float(rel.get("weight", 1.0)),
-                        count=int(rel.get("count", 1))
+                    created = session.execute_write(
+                        _write_chunk, REL_CYPHERS[(source_label, target_label)], rows
                     )
-                    
-                    if result.single():
-                        successful += 1
-                    else:
-                        failed += 1
-                    
-                except Exception as e:
-                    failed += 1
-                    if failed <= 5:  # Only print first 5 errors
-                        print(f"   ⚠️ Error on relationship {i}: {e}")
+                    successful += created
+                    failed += len(rows) - created  # endpoints not found
 
-                if i % 50 == 0 or i == len(relationships):
-                    print(f"   Processed {i}/{len(relationships)} relationships...")
+                except Exception as e:
+                    failed += len(rows)
+                    errors += 1
+                    if errors <= 5:  # Only print first 5 errors
+                        tqdm.write(f"   ⚠️ Error on relationship batch: {e}")
+            progress.update(len(batch) + invalid)
+            logger.info("uploaded %d relationships (%d failed)", successful, failed)
+        progress.close()
+
+        total = successful + failed
+        if total == 0:
+            print("⚠️ No relationships to upload.")
+            return 0
 
         print(f"✅ Relationships: {successful} successful, {failed} failed.\n")
+        return total
+
+    def _relationship_rows(self, rels):
+        """Raw (unconverted) row tuples in REL_DTYPE field order"""
+        return [
+            (
+                r.get("id"),
+                r.get("source"),
+                r.get("target"),
+                r.get("type", "CONNECTION"),
+                r.get("connection_type", "connection"),
+                r.get("weight", 1.0),
+                r.get("count", 1)
+            )
+            for r in rels
+        ]
 
-    def upload_metadata(self, metadata):
-        """Upload metadata as summary node"""
-        print("📋 Uploading metadata...")
-        
-        query = """
-        MERGE (m:METADATA {id: 'analysis_metadata'})
-        SET m.schema_version = $schema_version,
-            m.generated_at = $generated_at,
-            m.generated_at_ist = $generated_at_ist,
-            m.cloud_provider = $cloud_provider,
-            m.cloud_confidence = $cloud_confidence,
-            m.attack_type = $attack_type,
-            m.attack_confidence = $attack_confidence,
-            m.total_nodes = $total_nodes,
-            m.total_relationships = $total_relationships,
-            m.anomalies_detected = $anomalies_detected,
-            m.anomalies_confirmed = $anomalies_confirmed,
-            m.total_cves_found = $total_cves_found,
-            m.nodes_with_cves = $nodes_with_cves,
-            m.gnn_accuracy = $gnn_accuracy,
-            m.gnn_precision = $gnn_precision,
-            m.gnn_recall = $gnn_recall,
-            m.gnn_f1_score = $gnn_f1_score
-        RETURN m
+    def _relationship_batches(self, relationships):
         """
+        Yield (structured_array, invalid_count) per BATCH_SIZE relationships.
 
-        with self.driver.session() as session:
-            session.run(
-                query,
-                schema_version=metadata.get("schema_version"),
-                generated_at=metadata.get("generated_at"),
-                generated_at_ist=metadata.get("generated_at_ist"),
-                cloud_provider=metadata.get("cloud_platform", {}).get("provider"),
-                cloud_confidence=int(metadata.get("cloud_platform", {}).get("confidence", 0)),
-                attack_type=metadata.get("attack_summary", {}).get("type"),
-                attack_confidence=float(metadata.get("attack_summary", {}).get("confidence", 0)),
-                total_nodes=int(metadata.get("statistics", {}).get("total_nodes", 0)),
-                total_relationships=int(metadata.get("statistics", {}).get("total_relationships", 0)),
-                anomalies_detected=int(metadata.get("statistics", {}).get("anomalies_detected", 0)),
-                anomalies_confirmed=int(metadata.get("statistics", {}).get("anomalies_confirmed", 0)),
-                total_cves_found=int(metadata.get("cve_summary", {}).get("total_cves_found", 0)),
-                nodes_with_cves=int(metadata.get("cve_summary", {}).get("nodes_with_cves", 0)),
-                gnn_accuracy=float(metadata.get("gnn_performance", {}).get("accuracy", 0)),
-                gnn_precision=float(metadata.get("gnn_performance", {}).get("precision", 0)),
-                gnn_recall=float(metadata.get("gnn_performance", {}).get("recall", 0)),
-                gnn_f1_score=float(metadata.get("gnn_performance", {}).get("f1_score", 0))
+        weight/count are validated and coerced once per batch by numpy rather
+        than with float()/int() per row; a batch containing a bad value falls
+        back to row-wise float()/int() so only the offending rows are dropped.
+        numpy would store a None weight as NaN, so None sends a batch down
+        the row-wise path, where it is rejected.
+        """
+        for chunk in _chunks(relationships, BATCH_SIZE):
+            rows = self._relationship_rows(chunk)
+            try:
+                if any(row[5] is None for row in rows):
+                    raise TypeError("weight contains None")
+                batch = np.array(rows, dtype=REL_DTYPE)
+            except (ValueError, TypeError, OverflowError):
+                valid = []
+                for row in rows:
+                    try:
+                        row = row[:5] + (float(row[5]), int(row[6]))
+                        valid.append(np.array([row], dtype=REL_DTYPE))
+                    except (ValueError, TypeError, OverflowError):
+                        continue
+                batch = np.concatenate(valid) if valid else np.empty(0, dtype=REL_DTYPE)
+            yield batch, len(rows) - len(batch)
+
+    def _csv_value(self, value):
+        """Render a parameter value as a LOAD CSV cell"""
+        if value is None:
+            return ""
+        if isinstance(value, bool):
+            return "true" if value else "false"
+        if isinstance(value, list):
+            return ";".join(str(v) for v in value)
+        return value
+
+    def _node_csv_query(self, label, columns):
+        """Build the LOAD CSV statement for one node label file"""
+        assignments = []
+        for col in columns:
+            if col == "id":
+                continue
+            if col == "cve_ids":
+                expr = "CASE WHEN row.cve_ids IS NULL THEN [] ELSE split(row.cve_ids, ';') END"
+            elif col in NODE_CSV_CASTS:
+                expr = f"{NODE_CSV_CASTS[col]}(row.{col})"
+            else:
+                expr = f"row.{col}"
+            assignments.append(f"n.{col} = {expr}")
+
+        return f"""
+        LOAD CSV WITH HEADERS FROM $url AS row
+        CALL {{
+            WITH row
+            MERGE (n:`{label}` {{id: row.id}})
+            SET {", ".join(assignments)}
+        }} IN TRANSACTIONS OF {CSV_TX_ROWS} ROWS
+        """
+
+    def _relationship_csv_name(self, source_label, target_label):
+        """Staging file for one endpoint label pair"""
+        return f"relationships_{source_label.lower()}_{target_label.lower()}.csv"
+
+    def _relationship_csv_query(self, source_label, target_label):
+        """Build the LOAD CSV statement for one endpoint label pair file"""
+        return f"""
+        LOAD CSV WITH HEADERS FROM $url AS row
+        CALL {{
+            WITH row
+            MATCH (a:{source_label} {{id: row.source}})
+            MATCH (b:{target_label} {{id: row.target}})
+            MERGE (a)-[r:CONNECTED_TO]->(b)
+            SET r.id = row.id,
+                r.type = row.type,
+                r.connection_type = row.connection_type,
+                r.weight = toFloat(row.weight),
+                r.count = toInteger(row.count)
+        }} IN TRANSACTIONS OF {CSV_TX_ROWS} ROWS
+        """
+
+    def upload_bulk_csv(self, session, nodes, relationships, import_dir=None):
+        """
+        Cold-import path: stage nodes/relationships as CSV files in the
+        server's import/ directory and load them with LOAD CSV in large
+        server-side transactions instead of one Bolt round-trip per row.
+
+        Only usable when the Neo4j server can read import_dir (self-hosted).
+        Relationships are staged in one file per endpoint label pair so their
+        MATCHes are index seeks on :LABEL(id), as in upload_relationships. The
+        database is empty on a cold load, so a relationship whose endpoint
+        isn't among the staged nodes can't match and is skipped.
+        """
+        import_dir = import_dir or NEO4J_IMPORT_DIR
+        if not import_dir:
+            raise ValueError(
+                "Bulk CSV import needs the server's import directory: "
+                "set NEO4J_IMPORT_DIR in .env or pass import_dir"
             )
-        
+        import_dir = Path(import_dir)
+        import_dir.mkdir(parents=True, exist_ok=True)
+        print(f"📦 Staging CSV files in {import_dir}...")
+
+        # One CSV per label so each file maps to a single MERGE label
+        handles, writers, node_count = {}, {}, 0
+        self._node_labels = {}
+        try:
+            for node in nodes:
+                label = self.normalize_label(node.get("labels", ["NODE"])[0])
+                self._node_labels[node.get("id")] = label
+                params = self._node_params(node)
+                writer = writers.get(label)
+                if writer is None:
+                    f = open(import_dir / f"nodes_{label.lower()}.csv", "w", newline="", encoding="utf-8")
+                    handles[label] = f
+                    writer = writers[label] = csv.DictWriter(f, fieldnames=list(params))
+                    writer.writeheader()
+                writer.writerow({k: self._csv_value(v) for k, v in params.items()})
+                node_count += 1
+        finally:
+            for f in handles.values():
+                f.close()
+
+        rel_handles, rel_writers, rel_count, skipped = {}, {}, 0, 0
+        try:
+            for batch, _ in self._relationship_batches(relationships):
+                for row in batch.tolist():
+                    key = (self._node_labels.get(row[1]), self._node_labels.get(row[2]))
+                    if None in key:
+                        skipped += 1
+                        continue
+                    writer = rel_writers.get(key)
+                    if writer is None:
+                        f = open(import_dir / self._relationship_csv_name(*key), "w",
+                                 newline="", encoding="utf-8")
+                        rel_handles[key] = f
+                        writer = rel_writers[key] = csv.writer(f)
+                        writer.writerow(REL_CSV_COLUMNS)
+                    writer.writerow(row)
+                    rel_count += 1
+        finally:
+            for f in rel_handles.values():
+                f.close()
+
+        if skipped:
+            print(f"⚠️ Skipping {skipped} relationships with endpoints outside the node set")
+        print(f"📤 Loading {node_count} nodes and {rel_count} relationships via LOAD CSV...")
+        for label in writers:
+            columns = writers[label].fieldnames
+            session.run(
+                self._node_csv_query(label, columns),
+                url=f"file:///nodes_{label.lower()}.csv"
+            ).consume()
+
+        for source_label, target_label in rel_writers:
+            session.run(
+                self._relationship_csv_query(source_label, target_label),
+                url=f"file:///{self._relationship_csv_name(source_label, target_label)}"
+            ).consume()
+
+        print(f"✅ Bulk import complete: {node_count} nodes, {rel_count} relationships.\n")
+        return node_count, rel_count
+
+    def _metadata_params(self, metadata):
+        """Flatten the nested results.json metadata into one property map"""
+        cloud = metadata.get("cloud_platform", {})
+        attack = metadata.get("attack_summary", {})
+        stats = metadata.get("statistics", {})
+        cves = metadata.get("cve_summary", {})
+        gnn = metadata.get("gnn_performance", {})
+        return {
+            "schema_version": metadata.get("schema_version"),
+            "generated_at": metadata.get("generated_at"),
+            "generated_at_ist": metadata.get("generated_at_ist"),
+            "cloud_provider": cloud.get("provider"),
+            "cloud_confidence": int(cloud.get("confidence", 0)),
+            "attack_type": attack.get("type"),
+            "attack_confidence": float(attack.get("confidence", 0)),
+            "total_nodes": int(stats.get("total_nodes", 0)),
+            "total_relationships": int(stats.get("total_relationships", 0)),
+            "anomalies_detected": int(stats.get("anomalies_detected", 0)),
+            "anomalies_confirmed": int(stats.get("anomalies_confirmed", 0)),
+            "total_cves_found": int(cves.get("total_cves_found", 0)),
+            "nodes_with_cves": int(cves.get("nodes_with_cves", 0)),
+            "gnn_accuracy": float(gnn.get("accuracy", 0)),
+            "gnn_precision": float(gnn.get("precision", 0)),
+            "gnn_recall": float(gnn.get("recall", 0)),
+            "gnn_f1_score": float(gnn.get("f1_score", 0))
+        }
+
+    def upload_metadata(self, session, metadata):
+        """Upload metadata as summary node"""
+        print("📋 Uploading metadata...")
+
+        session.execute_write(
+            lambda tx: tx.run(METADATA_CYPHER, m=self._metadata_params(metadata)).consume()
+        )
+
         print("✅ Metadata uploaded.\n")
 
-    def upload_from_unified_json(self, json_file_path):
-        """Main upload pipeline"""
+    def _iter_items(self, file_path, key):
+        """
+        Yield the elements of a top-level JSON array one at a time.
+
+        The file is parsed incrementally, so memory stays bounded and the
+        upload starts before the whole file has been read.
+        """
+        with open(file_path, "rb") as f:
+            yield from ijson.items(f, f"{key}.item", use_float=True)
+
+    def _read_metadata(self, file_path):
+        """Read only the (small) metadata object from a results file"""
+        with open(file_path, "rb") as f:
+            return next(ijson.items(f, "metadata", use_float=True), {})
+
+    def upload_from_unified_json(self, json_file_path, is_cold_load=False):
+        """Main upload pipeline (is_cold_load=True uses the bulk LOAD CSV path)"""
         file_path = Path(json_file_path)
         if not file_path.is_absolute():
             file_path = BASE_DIR / json_file_path
@@ -325,35 +714,44 @@ class Neo4jUploader:
             return
 
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-
-            nodes = data.get("nodes", [])
-            relationships = data.get("relationships", [])
-            metadata = data.get("metadata", {})
-
-            print(f"\n📊 Data loaded:")
-            print(f"   Nodes: {len(nodes)}")
-            print(f"   Relationships: {len(relationships)}")
+            if HAS_IJSON:
+                metadata = self._read_metadata(file_path)
+                nodes = self._iter_items(file_path, "nodes")
+                relationships = self._iter_items(file_path, "relationships")
+            else:
+                with open(file_path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                nodes = data.get("nodes", [])
+                relationships = data.get("relationships", [])
+                metadata = data.get("metadata", {})
+
+            print(f"\n📊 Data source:")
+            print(f"   Streaming: {'yes (ijson)' if HAS_IJSON else 'no (json.load)'}")
             print(f"   Schema: {metadata.get('schema_version', 'unknown')}")
             print("\n🚀 Starting upload...\n")
 
-            self.create_indexes()
-            self.upload_nodes(nodes)
-            self.upload_relationships(relationships)
-            self.upload_metadata(metadata)
+            # One session for the whole pipeline instead of one per step
+            with self.driver.session(**SESSION_CONFIG) as session:
+                self.create_indexes(session)
+                self.warm_up(session)
+                if is_cold_load:
+                    node_count, rel_count = self.upload_bulk_csv(session, nodes, relationships)
+                else:
+                    node_count = self.upload_nodes(session, nodes)
+                    rel_count = self.upload_relationships(session, relationships)
+                self.upload_metadata(session, metadata)
 
             print("=" * 60)
             print("✅ UPLOAD COMPLETE")
             print("=" * 60)
             print(f"📊 Summary:")
-            print(f"   Nodes: {len(nodes)}")
-            print(f"   Relationships: {len(relationships)}")
+            print(f"   Nodes: {node_count}")
+            print(f"   Relationships: {rel_count}")
             print(f"   Cloud: {metadata.get('cloud_platform', {}).get('provider', 'unknown').upper()}")
             print(f"   CVEs: {metadata.get('cve_summary', {}).get('total_cves_found', 0)}")
             print("=" * 60)
 
-        except json.JSONDecodeError as e:
+        except JSON_ERRORS as e:
             print(f"❌ Invalid JSON: {e}")
         except Exception as e:
             print(f"❌ Upload failed: {e}")
@@ -370,7 +768,9 @@ if __name__ == "__main__":
         if clear == "yes":
             uploader.clear_database()
 
-        uploader.upload_from_unified_json("../data_store/results.json")
+        # An empty database on a self-hosted server can take the bulk CSV path
+        cold_load = clear == "yes" and bool(NEO4J_IMPORT_DIR)
+        uploader.upload_from_unified_json("../data_store/results.json", is_cold_load=cold_load)
 
     except KeyboardInterrupt:
         print("\n⚠️ Upload interrupted.")
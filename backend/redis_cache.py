@@ -5,10 +5,41 @@ Provides efficient caching with automatic expiration and memory management.
 """
 import os
 import json
+import orjson
 import redis
+import zstandard
 from datetime import datetime, timezone
 from typing import Optional, Dict, Any, List
 import hashlib
+import time
+
+# orjson (C, SIMD) serializes straight to bytes; tolerate non-str keys and
+# numpy values that end up in GNN results
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+# Payloads are zstd-compressed; the distinct prefix keeps them apart from
+# legacy uncompressed "results:<key>" entries
+RESULTS_PREFIX = "results:z:"
+
+# Sorted set of cached result keys scored by Unix cached_at time; the
+# authoritative listing so nothing has to run KEYS over the keyspace
+INDEX_KEY = "results:index"
+SCAN_COUNT = 500
+ZSTD_LEVEL = 3
+
+MEMORY_UNITS = {
+    "k": 1000, "kb": 1024,
+    "m": 1000 ** 2, "mb": 1024 ** 2,
+    "g": 1000 ** 3, "gb": 1024 ** 3,
+}
+
+
+def _memory_bytes(value: str) -> int:
+    """Convert a redis.conf memory size ("256mb", "1g", "1024") to bytes"""
+    value = str(value).strip().lower()
+    number = value.rstrip("kmgb")
+    unit = value[len(number):]
+    return int(number) * MEMORY_UNITS.get(unit, 1)
 
 
 class RedisCache:
@@ -20,9 +51,7 @@ class RedisCache:
         port: int = 6379,
         db: int = 0,
         password: Optional[str] = None,
-        default_ttl: int = 3600,  # 1 hour default
-        max_memory: str = "256mb",
-        eviction_policy: str = "allkeys-lru"
+        default_ttl: int = 3600  # 1 hour default
     ):
         """
         Initialize Redis cache connection
@@ -33,10 +62,12 @@ class RedisCache:
             db: Redis database number (0-15)
             password: Redis password if authentication is required
             default_ttl: Default time-to-live in seconds
-            max_memory: Maximum memory (e.g., "256mb", "1gb")
-            eviction_policy: Policy when max memory reached (allkeys-lru, volatile-lru, etc.)
+        
+        Server-wide memory settings are not touched here; see configure_server()
         """
         self.default_ttl = default_ttl
+        self._compressor = zstandard.ZstdCompressor(level=ZSTD_LEVEL)
+        self._decompressor = zstandard.ZstdDecompressor()
         
         try:
             self.redis_client = redis.Redis(
@@ -54,21 +85,53 @@ class RedisCache:
             # Test connection
             self.redis_client.ping()
             
-            # Configure memory settings
-            try:
-                self.redis_client.config_set("maxmemory", max_memory)
-                self.redis_client.config_set("maxmemory-policy", eviction_policy)
-            except redis.ResponseError:
-                print("⚠️ Unable to set memory config (requires admin privileges)")
-            
             print(f"✅ Redis cache initialized: {host}:{port} (DB: {db})")
-            print(f"   TTL: {default_ttl}s | Max Memory: {max_memory} | Policy: {eviction_policy}")
+            print(f"   TTL: {default_ttl}s")
             
         except redis.ConnectionError as e:
             print(f"❌ Redis connection failed: {e}")
             print("   Cache operations will be disabled")
             self.redis_client = None
     
+    def configure_server(
+        self,
+        max_memory: str = "256mb",
+        eviction_policy: str = "allkeys-lru"
+    ) -> bool:
+        """
+        Apply server-wide memory settings (opt-in; normally set in redis.conf)
+        
+        These are global to the Redis server, so call this once from a setup
+        step rather than from every worker. Values already in place are not
+        rewritten.
+        
+        Args:
+            max_memory: Maximum memory (e.g., "256mb", "1gb")
+            eviction_policy: Policy when max memory reached (allkeys-lru, volatile-lru, etc.)
+        
+        Returns:
+            True if the server has the requested settings, False otherwise
+        """
+        if not self.is_available():
+            return False
+        
+        try:
+            current = self.redis_client.config_get("maxmemory*")
+            current = {k.decode('utf-8'): v.decode('utf-8') for k, v in current.items()}
+            
+            if current.get("maxmemory-policy") != eviction_policy:
+                self.redis_client.config_set("maxmemory-policy", eviction_policy)
+            # CONFIG GET reports maxmemory in plain bytes
+            if current.get("maxmemory") != str(_memory_bytes(max_memory)):
+                self.redis_client.config_set("maxmemory", max_memory)
+            
+            print(f"⚙️ Redis memory config: Max Memory: {max_memory} | Policy: {eviction_policy}")
+            return True
+            
+        except redis.ResponseError:
+            print("⚠️ Unable to set memory config (requires admin privileges)")
+            return False
+    
     def is_available(self) -> bool:
         """Check if Redis is available"""
         if self.redis_client is None:
@@ -88,7 +151,7 @@ class RedisCache:
         ttl: Optional[int] = None
     ) -> bool:
         """
-        Cache results.json data with automatic expiration
+        Cache results.json data with automatic expiration (results_data is not modified)
         
         Args:
             results_data: Dictionary containing nodes, links, and metadata
@@ -102,49 +165,55 @@ class RedisCache:
             return False
         
         try:
+            # Serialize once with sorted keys: the same canonical bytes are
+            # both hashed for the cache key and stored as the payload
+            json_data = orjson.dumps(results_data, option=ORJSON_OPTIONS | orjson.OPT_SORT_KEYS)
+            
+            ttl_value = ttl if ttl is not None else self.default_ttl
+            
             # Generate cache key
             if key_suffix:
-                cache_key = f"results:{key_suffix}"
+                cache_key = f"{RESULTS_PREFIX}{key_suffix}"
             else:
                 # Use hash of results as key
-                results_hash = self._hash_dict(results_data)
-                cache_key = f"results:{results_hash[:16]}"
-            
-            # Add timestamp to metadata
-            if "metadata" not in results_data:
-                results_data["metadata"] = {}
-            results_data["metadata"]["cached_at"] = datetime.now(timezone.utc).isoformat()
-            
-            # Serialize to JSON
-            json_data = json.dumps(results_data, ensure_ascii=False)
-            
-            # Store in Redis with TTL
-            ttl_value = ttl if ttl is not None else self.default_ttl
-            self.redis_client.setex(
-                cache_key,
-                ttl_value,
-                json_data.encode('utf-8')
-            )
-            
-            # Store metadata separately for quick lookups
+                results_hash = hashlib.sha256(json_data).hexdigest()
+                cache_key = f"{RESULTS_PREFIX}{results_hash[:16]}"
+                
+                # Same hash = same content: if it is already cached just
+                # extend its TTL (EXPIRE doubles as the existence check)
+                # instead of compressing and re-sending the payload
+                if self.redis_client.expire(cache_key, ttl_value):
+                    pipe = self.redis_client.pipeline(transaction=False)
+                    pipe.expire(f"{cache_key}:meta", ttl_value)
+                    self._add_to_index(pipe, cache_key)
+                    pipe.execute()
+                    print(f"📦 Results already cached: {cache_key} (TTL refreshed: {ttl_value}s)")
+                    return True
+            
+            payload = self._compressor.compress(json_data)
+            
+            # Store metadata separately for quick lookups; cached_at lives only
+            # here so results_data is never mutated and identical graphs keep
+            # hashing to the same key
             metadata_key = f"{cache_key}:meta"
+            source_meta = results_data.get("metadata", {})
             metadata = {
-                "total_nodes": results_data.get("metadata", {}).get("analysis_summary", {}).get("total_nodes", 0),
-                "total_links": results_data.get("metadata", {}).get("analysis_summary", {}).get("total_links", 0),
-                "timestamp": results_data.get("metadata", {}).get("timestamp", "unknown"),
-                "cached_at": results_data["metadata"]["cached_at"],
-                "size_bytes": len(json_data)
+                "total_nodes": source_meta.get("analysis_summary", {}).get("total_nodes", 0),
+                "total_links": source_meta.get("analysis_summary", {}).get("total_links", 0),
+                "timestamp": source_meta.get("timestamp", "unknown"),
+                "cached_at": datetime.now(timezone.utc).isoformat(),
+                "size_bytes": len(payload),  # what Redis actually holds
+                "uncompressed_bytes": len(json_data)
             }
-            self.redis_client.setex(
-                metadata_key,
-                ttl_value,
-                json.dumps(metadata).encode('utf-8')
-            )
             
-            # Add to index for tracking all cached results
-            self._add_to_index(cache_key, ttl_value)
+            # Payload, metadata and index update in a single round trip
+            pipe = self.redis_client.pipeline(transaction=False)
+            pipe.setex(cache_key, ttl_value, payload)
+            pipe.setex(metadata_key, ttl_value, orjson.dumps(metadata))
+            self._add_to_index(pipe, cache_key)
+            pipe.execute()
             
-            print(f"📦 Cached results: {cache_key} ({len(json_data)} bytes, TTL: {ttl_value}s)")
+            print(f"📦 Cached results: {cache_key} ({len(payload)} bytes zstd, {len(json_data)} raw, TTL: {ttl_value}s)")
             return True
             
         except Exception as e:
@@ -172,7 +241,7 @@ class RedisCache:
         try:
             # Determine cache key
             if key_suffix:
-                cache_key = f"results:{key_suffix}"
+                cache_key = f"{RESULTS_PREFIX}{key_suffix}"
             else:
                 # Get latest result from index
                 cache_key = self._get_latest_from_index()
@@ -186,8 +255,8 @@ class RedisCache:
                 print(f"❌ Cache miss: {cache_key}")
                 return None
             
-            # Decode and parse JSON
-            results = json.loads(cached_data.decode('utf-8'))
+            # Decompress and parse JSON
+            results = orjson.loads(self._decompressor.decompress(cached_data))
             
             # Extend TTL if requested
             if extend_ttl:
@@ -213,32 +282,43 @@ class RedisCache:
             return []
         
         try:
-            # Get all result keys
-            pattern = "results:*"
-            keys = self.redis_client.keys(pattern)
+            # Newest first from the index; SCAN only if the index is missing
+            indexed = self.redis_client.zrevrange(INDEX_KEY, 0, -1)
+            if indexed:
+                result_keys = [k.decode('utf-8') for k in indexed]
+            else:
+                result_keys = self._scan_result_keys()
             
-            # Filter out metadata keys
-            result_keys = [k.decode('utf-8') for k in keys if not k.endswith(b':meta') and not k.endswith(b':index')]
+            if not result_keys:
+                return []
             
-            all_results = []
+            # Metadata and TTLs for every key in one round trip
+            pipe = self.redis_client.pipeline(transaction=False)
+            pipe.mget([f"{key}:meta" for key in result_keys])
             for key in result_keys:
+                pipe.ttl(key)
+            replies = pipe.execute()
+            meta_values, ttls = replies[0], replies[1:]
+            
+            all_results = []
+            stale_keys = []
+            for key, meta_data, ttl in zip(result_keys, meta_values, ttls):
+                if not meta_data:
+                    stale_keys.append(key)
+                    continue
                 try:
-                    # Get metadata
-                    meta_key = f"{key}:meta"
-                    meta_data = self.redis_client.get(meta_key)
-                    
-                    if meta_data:
-                        metadata = json.loads(meta_data.decode('utf-8'))
-                        ttl = self.redis_client.ttl(key)
-                        
-                        all_results.append({
-                            "cache_key": key,
-                            "metadata": metadata,
-                            "ttl_remaining": ttl
-                        })
-                except:
+                    all_results.append({
+                        "cache_key": key,
+                        "metadata": orjson.loads(meta_data),
+                        "ttl_remaining": ttl
+                    })
+                except orjson.JSONDecodeError:
                     continue
             
+            # Entries that expired on their own still sit in the index
+            if indexed and stale_keys:
+                self.redis_client.zrem(INDEX_KEY, *stale_keys)
+            
             return sorted(all_results, key=lambda x: x["metadata"].get("cached_at", ""), reverse=True)
             
         except Exception as e:
@@ -261,30 +341,12 @@ class RedisCache:
             return 0
         
         try:
-            deleted_count = 0
-            current_time = datetime.now(timezone.utc)
-            
-            # Get all cached results
-            all_results = self.get_all_cached_results()
-            
-            for result in all_results:
-                try:
-                    cached_at_str = result["metadata"].get("cached_at")
-                    if not cached_at_str:
-                        continue
-                    
-                    cached_at = datetime.fromisoformat(cached_at_str.replace('Z', '+00:00'))
-                    age = (current_time - cached_at).total_seconds()
-                    
-                    if age > max_age_seconds:
-                        cache_key = result["cache_key"]
-                        self._delete_result(cache_key)
-                        deleted_count += 1
-                        
-                except Exception as e:
-                    print(f"⚠️ Error processing result for flush: {e}")
-                    continue
+            # Index scores are cached_at timestamps, so this is a range query
+            cutoff = time.time() - max_age_seconds
+            old_keys = self.redis_client.zrangebyscore(INDEX_KEY, "-inf", f"({cutoff}")
+            self._delete_results([k.decode('utf-8') for k in old_keys])
             
+            deleted_count = len(old_keys)
             if deleted_count > 0:
                 print(f"🧹 Flushed {deleted_count} old results (age > {max_age_seconds}s)")
             
@@ -308,7 +370,8 @@ class RedisCache:
             return 0
         
         try:
-            keys = self.redis_client.keys(pattern)
+            # Incremental SCAN instead of a blocking KEYS
+            keys = list(self.redis_client.scan_iter(match=pattern, count=SCAN_COUNT))
             
             if not keys:
                 print(f"ℹ️ No keys found matching pattern: {pattern}")
@@ -357,26 +420,17 @@ class RedisCache:
             return 0
         
         try:
-            all_results = self.get_all_cached_results()
+            total = self.redis_client.zcard(INDEX_KEY)
             
-            if len(all_results) <= max_entries:
-                print(f"ℹ️ Cache size OK ({len(all_results)}/{max_entries})")
+            if total <= max_entries:
+                print(f"ℹ️ Cache size OK ({total}/{max_entries})")
                 return 0
             
-            # Sort by cached_at timestamp (newest first)
-            sorted_results = sorted(
-                all_results,
-                key=lambda x: x["metadata"].get("cached_at", ""),
-                reverse=True
-            )
-            
-            # Delete oldest entries
-            deleted_count = 0
-            for result in sorted_results[max_entries:]:
-                cache_key = result["cache_key"]
-                self._delete_result(cache_key)
-                deleted_count += 1
+            # Index is ordered by cached_at: everything past the newest N goes
+            oldest = self.redis_client.zrevrange(INDEX_KEY, max_entries, -1)
+            self._delete_results([k.decode('utf-8') for k in oldest])
             
+            deleted_count = len(oldest)
             print(f"🧹 Flushed {deleted_count} oldest entries (keeping {max_entries} most recent)")
             return deleted_count
             
@@ -429,41 +483,41 @@ class RedisCache:
     
     # ==================== HELPER METHODS ====================
     
-    def _hash_dict(self, data: Dict[str, Any]) -> str:
-        """Generate hash of dictionary for cache key"""
-        json_str = json.dumps(data, sort_keys=True)
-        return hashlib.sha256(json_str.encode()).hexdigest()
+    def _add_to_index(self, pipe, cache_key: str):
+        """Queue adding key to the index (scored by Unix cached_at time) on a pipeline"""
+        pipe.zadd(INDEX_KEY, {cache_key: time.time()})
+        # The index never expires: a short-TTL write must not drop longer-lived
+        # members. Expired entries are pruned on read and by the flush helpers.
+        pipe.persist(INDEX_KEY)
     
-    def _add_to_index(self, cache_key: str, ttl: int):
-        """Add key to index for tracking"""
-        try:
-            index_key = "results:index"
-            timestamp = datetime.now(timezone.utc).isoformat()
-            self.redis_client.zadd(index_key, {cache_key: timestamp})
-            self.redis_client.expire(index_key, ttl + 3600)  # Index lives longer
-        except:
-            pass
+    def _scan_result_keys(self) -> List[str]:
+        """Fallback listing via SCAN when the index is missing"""
+        keys = []
+        for k in self.redis_client.scan_iter(match="results:*", count=SCAN_COUNT):
+            if k.endswith(b':meta') or k == INDEX_KEY.encode('utf-8'):
+                continue
+            keys.append(k.decode('utf-8'))
+        return keys
     
     def _get_latest_from_index(self) -> Optional[str]:
         """Get latest result key from index"""
         try:
-            index_key = "results:index"
-            latest = self.redis_client.zrange(index_key, -1, -1)
+            latest = self.redis_client.zrange(INDEX_KEY, -1, -1)
             if latest:
                 return latest[0].decode('utf-8')
         except:
             pass
         return None
     
-    def _delete_result(self, cache_key: str):
-        """Delete result and associated metadata"""
+    def _delete_results(self, cache_keys: List[str]):
+        """Delete results, their metadata and index entries, SCAN_COUNT keys per round trip"""
         try:
-            self.redis_client.delete(cache_key)
-            self.redis_client.delete(f"{cache_key}:meta")
-            
-            # Remove from index
-            index_key = "results:index"
-            self.redis_client.zrem(index_key, cache_key)
+            for start in range(0, len(cache_keys), SCAN_COUNT):
+                batch = cache_keys[start:start + SCAN_COUNT]
+                pipe = self.redis_client.pipeline(transaction=False)
+                pipe.delete(*batch, *(f"{key}:meta" for key in batch))
+                pipe.zrem(INDEX_KEY, *batch)
+                pipe.execute()
         except:
             pass
     
@@ -492,8 +546,7 @@ if __name__ == "__main__":
     cache = RedisCache(
         host="localhost",
         port=6379,
-        default_ttl=3600,
-        max_memory="256mb"
+        default_ttl=3600
     )
     
     # Example results data
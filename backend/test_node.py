@@ -1,71 +1,254 @@
+import mmap
+import os
 import re
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import product
+
+# Optional: Hyperscan matches every pattern in one SIMD pass over the buffer
+try:
+    import hyperscan
+    HAS_HYPERSCAN = True
+except ImportError:
+    HAS_HYPERSCAN = False
 
 # Path to your log file
 path = r"D:\Final Year Project\LLM_Final_Year\LLM_final_year\multi-cloud-gnn\backend\sample_data\security_logs.log"
 
 # --- Regex patterns ---
-ip_pattern = re.compile(r'(?:\d{1,3}\.){3}\d{1,3}')
-host_pattern = re.compile(r'host\.name=([\w\.-]+)')
-user_pattern = re.compile(r'user(?:\.name)?=([\w\.-]+)', re.IGNORECASE)
-cve_pattern = re.compile(r'CVE-\d{4}-\d+', re.IGNORECASE)
-
-# --- Counters and containers ---
-total = parsed = bad = 0
-nodes = set()
-edges = set()
-
-with open(path, encoding="utf-8", errors="ignore") as f:
-    for line in f:
-        total += 1
-
-        # Check for parseable UDM-type fields
-        if re.search(r'(source\.ip|destination\.ip|host\.name)=', line):
-            parsed += 1
-
-            # Extract potential entities (nodes)
-            ips = ip_pattern.findall(line)
-            hosts = host_pattern.findall(line)
-            users = user_pattern.findall(line)
-            cves = cve_pattern.findall(line)
-
-            # Add them as nodes
-            for ip in ips:
-                nodes.add(("ip", ip))
-            for h in hosts:
-                nodes.add(("host", h))
-            for u in users:
-                nodes.add(("user", u))
-            for c in cves:
-                nodes.add(("cve", c))
-
-            # --- Create potential edges ---
-            # Simple heuristics:
-            # 1. If source and destination IPs exist, link them.
-            # 2. If a host and CVE occur, link host→CVE.
-            # 3. If user and host/IP appear, link user→host/IP.
-            if "source.ip=" in line and "destination.ip=" in line:
-                src = re.search(r'source\.ip=(\S+)', line)
-                dst = re.search(r'destination\.ip=(\S+)', line)
-                if src and dst:
-                    edges.add(("ip:"+src.group(1), "ip:"+dst.group(1), "network_flow"))
-
-            if hosts and cves:
-                for h in hosts:
-                    for c in cves:
-                        edges.add(("host:"+h, "cve:"+c, "vulnerability"))
-
-            if users:
-                for u in users:
-                    for ip in ips:
-                        edges.add(("user:"+u, "ip:"+ip, "activity"))
-                    for h in hosts:
-                        edges.add(("user:"+u, "host:"+h, "login"))
-        else:
-            bad += 1
-
-# --- Results ---
-print(f"Total lines: {total}")
-print(f"Parsable lines (have ip/host): {parsed}")
-print(f"Skipped lines: {bad}")
-print(f"Unique nodes (estimated): {len(nodes)}")
-print(f"Estimated edges (post-UDM+preprocessing+NVD/CVE): {len(edges)}")
\ No newline at end of file
+# One bytes alternation with a named group per entity kind, run once over the
+# whole memory-mapped file. The key=value kinds capture their value in a
+# lookahead and only consume the "key=" prefix, so an IP inside a value is still
+# picked up by the ip branch. The empty lookahead alternative still reports a
+# bare UDM key (e.g. "host.name=" with no value) so the line counts as parsed.
+# IPs and CVE ids are tethered to their surroundings so digit runs such as
+# "1234.5.6.78" or "10.0.0.1.5" don't yield partial matches.
+entity_pattern = re.compile(
+    rb'(?P<ip>(?<![\d.])(?:\d{1,3}\.){3}\d{1,3}(?!\.?\d))'
+    rb'|(?P<host_key>host\.name=)(?=(?P<host>[\w\.-]+)|)'
+    rb'|(?i:user(?:\.name)?=)(?=(?P<user>[\w\.-]+))'
+    rb'|(?P<cve>(?<![A-Za-z])(?i:CVE-\d{4}-\d+))'
+    rb'|(?P<src_key>source\.ip=)(?=(?P<src>\S+)|)'
+    rb'|(?P<dst_key>destination\.ip=)(?=(?P<dst>\S+)|)'
+)
+
+# The same extraction as separate Hyperscan expressions: (kind, pattern, caseless).
+# Hyperscan has no capture groups, so key=value kinds match the whole pair and
+# the value is whatever follows the first "="; "*" keeps bare keys reported.
+HS_PATTERNS = [
+    ("ip", rb'(?:\d{1,3}\.){3}\d{1,3}', False),
+    ("host", rb'host\.name=[\w\.-]*', False),
+    ("user", rb'user(?:\.name)?=[\w\.-]+', True),
+    ("cve", rb'CVE-\d{4}-\d+', True),
+    ("src", rb'source\.ip=\S*', False),
+    ("dst", rb'destination\.ip=\S*', False),
+]
+KEY_KINDS = {"host", "user", "src", "dst"}
+DIGITS = frozenset(b"0123456789")
+LETTERS = frozenset(b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz")
+
+# Files larger than this are split on line boundaries and parsed in parallel
+PARSE_CHUNK = 16 << 20
+
+# Line breaks as in text-mode iteration / bytes.splitlines(): \r\n, \n or a lone \r
+EOL = re.compile(rb'\r\n?|\n')
+
+# Groups that mean the line has a parseable UDM-type field
+UDM_KINDS = {"host", "host_key", "src", "src_key", "dst", "dst_key"}
+
+def add_line(found, nodes, edges):
+    """Turn one line's extracted entities into nodes and edges"""
+    ips, hosts, users, cves = found["ip"], found["host"], found["user"], found["cve"]
+
+    # Add them as nodes, keyed "kind:value" like the edge endpoints
+    nodes.update("ip:" + ip for ip in ips)
+    nodes.update("host:" + h for h in hosts)
+    nodes.update("user:" + u for u in users)
+    nodes.update("cve:" + c for c in cves)
+
+    # --- Create potential edges ---
+    # Simple heuristics:
+    # 1. If source and destination IPs exist, link them.
+    # 2. If a host and CVE occur, link host→CVE.
+    # 3. If user and host/IP appear, link user→host/IP.
+    if found["src"] and found["dst"]:
+        edges.add(("ip:"+found["src"][0], "ip:"+found["dst"][0], "network_flow"))
+
+    # Dedupe within the line first so the cross products stay small
+    hosts, cves, users, ips = set(hosts), set(cves), set(users), set(ips)
+
+    edges.update(("host:"+h, "cve:"+c, "vulnerability") for h, c in product(hosts, cves))
+    edges.update(("user:"+u, "ip:"+ip, "activity") for u, ip in product(users, ips))
+    edges.update(("user:"+u, "host:"+h, "login") for u, h in product(users, hosts))
+
+
+def regex_entities(buf):
+    """
+    Yield (start, kind, value) for every entity, in buffer order.
+
+    The key=value kinds only consume their key, so a match can land inside an
+    earlier value of the same kind (e.g. "user=user.name=bob"). Each kind's
+    key+value span is treated as consumed, as findall() and the Hyperscan path
+    do, so nested keys aren't reported twice.
+    """
+    last_end = {}
+    for m in entity_pattern.finditer(buf):
+        kind = m.lastgroup
+        base = kind[:-4] if kind.endswith("_key") else kind
+        start = m.start()
+        if start < last_end.get(base, -1):
+            continue
+        last_end[base] = m.end(kind) if m.start(kind) >= 0 else m.end()
+        yield start, kind, m.group(kind)
+
+
+def is_tethered(buf, kind, start, end):
+    """Hyperscan has no lookarounds: apply entity_pattern's IP/CVE boundaries"""
+    before = buf[start - 1] if start > 0 else None
+    if kind == "ip":
+        after = bytes(buf[end:end + 2])
+        if before in DIGITS or before == ord("."):
+            return False
+        if after[:1] == b".":
+            after = after[1:]
+        return not (after and after[0] in DIGITS)
+    if kind == "cve":
+        return before not in LETTERS
+    return True
+
+
+def hyperscan_entities(buf):
+    """
+    Yield (start, kind, value) like regex_entities, using Hyperscan.
+
+    Hyperscan reports every end offset of every match; keeping the longest
+    match per start and dropping overlaps per kind gives back findall()'s
+    leftmost, greedy, non-overlapping results.
+    """
+    db = hyperscan.Database()
+    db.compile(
+        expressions=[pattern for _, pattern, _ in HS_PATTERNS],
+        ids=list(range(len(HS_PATTERNS))),
+        flags=[hyperscan.HS_FLAG_SOM_LEFTMOST | (hyperscan.HS_FLAG_CASELESS if caseless else 0)
+               for _, _, caseless in HS_PATTERNS],
+    )
+    ends = defaultdict(dict)  # pattern id -> {start: longest end}
+
+    def on_match(pattern_id, start, end, flags, context):
+        spans = ends[pattern_id]
+        if end > spans.get(start, -1):
+            spans[start] = end
+
+    if len(buf):
+        db.scan(buf, match_event_handler=on_match)
+
+    hits = []
+    for pattern_id, spans in ends.items():
+        kind = HS_PATTERNS[pattern_id][0]
+        last_end = -1
+        for start in sorted(spans):
+            if start < last_end or not is_tethered(buf, kind, start, spans[start]):
+                continue
+            last_end = spans[start]
+            text = buf[start:last_end]
+            if kind in KEY_KINDS:
+                text = text[text.index(b"=") + 1:]
+                if not text:
+                    hits.append((start, kind + "_key", None))
+                    continue
+            hits.append((start, kind, text))
+    hits.sort(key=lambda hit: hit[0])
+    return hits
+
+
+def new_line():
+    return {"ip": [], "host": [], "user": [], "cve": [], "src": [], "dst": []}
+
+
+def parse_chunk(task):
+    """
+    Parse the lines in [start, end) of the log (worker entry point).
+
+    Returns (total lines, parsable lines, nodes, edges) for the chunk.
+    """
+    path, start, end = task
+    with open(path, "rb") as f:
+        f.seek(start)
+        buf = f.read(end - start)
+
+    nodes, edges = set(), set()
+    # Lines end at \n, \r\n or a lone \r; only the file's last chunk can end
+    # with an unterminated line
+    breaks = buf.count(b"\n") + buf.count(b"\r") - buf.count(b"\r\n")
+    total = breaks + (len(buf) > 0 and not buf.endswith((b"\n", b"\r")))
+    parsed = 0
+
+    # Scan the whole buffer once; matches arrive in order, so a line's entities
+    # are complete as soon as a match lands past that line's newline
+    found, is_udm, line_end = new_line(), False, -1
+    entities = hyperscan_entities(buf) if HAS_HYPERSCAN else regex_entities(buf)
+    for start, kind, value in entities:
+        if start > line_end:
+            if is_udm:
+                parsed += 1
+                add_line(found, nodes, edges)
+            found, is_udm = new_line(), False
+            eol = EOL.search(buf, start)
+            line_end = eol.start() if eol else len(buf)
+
+        if kind in UDM_KINDS:
+            is_udm = True
+        if kind in found:
+            found[kind].append(value.decode("utf-8", "ignore"))
+
+    if is_udm:
+        parsed += 1
+        add_line(found, nodes, edges)
+
+    return total, parsed, nodes, edges
+
+
+def chunk_bounds(path, chunk_size=PARSE_CHUNK):
+    """Split the file into (path, start, end) tasks of ~chunk_size ending on a newline"""
+    size = os.path.getsize(path)
+    if size <= chunk_size:
+        return [(path, 0, size)] if size else []
+
+    bounds = []
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        start = 0
+        while start < size:
+            end = min(start + chunk_size, size)
+            if end < size:
+                # Cut after the last newline in the window (or the next one
+                # if a single line is longer than the window)
+                newline = mm.rfind(b"\n", start, end)
+                if newline == -1:
+                    newline = mm.find(b"\n", end)
+                end = size if newline == -1 else newline + 1
+            bounds.append((path, start, end))
+            start = end
+    return bounds
+
+
+if __name__ == "__main__":
+    tasks = chunk_bounds(path)
+    if len(tasks) > 1:
+        # Separate processes sidestep the GIL for the regex-bound parse
+        with ProcessPoolExecutor() as pool:
+            results = list(pool.map(parse_chunk, tasks))
+    else:
+        results = [parse_chunk(task) for task in tasks]
+
+    total = sum(r[0] for r in results)
+    parsed = sum(r[1] for r in results)
+    bad = total - parsed
+    nodes = set().union(*(r[2] for r in results))
+    edges = set().union(*(r[3] for r in results))
+
+    # --- Results ---
+    print(f"Total lines: {total}")
+    print(f"Parsable lines (have ip/host): {parsed}")
+    print(f"Skipped lines: {bad}")
+    print(f"Unique nodes (estimated): {len(nodes)}")
+    print(f"Estimated edges (post-UDM+preprocessing+NVD/CVE): {len(edges)}")
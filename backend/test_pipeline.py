@@ -15,6 +15,7 @@ Run this while your backend (app.py) is running.
 
 import os
 import json
+import orjson
 import requests
 from dotenv import load_dotenv
 from datetime import datetime
@@ -33,12 +34,29 @@ DATA_STORE_PATH = os.getenv(
     "D:/College/Final Year Project/Trinetra-GNN/backend/data_store"
 )
 
+# One keep-alive session for every call to the backend (reuses the TCP connection)
+SESSION = requests.Session()
+
 # Test response folder
 TEST_RESPONSE_FOLDER = os.path.join(
     os.path.dirname(os.path.abspath(__file__)),
     "test_response"
 )
 
+def parse_json(raw):
+    """Parse JSON bytes with orjson, falling back to json for NaN/Infinity (which orjson rejects)"""
+    try:
+        return orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        return json.loads(raw)
+
+def stat_or_none(path):
+    """os.stat() the path, or None if it is missing/unreadable (one syscall for exists + size)"""
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
 def ensure_test_response_folder():
     """Create test_response folder if it doesn't exist"""
     if not os.path.exists(TEST_RESPONSE_FOLDER):
@@ -61,7 +79,7 @@ def check_backend_alive():
     """Ping the backend root URL to confirm it's running."""
     print("[1/6] 🔍 Checking backend connectivity...")
     try:
-        r = requests.get(BACKEND_URL, timeout=5)
+        r = SESSION.get(BACKEND_URL, timeout=5)
         print(f"✅ Backend is reachable at {BACKEND_URL} (Status: {r.status_code})")
         return True
     except requests.exceptions.ConnectionError:
@@ -78,19 +96,20 @@ def check_backend_alive():
 def check_log_file():
     """Verify log file exists and is readable"""
     print("\n[2/6] 📄 Checking log file...")
-    if not os.path.exists(LOG_FILE_PATH):
+    st = stat_or_none(LOG_FILE_PATH)
+    if st is None:
         print(f"❌ Log file not found: {LOG_FILE_PATH}")
         return False
 
-    file_size = os.path.getsize(LOG_FILE_PATH) / 1024  # KB
+    file_size = st.st_size / 1024  # KB
     print(f"✅ Log file found: {LOG_FILE_PATH}")
     print(f"   Size: {file_size:.2f} KB")
 
-    # Show first few lines
+    # Show a short preview (read only what is printed, whatever the line length)
     try:
-        with open(LOG_FILE_PATH, "r", errors="ignore") as f:
-            first_lines = [f.readline() for _ in range(3)]
-        print(f"   Preview: {first_lines[0][:60]}...")
+        with open(LOG_FILE_PATH, "rb") as f:
+            preview = f.read(60).decode("utf-8", "ignore").split("\n", 1)[0]
+        print(f"   Preview: {preview}...")
     except Exception as e:
         print(f"⚠️  Could not read file: {e}")
         return False
@@ -106,14 +125,14 @@ def test_ingest_file():
 
     try:
         start_time = datetime.now()
-        r = requests.post(url, timeout=300)  # Increased timeout for LLM processing
+        r = SESSION.post(url, timeout=300)  # Increased timeout for LLM processing
         elapsed = (datetime.now() - start_time).total_seconds()
 
         print(f"✅ Request completed in {elapsed:.2f} seconds")
         print(f"   Status Code: {r.status_code}")
 
         if r.status_code == 200:
-            return analyze_response(r.json())
+            return analyze_response(parse_json(r.content))
         else:
             print(f"❌ Request failed with status {r.status_code}")
             print(f"   Response: {r.text[:500]}")
@@ -136,27 +155,32 @@ def test_ingest_text():
     print("\n[3/6] 🚀 Testing /ingest_text endpoint...")
     url = f"{BACKEND_URL}/ingest_text"
 
-    if not os.path.exists(LOG_FILE_PATH):
+    st = stat_or_none(LOG_FILE_PATH)
+    if st is None:
         print(f"❌ Log file not found: {LOG_FILE_PATH}")
         return None
 
-    print(f"   Reading logs from: {LOG_FILE_PATH}")
-    with open(LOG_FILE_PATH, "r", errors="ignore") as f:
-        logs = f.read()
-
-    print(f"   Sending {len(logs)} characters of logs")
-    payload = {"logs": logs}
+    print(f"   Streaming logs from: {LOG_FILE_PATH}")
+    print(f"   Sending {st.st_size} bytes of logs")
 
     try:
         start_time = datetime.now()
-        r = requests.post(url, json=payload, timeout=120)
+        # Stream the file as a text/plain body instead of reading it into
+        # memory and JSON-escaping it into a second copy
+        with open(LOG_FILE_PATH, "rb") as f:
+            r = SESSION.post(
+                url,
+                data=f,
+                headers={"Content-Type": "text/plain; charset=utf-8"},
+                timeout=120
+            )
         elapsed = (datetime.now() - start_time).total_seconds()
 
         print(f"✅ Request completed in {elapsed:.2f} seconds")
         print(f"   Status Code: {r.status_code}")
 
         if r.status_code == 200:
-            return analyze_response(r.json())
+            return analyze_response(parse_json(r.content))
         else:
             print(f"❌ Request failed with status {r.status_code}")
             print(f"   Response: {r.text[:500]}")
@@ -269,22 +293,24 @@ def verify_output_files(response_data):
 
     # Check report file
     report_path = response_data.get("report_path")
-    if report_path and os.path.exists(report_path):
-        size = os.path.getsize(report_path) / 1024
+    st = stat_or_none(report_path) if report_path else None
+    if st is not None:
+        size = st.st_size / 1024
         print(f"✅ Report file exists: {report_path} ({size:.2f} KB)")
     else:
         print(f"❌ Report file not found: {report_path}")
 
     # Check D3 results file
     d3_path = response_data.get("d3_results_path")
-    if d3_path and os.path.exists(d3_path):
-        size = os.path.getsize(d3_path) / 1024
+    st = stat_or_none(d3_path) if d3_path else None
+    if st is not None:
+        size = st.st_size / 1024
         print(f"✅ D3.js file exists: {d3_path} ({size:.2f} KB)")
 
         # Validate D3 structure
         try:
-            with open(d3_path, 'r') as f:
-                d3_data = json.load(f)
+            with open(d3_path, 'rb') as f:
+                d3_data = parse_json(f.read())
 
             nodes = d3_data.get("nodes", [])
             links = d3_data.get("links", [])
@@ -321,8 +347,8 @@ def save_test_response(response_data):
         output_file = os.path.join(folder, f"test_response_{timestamp}.json")
         
         # Save full response
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(response_data, f, indent=2, ensure_ascii=False)
+        with open(output_file, 'wb') as f:
+            f.write(orjson.dumps(response_data, option=orjson.OPT_INDENT_2))
         
         file_size = os.path.getsize(output_file) / 1024
         print(f"✅ Test response saved to: {output_file}")
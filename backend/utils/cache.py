@@ -1,56 +1,49 @@
-# # 1st version simple in-memory cache with optional file persistence
-# import json
-# import os
-# from time import time
-
-# CACHE_FILE = "cache.json"
-
-# class SimpleCache:
-#     def __init__(self):
-#         self._data = {}
-#         if os.path.exists(CACHE_FILE):
-#             try:
-#                 with open(CACHE_FILE, "r") as f:
-#                     self._data = json.load(f)
-#             except Exception:
-#                 self._data = {}
-
-#     def get(self, key, default=None):
-#         return self._data.get(key, default)
-
-#     def set(self, key, value):
-#         self._data[key] = value
-#         with open(CACHE_FILE, "w") as f:
-#             json.dump(self._data, f)
-
-# cache = SimpleCache()
-
-# 2nd version more advanced cache with TTL support
 """
 Simple cache implementation with TTL support
 """
+import heapq
+import threading
 import time
+from collections import OrderedDict
 from typing import Any, Optional
 
+# Expiry deadlines use the monotonic clock so wall-clock jumps (NTP, DST)
+# can't expire entries early or keep them alive; bound once at import
+_monotonic = time.monotonic
+
 
 class SimpleCache:
-    """Simple in-memory cache with TTL support"""
+    """Simple in-memory cache with TTL support and LRU eviction (thread-safe)"""
     
-    def __init__(self):
-        self._cache = {}
-        self._expiry = {}
+    def __init__(self, maxsize: int = 4096):
+        """
+        Args:
+            maxsize: Maximum number of entries; the least recently used
+                entry is evicted beyond this
+        """
+        # key -> (value, monotonic deadline or None): one lookup per operation
+        self._store = OrderedDict()
+        # (deadline, key) min-heap so cleanup only visits entries that are due;
+        # entries left behind by overwrites/deletes/evictions are skipped when
+        # popped and dropped whenever the heap outgrows twice the store
+        self._deadlines = []
+        self._maxsize = maxsize
+        # Shared by concurrent request handlers; even get() reorders the LRU
+        self._lock = threading.Lock()
     
     def get(self, key: str) -> Optional[Any]:
         """Get value from cache, return None if expired or not found"""
-        if key in self._cache:
+        with self._lock:
+            entry = self._store.get(key)
+            if entry is None:
+                return None
+            value, expiry = entry
             # Check if expired
-            if key in self._expiry and time.time() > self._expiry[key]:
-                # Expired, remove it
-                del self._cache[key]
-                del self._expiry[key]
+            if expiry is not None and _monotonic() > expiry:
+                del self._store[key]
                 return None
-            return self._cache[key]
-        return None
+            self._store.move_to_end(key)
+            return value
     
     def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
         """
@@ -64,233 +57,54 @@ class SimpleCache:
         Returns:
             True on success
         """
-        self._cache[key] = value
+        deadline = _monotonic() + ttl if ttl is not None else None
+        with self._lock:
+            self._store[key] = (value, deadline)
+            self._store.move_to_end(key)
+            if deadline is not None:
+                heapq.heappush(self._deadlines, (deadline, key))
         
-        if ttl is not None:
-            self._expiry[key] = time.time() + ttl
-        elif key in self._expiry:
-            # Remove expiry if ttl is None
-            del self._expiry[key]
+            # Evict the least recently used entry once over capacity
+            if len(self._store) > self._maxsize:
+                self._store.popitem(last=False)
+            
+            if len(self._deadlines) > 2 * self._maxsize:
+                self._prune_deadlines()
         
         return True
     
+    def _prune_deadlines(self):
+        """Rebuild the deadline heap from live entries (caller holds the lock)"""
+        self._deadlines = [(deadline, key) for key, (_, deadline) in self._store.items()
+                           if deadline is not None]
+        heapq.heapify(self._deadlines)
+    
     def delete(self, key: str) -> bool:
         """Delete key from cache"""
-        if key in self._cache:
-            del self._cache[key]
-            if key in self._expiry:
-                del self._expiry[key]
-            return True
-        return False
+        with self._lock:
+            return self._store.pop(key, None) is not None
     
     def clear(self):
         """Clear all cache"""
-        self._cache.clear()
-        self._expiry.clear()
+        with self._lock:
+            self._store.clear()
+            self._deadlines.clear()
     
     def cleanup_expired(self):
         """Remove all expired entries (call periodically)"""
-        now = time.time()
-        expired_keys = [
-            key for key, expiry in self._expiry.items()
-            if now > expiry
-        ]
-        for key in expired_keys:
-            self.delete(key)
+        now = _monotonic()
+        removed = 0
+        with self._lock:
+            while self._deadlines and self._deadlines[0][0] < now:
+                deadline, key = heapq.heappop(self._deadlines)
+                entry = self._store.get(key)
+                # Only remove if this heap entry still matches the stored deadline
+                if entry is not None and entry[1] == deadline:
+                    del self._store[key]
+                    removed += 1
         
-        return len(expired_keys)
+        return removed
 
 
 # Global cache instance
 cache = SimpleCache()
-
-
-# """
-# Cache wrapper that supports both Redis and SimpleCache
-# with unified TTL interface
-# """
-
-# import time
-# from typing import Any, Optional
-
-# try:
-#     import redis
-#     REDIS_AVAILABLE = True
-# except ImportError:
-#     REDIS_AVAILABLE = False
-
-
-# class SimpleCacheWithTTL:
-#     """
-#     Simple in-memory cache with TTL support
-#     Compatible with the cve_scorer.py requirements
-#     """
-#     def __init__(self):
-#         self._cache = {}
-#         self._expiry = {}
-    
-#     def get(self, key: str) -> Optional[Any]:
-#         """Get value from cache, return None if expired or not found"""
-#         if key in self._cache:
-#             # Check if expired
-#             if key in self._expiry and time.time() > self._expiry[key]:
-#                 # Expired, remove it
-#                 del self._cache[key]
-#                 del self._expiry[key]
-#                 return None
-#             return self._cache[key]
-#         return None
-    
-#     def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
-#         """
-#         Set value in cache with optional TTL (time-to-live in seconds)
-        
-#         Args:
-#             key: Cache key
-#             value: Value to cache
-#             ttl: Time to live in seconds (None = never expires)
-        
-#         Returns:
-#             True on success
-#         """
-#         self._cache[key] = value
-        
-#         if ttl is not None:
-#             self._expiry[key] = time.time() + ttl
-#         elif key in self._expiry:
-#             # Remove expiry if ttl is None
-#             del self._expiry[key]
-        
-#         return True
-    
-#     def delete(self, key: str) -> bool:
-#         """Delete key from cache"""
-#         if key in self._cache:
-#             del self._cache[key]
-#             if key in self._expiry:
-#                 del self._expiry[key]
-#             return True
-#         return False
-    
-#     def clear(self):
-#         """Clear all cache"""
-#         self._cache.clear()
-#         self._expiry.clear()
-    
-#     def cleanup_expired(self):
-#         """Remove all expired entries"""
-#         now = time.time()
-#         expired_keys = [
-#             key for key, expiry in self._expiry.items()
-#             if now > expiry
-#         ]
-#         for key in expired_keys:
-#             self.delete(key)
-
-
-# class RedisCacheWithTTL:
-#     """
-#     Redis cache wrapper with TTL support
-#     """
-#     def __init__(self, host='localhost', port=6379, db=0):
-#         self.redis_client = redis.Redis(
-#             host=host,
-#             port=port,
-#             db=db,
-#             decode_responses=True
-#         )
-    
-#     def get(self, key: str) -> Optional[Any]:
-#         """Get value from Redis cache"""
-#         import json
-#         value = self.redis_client.get(key)
-#         if value is not None:
-#             try:
-#                 return json.loads(value)
-#             except json.JSONDecodeError:
-#                 return value
-#         return None
-    
-#     def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
-#         """
-#         Set value in Redis cache with optional TTL
-        
-#         Args:
-#             key: Cache key
-#             value: Value to cache
-#             ttl: Time to live in seconds (None = never expires)
-        
-#         Returns:
-#             True on success
-#         """
-#         import json
-        
-#         # Serialize value
-#         if not isinstance(value, str):
-#             value = json.dumps(value)
-        
-#         if ttl is not None:
-#             return self.redis_client.setex(key, ttl, value)
-#         else:
-#             return self.redis_client.set(key, value)
-    
-#     def delete(self, key: str) -> bool:
-#         """Delete key from Redis cache"""
-#         return bool(self.redis_client.delete(key))
-    
-#     def clear(self):
-#         """Clear all Redis cache (be careful!)"""
-#         self.redis_client.flushdb()
-
-
-# # Initialize cache based on availability
-# def get_cache():
-#     """
-#     Get cache instance - tries Redis first, falls back to SimpleCache
-#     """
-#     import os
-    
-#     if REDIS_AVAILABLE:
-#         try:
-#             redis_host = os.getenv('REDIS_HOST', 'localhost')
-#             redis_port = int(os.getenv('REDIS_PORT', 6379))
-            
-#             cache_instance = RedisCacheWithTTL(host=redis_host, port=redis_port)
-            
-#             # Test connection
-#             cache_instance.redis_client.ping()
-            
-#             print("✅ Using Redis cache")
-#             return cache_instance
-#         except Exception as e:
-#             print(f"⚠️  Redis not available ({e}), using SimpleCache")
-    
-#     print("✅ Using SimpleCache (in-memory)")
-#     return SimpleCacheWithTTL()
-
-
-# # Global cache instance
-# cache = get_cache()
-
-
-# # Backward compatibility with old SimpleCache interface
-# class SimpleCache:
-#     """
-#     Wrapper for backward compatibility
-#     Redirects all calls to the global cache instance
-#     """
-#     @staticmethod
-#     def get(key: str) -> Optional[Any]:
-#         return cache.get(key)
-    
-#     @staticmethod
-#     def set(key: str, value: Any, ttl: Optional[int] = None) -> bool:
-#         return cache.set(key, value, ttl=ttl)
-    
-#     @staticmethod
-#     def delete(key: str) -> bool:
-#         return cache.delete(key)
-    
-#     @staticmethod
-#     def clear():
-#         return cache.clear()
@@ -1,21 +1,146 @@
 # small helper to persist training examples and analysis reports
-import json
+import atexit
+import mmap
 import os
-from datetime import datetime
+import queue
+import threading
+import time
+from concurrent.futures import Future
+import msgpack
+import numpy as np
+import orjson
 
 DATA_DIR = "data_store"
 os.makedirs(DATA_DIR, exist_ok=True)
 
-def save_report(report: dict, name=None):
-    ts = datetime.utcnow().strftime("%Y%m%dT%H%M%SZ")
+# Training examples are length-prefixed MessagePack records: a 4-byte
+# little-endian payload size followed by the packed example
+TRAINING_EXAMPLES_FILE = "training_examples.msgpack"
+
+# Writes are serialized by the caller (so later mutations of the dict don't
+# leak in) and handed to a background thread as (path, data, mode, future)
+_write_queue = queue.Queue()
+# Failed writes since the last flush(), re-raised there
+_write_errors = []
+
+
+class _WriterThread(threading.Thread):
+    """Performs queued writes off the request path, batching whatever is pending"""
+
+    def __init__(self):
+        super().__init__(name="data-store-writer", daemon=True)
+        # Append targets stay open between batches instead of reopening per line
+        self._handles = {}
+
+    def run(self):
+        while True:
+            batch = [_write_queue.get()]
+            while True:
+                try:
+                    batch.append(_write_queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            for path, data, mode, future in batch:
+                try:
+                    if mode == "ab":
+                        handle = self._handles.get(path)
+                        if handle is None:
+                            handle = self._handles[path] = open(path, "ab", buffering=64 * 1024)
+                        handle.write(data)
+                    else:
+                        with open(path, "wb") as f:
+                            f.write(data)
+                except OSError as e:
+                    print(f"❌ Failed to write {path}: {e}")
+                    if future is not None:
+                        future.set_exception(e)
+                    else:
+                        _write_errors.append(e)
+                    continue
+                if future is not None:
+                    future.set_result(path)
+
+            for handle in self._handles.values():
+                handle.flush()
+            for _ in batch:
+                _write_queue.task_done()
+
+    def close(self):
+        """Close the append handles (only call once the queue is drained)"""
+        for handle in self._handles.values():
+            handle.close()
+        self._handles.clear()
+
+
+_writer = _WriterThread()
+_writer.start()
+
+
+def flush():
+    """Block until every queued write has reached its file; raise the first failure"""
+    _write_queue.join()
+    if _write_errors:
+        error = _write_errors[0]
+        _write_errors.clear()
+        raise error
+
+
+@atexit.register
+def _close():
+    _write_queue.join()
+    _writer.close()
+
+
+def save_report(report: dict, name=None, wait=False):
+    """
+    Serialize a report and queue it for writing; returns the file path.
+
+    The file is written on the background thread, so it may not exist yet
+    when this returns. Pass wait=True to block until it does (a failed
+    write raises OSError here), or call flush() later.
+    """
+    ts = time.strftime("%Y%m%dT%H%M%SZ", time.gmtime())
     fname = name or f"report_{ts}.json"
     path = os.path.join(DATA_DIR, fname)
-    with open(path, "w") as f:
-        json.dump(report, f, indent=2)
+    # Non-str keys (e.g. node ids) are stringified, as json.dump did
+    data = orjson.dumps(report, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+                        | orjson.OPT_NON_STR_KEYS)
+    # A waiting caller gets the failure directly; otherwise flush() raises it
+    future = Future() if wait else None
+    _write_queue.put((path, data, "wb", future))
+    if future is not None:
+        future.result()
     return path
 
+def _msgpack_default(obj):
+    # numpy values that show up in examples (scores, feature vectors)
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    raise TypeError(f"Cannot serialize {type(obj).__name__}")
+
 def append_training_example(example: dict):
-    path = os.path.join(DATA_DIR, "training_examples.jsonl")
-    with open(path, "a") as f:
-        f.write(json.dumps(example) + "\n")
+    path = os.path.join(DATA_DIR, TRAINING_EXAMPLES_FILE)
+    payload = msgpack.packb(example, use_bin_type=True, default=_msgpack_default)
+    _write_queue.put((path, len(payload).to_bytes(4, "little") + payload, "ab", None))
     return path
+
+def iter_training_examples(path=None):
+    """Yield the examples written by append_training_example, in order"""
+    path = path or os.path.join(DATA_DIR, TRAINING_EXAMPLES_FILE)
+    flush()
+    if not os.path.exists(path) or os.path.getsize(path) == 0:
+        return
+
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        pos, size = 0, len(mm)
+        while pos + 4 <= size:
+            length = int.from_bytes(mm[pos:pos + 4], "little")
+            pos += 4
+            if pos + length > size:
+                # Torn final record from an interrupted write
+                break
+            yield msgpack.unpackb(mm[pos:pos + length], raw=False)
+            pos += length
@@ -9,10 +9,12 @@ import sys
 import os
 import time
 import signal
-import psutil
-from pathlib import Path
-from threading import Thread
-import platform
+import errno
+import socket
+import selectors
+import shutil
+from threading import Thread, Lock
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Color codes for terminal output
 class Colors:
@@ -36,29 +38,34 @@ class Config:
     MASTER_PORT = 8080  # Master orchestrator port
     
     # Paths (relative to trigger.py location)
-    BASE_DIR = Path(__file__).parent.resolve()
-    FLASK_DIR = BASE_DIR / "backend"
-    NODE_DIR = BASE_DIR / "server"
-    VITE_DIR = BASE_DIR / "frontend" / "vite-project"
-    GNN_DIR = BASE_DIR / "backend" / "demo_gnn"
+    BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+    FLASK_DIR = os.path.join(BASE_DIR, "backend")
+    NODE_DIR = os.path.join(BASE_DIR, "server")
+    VITE_DIR = os.path.join(BASE_DIR, "frontend", "vite-project")
+    GNN_DIR = os.path.join(BASE_DIR, "backend", "demo_gnn")
     
     # Files
-    FLASK_APP = FLASK_DIR / "app.py"
-    GNN_DEMO = GNN_DIR / "demo_api.py"
-    NODE_SCRIPT = NODE_DIR / "server.js"
+    FLASK_APP = os.path.join(FLASK_DIR, "app.py")
+    GNN_DEMO = os.path.join(GNN_DIR, "demo_api.py")
+    NODE_SCRIPT = os.path.join(NODE_DIR, "server.js")
     
-    # Startup delays (seconds)
-    FLASK_DELAY = 2
-    NODE_DELAY = 3
-    VITE_DELAY = 4
-    GNN_DELAY = 2
+    # Executables, resolved once so commands run without an intermediate shell
+    NODE = shutil.which("node")
+    NPM = shutil.which("npm") or shutil.which("npm.cmd")
+    
+    # Startup readiness (seconds)
+    READY_TIMEOUT = 30
+    READY_POLL_INTERVAL = 0.05
+
+# Environment shared by the Python services, built once
+_BASE_ENV = {**os.environ, 'PYTHONIOENCODING': 'utf-8'}  # Fix Unicode encoding issues
 
-# Global process list
+# Global process list (services are launched from worker threads)
 processes = []
+processes_lock = Lock()
 
-def print_banner():
-    """Print startup banner"""
-    banner = f"""
+# Built once at import: every interpolated value is a constant
+_BANNER = f"""
 {Colors.OKCYAN}{'='*60}
    _____ _____ ______ _   _   _____ _______ 
   / ____|  __ \|  ____| \ | | / ____|__   __|
@@ -71,40 +78,98 @@ def print_banner():
     Quantum Violet Edition
 {'='*60}{Colors.ENDC}
 """
-    print(banner)
+
+def print_banner():
+    """Print startup banner"""
+    print(_BANNER)
+
+# Per-level "<color>[" heads and "] [LEVEL] " tags, encoded once
+_LEVEL_COLORS = {
+    "INFO": Colors.OKBLUE,
+    "SUCCESS": Colors.OKGREEN,
+    "WARNING": Colors.WARNING,
+    "ERROR": Colors.FAIL,
+    "HEADER": Colors.HEADER
+}
+_LEVEL_PREFIX = {level: (color + "[").encode() for level, color in _LEVEL_COLORS.items()}
+_LOG_SUFFIX = (Colors.ENDC + "\n").encode()
 
 def log(message, level="INFO"):
     """Formatted logging"""
-    colors = {
-        "INFO": Colors.OKBLUE,
-        "SUCCESS": Colors.OKGREEN,
-        "WARNING": Colors.WARNING,
-        "ERROR": Colors.FAIL,
-        "HEADER": Colors.HEADER
-    }
-    color = colors.get(level, Colors.ENDC)
-    timestamp = time.strftime("%H:%M:%S")
-    print(f"{color}[{timestamp}] [{level}] {message}{Colors.ENDC}")
+    head = _LEVEL_PREFIX.get(level) or (Colors.ENDC + "[").encode()
+    timestamp = time.strftime("%H:%M:%S").encode()
+    # One buffer write per line keeps lines whole across threads
+    out = sys.stdout.buffer
+    out.write(head + timestamp + b"] [" + level.encode() + b"] "
+              + str(message).encode("utf-8", "replace") + _LOG_SUFFIX)
+    out.flush()
+
+_ADDR_IN_USE = {errno.EADDRINUSE, errno.EACCES, getattr(errno, 'WSAEACCES', None)}
+
+def _bind_probe(family, host, port):
+    """Try to bind host:port; return the OSError if it fails, else None"""
+    try:
+        with socket.socket(family, socket.SOCK_STREAM) as s:
+            if hasattr(socket, 'SO_EXCLUSIVEADDRUSE'):
+                # Windows lets a SO_REUSEADDR (or even plain) bind share a port
+                # another socket is listening on; exclusive use makes it fail
+                s.setsockopt(socket.SOL_SOCKET, socket.SO_EXCLUSIVEADDRUSE, 1)
+            else:
+                # POSIX still refuses a listening port, but skips TIME_WAIT
+                s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            s.bind((host, port))
+        return None
+    except OSError as e:
+        return e
 
 def check_port_available(port):
     """Check if a port is available"""
-    for conn in psutil.net_connections():
-        if conn.laddr.port == port and conn.status == 'LISTEN':
+    # Bind probes are O(1) kernel work, unlike walking the whole connection
+    # table. Probe both loopbacks: "localhost" servers (e.g. Vite on Node 17+)
+    # often listen on ::1 only.
+    if _bind_probe(socket.AF_INET, '127.0.0.1', port) is not None:
+        return False
+    if socket.has_ipv6:
+        error = _bind_probe(socket.AF_INET6, '::1', port)
+        # Hosts without IPv6 fail with other errors; only "in use" counts
+        if error is not None and error.errno in _ADDR_IN_USE:
             return False
     return True
 
+# port -> set of listener PIDs, built from a single connection-table scan
+_listening_pids = None
+_listening_pids_lock = Lock()
+
+def _get_listening_pids():
+    """Scan listening TCP/UDP sockets once and cache the port -> PIDs map"""
+    import psutil  # Only needed once a port is actually taken
+    
+    global _listening_pids
+    with _listening_pids_lock:
+        if _listening_pids is None:
+            pids = {}
+            for conn in psutil.net_connections(kind='inet'):
+                if conn.status == psutil.CONN_LISTEN and conn.pid:
+                    pids.setdefault(conn.laddr.port, set()).add(conn.pid)
+            _listening_pids = pids
+    return _listening_pids
+
 def kill_process_on_port(port):
     """Kill any process running on the specified port"""
+    if check_port_available(port):
+        return
+    
+    import psutil
+    
     try:
-        for conn in psutil.net_connections():
-            if conn.laddr.port == port and conn.status == 'LISTEN':
-                try:
-                    process = psutil.Process(conn.pid)
-                    log(f"Killing process {conn.pid} on port {port}", "WARNING")
-                    process.terminate()
-                    process.wait(timeout=3)
-                except (psutil.NoSuchProcess, psutil.TimeoutExpired):
-                    pass
+        for pid in _get_listening_pids().pop(port, ()):
+            try:
+                process = psutil.Process(pid)
+                log(f"Killing process {pid} on port {port}", "WARNING")
+                process.terminate()
+                process.wait(timeout=3)
+            except (psutil.NoSuchProcess, psutil.TimeoutExpired):
+                pass
         time.sleep(1)
     except Exception as e:
         log(f"Error killing process on port {port}: {e}", "ERROR")
@@ -119,11 +184,10 @@ def check_dependencies():
     
     # Check Node.js
     try:
-        result = subprocess.run("node --version", 
+        result = subprocess.run([Config.NODE, "--version"],
                               capture_output=True, 
                               text=True, 
-                              timeout=5,
-                              shell=True)
+                              timeout=5)
         if result.returncode == 0:
             version = result.stdout.strip()
             log(f"✓ Node.js {version} found", "SUCCESS")
@@ -136,13 +200,17 @@ def check_dependencies():
         log("Please install Node.js from https://nodejs.org/", "ERROR")
         return False
     
-    # Check npm with shell=True (critical for Windows)
+    # Check npm (resolved to npm.cmd on Windows)
+    if not Config.NPM:
+        log("✗ npm not found", "ERROR")
+        log("Please reinstall Node.js from https://nodejs.org/", "ERROR")
+        return False
+    
     try:
-        result = subprocess.run("npm --version", 
+        result = subprocess.run([Config.NPM, "--version"],
                               capture_output=True, 
                               text=True, 
-                              timeout=5,
-                              shell=True)  # This is the key for Windows
+                              timeout=5)
         if result.returncode == 0:
             version = result.stdout.strip()
             log(f"✓ npm {version} found", "SUCCESS")
@@ -166,9 +234,11 @@ def check_directories():
         "Vite Frontend": Config.VITE_DIR
     }
     
+    found = {name: os.path.isdir(path) for name, path in directories.items()}
+    
     missing = []
     for name, path in directories.items():
-        if path.exists():
+        if found[name]:
             log(f"✓ {name} directory found", "SUCCESS")
         else:
             log(f"✗ {name} directory not found: {path}", "ERROR")
@@ -180,6 +250,28 @@ def check_directories():
     
     return True
 
+def _install_one(directory, name):
+    """Run npm install in one directory, returning True on success"""
+    log(f"Installing {name} dependencies...", "WARNING")
+    try:
+        subprocess.run(
+            [Config.NPM, "install"],
+            cwd=directory,
+            check=True,
+            capture_output=True,
+            timeout=300  # 5 minutes timeout
+        )
+        log(f"✓ {name} dependencies installed", "SUCCESS")
+        return True
+    except subprocess.CalledProcessError as e:
+        log(f"✗ Failed to install {name} dependencies", "ERROR")
+        error_msg = e.stderr.decode() if e.stderr else str(e)
+        log(f"Error: {error_msg}", "ERROR")
+        return False
+    except subprocess.TimeoutExpired:
+        log(f"✗ Installation timeout for {name}", "ERROR")
+        return False
+
 def install_npm_dependencies():
     """Install npm dependencies for Node and Vite if needed"""
     dirs_to_check = [
@@ -187,73 +279,51 @@ def install_npm_dependencies():
         (Config.VITE_DIR, "Vite Frontend")
     ]
     
-    for directory, name in dirs_to_check:
-        node_modules = directory / "node_modules"
-        if not node_modules.exists():
-            log(f"Installing {name} dependencies...", "WARNING")
-            try:
-                # Use shell=True for better compatibility
-                result = subprocess.run(
-                    "npm install",
-                    cwd=directory,
-                    check=True,
-                    capture_output=True,
-                    shell=True,
-                    timeout=300  # 5 minutes timeout
-                )
-                log(f"✓ {name} dependencies installed", "SUCCESS")
-            except subprocess.CalledProcessError as e:
-                log(f"✗ Failed to install {name} dependencies", "ERROR")
-                error_msg = e.stderr.decode() if e.stderr else str(e)
-                log(f"Error: {error_msg}", "ERROR")
-                return False
-            except subprocess.TimeoutExpired:
-                log(f"✗ Installation timeout for {name}", "ERROR")
-                return False
-    return True
+    missing = [(directory, name) for directory, name in dirs_to_check
+               if not os.path.isdir(os.path.join(directory, "node_modules"))]
+    if not missing:
+        return True
+    
+    # The installs are independent external processes, so threads just wait
+    with ThreadPoolExecutor(max_workers=len(missing)) as executor:
+        futures = [executor.submit(_install_one, directory, name)
+                   for directory, name in missing]
+        results = [future.result() for future in as_completed(futures)]
+    return all(results)
 
 def start_flask_backend():
     """Start Flask backend server"""
     log(f"Starting Flask Backend on port {Config.FLASK_PORT}...", "HEADER")
     
-    if not Config.FLASK_APP.exists():
+    if not os.path.isfile(Config.FLASK_APP):
         log(f"Flask app not found: {Config.FLASK_APP}", "ERROR")
         return None
     
     kill_process_on_port(Config.FLASK_PORT)
     
     try:
-        env = os.environ.copy()
-        env['FLASK_APP'] = str(Config.FLASK_APP)
-        env['FLASK_ENV'] = 'development'
-        env['FLASK_DEBUG'] = '1'
-        env['PYTHONIOENCODING'] = 'utf-8'  # Fix Unicode encoding issues
+        env = {
+            **_BASE_ENV,
+            'FLASK_APP': Config.FLASK_APP,
+            'FLASK_ENV': 'development',
+            'FLASK_DEBUG': '1'
+        }
         
         process = subprocess.Popen(
-            [sys.executable, str(Config.FLASK_APP)],
+            [sys.executable, Config.FLASK_APP],
             cwd=Config.FLASK_DIR,
             env=env,
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
-            universal_newlines=True,
-            bufsize=1,
-            encoding='utf-8',  # Explicitly set UTF-8 encoding
-            errors='replace'   # Replace problematic characters
+            start_new_session=True  # Own session; ignored on Windows
         )
         
-        processes.append(('Flask Backend', process))
+        with processes_lock:
+            processes.append(('Flask Backend', process))
         log(f"✓ Flask Backend started (PID: {process.pid})", "SUCCESS")
         
-        # Monitor output in a separate thread
-        def monitor_output():
-            try:
-                for line in process.stdout:
-                    if line.strip():
-                        print(f"{Colors.OKBLUE}[Flask] {line.strip()}{Colors.ENDC}")
-            except UnicodeDecodeError:
-                pass  # Ignore unicode errors in output
-        
-        Thread(target=monitor_output, daemon=True).start()
+        # Relay output through the shared pump
+        monitor_output(process, 'Flask', Colors.OKBLUE)
         return process
         
     except Exception as e:
@@ -264,41 +334,28 @@ def start_gnn_demo():
     """Start GNN Demo API"""
     log(f"Starting GNN Demo API on port {Config.GNN_PORT}...", "HEADER")
     
-    if not Config.GNN_DEMO.exists():
+    if not os.path.isfile(Config.GNN_DEMO):
         log(f"GNN Demo script not found: {Config.GNN_DEMO}", "ERROR")
         return None
     
     kill_process_on_port(Config.GNN_PORT)
     
     try:
-        env = os.environ.copy()
-        env['PYTHONIOENCODING'] = 'utf-8'  # Fix Unicode encoding issues
-        
         process = subprocess.Popen(
-            [sys.executable, str(Config.GNN_DEMO)],
+            [sys.executable, Config.GNN_DEMO],
             cwd=Config.FLASK_DIR,
-            env=env,
+            env=_BASE_ENV,
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
-            universal_newlines=True,
-            bufsize=1,
-            encoding='utf-8',  # Explicitly set UTF-8 encoding
-            errors='replace'   # Replace problematic characters
+            start_new_session=True  # Own session; ignored on Windows
         )
         
-        processes.append(('GNN Demo API', process))
+        with processes_lock:
+            processes.append(('GNN Demo API', process))
         log(f"✓ GNN Demo API started (PID: {process.pid})", "SUCCESS")
         
-        # Monitor output in a separate thread
-        def monitor_output():
-            try:
-                for line in process.stdout:
-                    if line.strip():
-                        print(f"{Colors.OKCYAN}[GNN] {line.strip()}{Colors.ENDC}")
-            except UnicodeDecodeError:
-                pass  # Ignore unicode errors in output
-        
-        Thread(target=monitor_output, daemon=True).start()
+        # Relay output through the shared pump
+        monitor_output(process, 'GNN', Colors.OKCYAN)
         return process
         
     except Exception as e:
@@ -312,32 +369,20 @@ def start_node_server():
     kill_process_on_port(Config.NODE_PORT)
     
     try:
-        # Use shell=True for better compatibility
         process = subprocess.Popen(
-            "npm run dev",
+            [Config.NPM, "run", "dev"],
             cwd=Config.NODE_DIR,
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
-            universal_newlines=True,
-            bufsize=1,
-            shell=True,
-            encoding='utf-8',
-            errors='replace'
+            start_new_session=True  # Own session; ignored on Windows
         )
         
-        processes.append(('Node Server', process))
+        with processes_lock:
+            processes.append(('Node Server', process))
         log(f"✓ Node Server started (PID: {process.pid})", "SUCCESS")
         
-        # Monitor output in a separate thread
-        def monitor_output():
-            try:
-                for line in process.stdout:
-                    if line.strip():
-                        print(f"{Colors.OKGREEN}[Node] {line.strip()}{Colors.ENDC}")
-            except UnicodeDecodeError:
-                pass
-        
-        Thread(target=monitor_output, daemon=True).start()
+        # Relay output through the shared pump
+        monitor_output(process, 'Node', Colors.OKGREEN)
         return process
         
     except Exception as e:
@@ -351,42 +396,136 @@ def start_vite_frontend():
     kill_process_on_port(Config.VITE_PORT)
     
     try:
-        # Use shell=True for better compatibility
         process = subprocess.Popen(
-            "npm run dev",
+            [Config.NPM, "run", "dev"],
             cwd=Config.VITE_DIR,
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
-            universal_newlines=True,
-            bufsize=1,
-            shell=True,
-            encoding='utf-8',
-            errors='replace'
+            start_new_session=True  # Own session; ignored on Windows
         )
         
-        processes.append(('Vite Frontend', process))
+        with processes_lock:
+            processes.append(('Vite Frontend', process))
         log(f"✓ Vite Frontend started (PID: {process.pid})", "SUCCESS")
         
-        # Monitor output in a separate thread
-        def monitor_output():
-            try:
-                for line in process.stdout:
-                    if line.strip():
-                        print(f"{Colors.WARNING}[Vite] {line.strip()}{Colors.ENDC}")
-            except UnicodeDecodeError:
-                pass
-        
-        Thread(target=monitor_output, daemon=True).start()
+        # Relay output through the shared pump
+        monitor_output(process, 'Vite', Colors.WARNING)
         return process
         
     except Exception as e:
         log(f"Failed to start Vite Frontend: {e}", "ERROR")
         return None
 
+LOOPBACK_HOSTS = ('127.0.0.1', '::1') if socket.has_ipv6 else ('127.0.0.1',)
+
+def wait_ready(ports, timeout=Config.READY_TIMEOUT):
+    """Poll until every port accepts TCP connections or timeout expires"""
+    pending = set(ports)
+    deadline = time.monotonic() + timeout
+    
+    while pending and time.monotonic() < deadline:
+        for port in list(pending):
+            # "localhost" servers (e.g. Vite on Node 17+) may listen on ::1 only
+            for host in LOOPBACK_HOSTS:
+                try:
+                    with socket.create_connection((host, port), 0.1):
+                        pending.discard(port)
+                        log(f"✓ Port {port} is accepting connections", "SUCCESS")
+                        break
+                except OSError:
+                    pass
+        if pending:
+            time.sleep(Config.READY_POLL_INTERVAL)
+    
+    for port in sorted(pending):
+        log(f"⚠ Port {port} not ready after {timeout}s", "WARNING")
+    return not pending
+
+# Shared output pump: one selector thread drains every service pipe
+_output_selector = None
+_output_lock = Lock()
+
+_OUTPUT_SUFFIX = Colors.ENDC.encode() + b"\n"
+
+def _relay_line(line, prefix):
+    line = line.strip()
+    if line:
+        return prefix + line + _OUTPUT_SUFFIX
+    return b""
+
+def _relay_chunk(buf, chunk, prefix):
+    """Append a raw read to buf and return its complete lines, formatted"""
+    buf += chunk
+    end = buf.rfind(b"\n")
+    if end < 0:
+        return b""
+    lines = buf[:end].split(b"\n")
+    del buf[:end + 1]  # Keep only the unterminated tail, in place
+    return b"".join(_relay_line(line, prefix) for line in lines)
+
+def _pump_output():
+    """Drain all registered stdout pipes in bulk and relay complete lines"""
+    buffers = {}
+    out = sys.stdout.buffer
+    
+    while True:
+        events = _output_selector.select(0.5)
+        if not events:
+            continue
+        
+        for key, _ in events:
+            prefix = key.data
+            try:
+                chunk = os.read(key.fd, 65536)
+            except BlockingIOError:
+                continue
+            except OSError:
+                chunk = b""
+            
+            if not chunk:
+                # EOF: flush any unterminated tail and stop watching the pipe
+                out.write(_relay_line(buffers.pop(key.fd, b""), prefix))
+                _output_selector.unregister(key.fd)
+                continue
+            
+            buf = buffers.setdefault(key.fd, bytearray())
+            out.write(_relay_chunk(buf, chunk, prefix))
+        out.flush()
+
+def monitor_output(process, label, color):
+    """Relay a service's stdout, prefixed with its label and color"""
+    global _output_selector
+    prefix = f"{color}[{label}] ".encode()
+    fd = process.stdout.fileno()
+    
+    if os.name == "nt":
+        # Windows selectors only handle sockets, so pipes keep a reader thread
+        def reader():
+            buf = bytearray()
+            out = sys.stdout.buffer
+            while True:
+                chunk = os.read(fd, 65536)
+                if not chunk:
+                    break
+                out.write(_relay_chunk(buf, chunk, prefix))
+                out.flush()
+            out.write(_relay_line(buf, prefix))
+            out.flush()
+        Thread(target=reader, daemon=True).start()
+        return
+    
+    os.set_blocking(fd, False)
+    with _output_lock:
+        start_pump = _output_selector is None
+        if start_pump:
+            _output_selector = selectors.DefaultSelector()
+        _output_selector.register(fd, selectors.EVENT_READ, prefix)
+    if start_pump:
+        Thread(target=_pump_output, daemon=True).start()
+
 def health_check():
     """Perform health checks on all services"""
     log("Performing health checks...", "HEADER")
-    time.sleep(5)  # Wait for services to fully start
     
     services = {
         "Flask Backend": f"http://localhost:{Config.FLASK_PORT}",
@@ -397,44 +536,147 @@ def health_check():
     
     try:
         import requests
-        for name, url in services.items():
-            try:
-                response = requests.get(url, timeout=2)
-                log(f"✓ {name} is responding", "SUCCESS")
-            except:
-                log(f"⚠ {name} may not be ready yet", "WARNING")
+        from requests.adapters import HTTPAdapter
     except ImportError:
         log("Install 'requests' for health checks: pip install requests", "WARNING")
+        return
+    
+    # Probe all services at once over a shared connection pool
+    with requests.Session() as session:
+        session.mount('http://', HTTPAdapter(pool_connections=len(services),
+                                             pool_maxsize=len(services)))
+        
+        def probe(item):
+            name, url = item
+            try:
+                session.get(url, timeout=2)
+                return name, True
+            except requests.RequestException:
+                return name, False
+        
+        with ThreadPoolExecutor(max_workers=len(services)) as executor:
+            results = list(executor.map(probe, services.items()))
+    
+    for name, ok in results:
+        if ok:
+            log(f"✓ {name} is responding", "SUCCESS")
+        else:
+            log(f"⚠ {name} may not be ready yet", "WARNING")
+
+def _process_tree(process):
+    """Return a launched process and all of its descendants, children first"""
+    import psutil
+    
+    try:
+        parent = psutil.Process(process.pid)
+        return parent.children(recursive=True) + [parent]
+    except psutil.NoSuchProcess:
+        return []
 
 def cleanup():
     """Cleanup and terminate all processes"""
+    import psutil
+    
     log("\nShutting down all servers...", "HEADER")
     
-    for name, process in processes:
-        try:
-            log(f"Stopping {name} (PID: {process.pid})...", "WARNING")
-            process.terminate()
+    with processes_lock:
+        running = list(processes)
+    
+    # Signal every process tree first so npm doesn't leave its node/vite
+    # children orphaned on the ports
+    trees = {}
+    for name, process in running:
+        log(f"Stopping {name} (PID: {process.pid})...", "WARNING")
+        trees[name] = _process_tree(process)
+        for proc in trees[name]:
             try:
-                process.wait(timeout=5)
-                log(f"✓ {name} stopped gracefully", "SUCCESS")
-            except subprocess.TimeoutExpired:
+                proc.terminate()
+            except psutil.NoSuchProcess:
+                pass
+    
+    # One shared grace period for all trees
+    _, alive = psutil.wait_procs([p for tree in trees.values() for p in tree], timeout=3)
+    alive = set(alive)
+    
+    for name, process in running:
+        try:
+            survivors = [p for p in trees[name] if p in alive]
+            if survivors:
                 log(f"Force killing {name}...", "ERROR")
-                process.kill()
-                process.wait()
+                for proc in survivors:
+                    try:
+                        proc.kill()
+                    except psutil.NoSuchProcess:
+                        pass
+            else:
+                log(f"✓ {name} stopped gracefully", "SUCCESS")
+            process.wait()
         except Exception as e:
             log(f"Error stopping {name}: {e}", "ERROR")
     
     log("All servers stopped", "SUCCESS")
 
+# The services run in their own sessions, so the terminal's Ctrl+C or hangup
+# never reaches them; every signal that ends the orchestrator must stop them
+SHUTDOWN_SIGNALS = tuple(
+    getattr(signal, name) for name in ('SIGINT', 'SIGTERM', 'SIGHUP')
+    if hasattr(signal, name)
+)
+
 def signal_handler(sig, frame):
-    """Handle Ctrl+C gracefully"""
-    print()  # New line after ^C
+    """Handle Ctrl+C, SIGTERM and hangup gracefully"""
+    if sig == signal.SIGINT:
+        print()  # New line after ^C
     cleanup()
     sys.exit(0)
 
-def print_status():
-    """Print status of all services"""
-    status_banner = f"""
+def _watch_exit(process, wakeup):
+    """Block until a process exits, then wake the supervisor (no SIGCHLD)"""
+    process.wait()
+    try:
+        wakeup.send(b"\0")
+    except OSError:
+        pass
+
+def supervise(running):
+    """Sleep until a shutdown signal or a child exit, both delivered on one wakeup socket"""
+    # Signals only write their number to the socket (a socket so this also
+    # works on Windows); the handling runs here, in the main thread
+    wakeup_r, wakeup_w = socket.socketpair()
+    wakeup_r.setblocking(False)
+    wakeup_w.setblocking(False)
+    signal.set_wakeup_fd(wakeup_w.fileno(), warn_on_full_buffer=False)
+    for sig in SHUTDOWN_SIGNALS:
+        signal.signal(sig, lambda sig, frame: None)
+    
+    if hasattr(signal, 'SIGCHLD'):
+        signal.signal(signal.SIGCHLD, lambda sig, frame: None)
+    else:
+        for name, process in running:
+            Thread(target=_watch_exit, args=(process, wakeup_w), daemon=True).start()
+    
+    with selectors.DefaultSelector() as selector:
+        selector.register(wakeup_r, selectors.EVENT_READ)
+        while True:
+            for name, process in running:
+                if process.poll() is not None:
+                    log(f"{name} has stopped unexpectedly!", "ERROR")
+                    cleanup()
+                    sys.exit(1)
+            
+            selector.select()
+            try:
+                events = wakeup_r.recv(4096)
+            except BlockingIOError:
+                continue
+            if signal.SIGINT in events:
+                print()  # New line after ^C
+            if any(sig in events for sig in SHUTDOWN_SIGNALS):
+                cleanup()
+                sys.exit(0)
+
+# Ports are fixed in Config, so the status screen is built once too
+_STATUS_BANNER = f"""
 {Colors.HEADER}{'='*60}
                     🚀 ALL SYSTEMS ONLINE 🚀
 {'='*60}{Colors.ENDC}
@@ -452,12 +694,21 @@ def print_status():
 {Colors.WARNING}Press Ctrl+C to stop all servers{Colors.ENDC}
 {Colors.HEADER}{'='*60}{Colors.ENDC}
 """
-    print(status_banner)
+
+def print_status():
+    """Print status of all services"""
+    print(_STATUS_BANNER)
 
 def main():
     """Main orchestrator function"""
-    # Setup signal handler for graceful shutdown
-    signal.signal(signal.SIGINT, signal_handler)
+    # log() and the output pump write bytes straight to stdout's buffer,
+    # so keep print() from holding text back in front of them
+    sys.stdout.reconfigure(write_through=True)
+    
+    # Setup signal handler for graceful shutdown during startup;
+    # supervise() takes over once everything is running
+    for sig in SHUTDOWN_SIGNALS:
+        signal.signal(sig, signal_handler)
     
     # Print banner
     print_banner()
@@ -474,32 +725,27 @@ def main():
     if not install_npm_dependencies():
         sys.exit(1)
     
-    # Start all services with delays
+    # Start all services concurrently; Popen doesn't depend on the other
+    # services being up, only the later HTTP traffic does
     log("\nStarting all services...", "HEADER")
     
-    # 1. Start Flask Backend
-    if not start_flask_backend():
-        cleanup()
-        sys.exit(1)
-    time.sleep(Config.FLASK_DELAY)
+    launchers = [
+        (start_flask_backend, 'Flask Backend'),
+        (start_gnn_demo, 'GNN Demo API'),
+        (start_node_server, 'Node Server'),
+        (start_vite_frontend, 'Vite Frontend')
+    ]
     
-    # 2. Start GNN Demo API
-    if not start_gnn_demo():
-        cleanup()
-        sys.exit(1)
-    time.sleep(Config.GNN_DELAY)
+    with ThreadPoolExecutor(max_workers=len(launchers)) as executor:
+        futures = {executor.submit(fn): name for fn, name in launchers}
+        failed = [name for future, name in futures.items() if not future.result()]
     
-    # 3. Start Node Server
-    if not start_node_server():
+    if failed:
+        log(f"Failed to start: {', '.join(failed)}", "ERROR")
         cleanup()
         sys.exit(1)
-    time.sleep(Config.NODE_DELAY)
     
-    # 4. Start Vite Frontend
-    if not start_vite_frontend():
-        cleanup()
-        sys.exit(1)
-    time.sleep(Config.VITE_DELAY)
+    wait_ready([Config.FLASK_PORT, Config.GNN_PORT, Config.NODE_PORT, Config.VITE_PORT])
     
     # Health checks
     health_check()
@@ -507,18 +753,10 @@ def main():
     # Print status
     print_status()
     
-    # Keep the script running
-    try:
-        while True:
-            time.sleep(1)
-            # Check if any process has died
-            for name, process in processes:
-                if process.poll() is not None:
-                    log(f"{name} has stopped unexpectedly!", "ERROR")
-                    cleanup()
-                    sys.exit(1)
-    except KeyboardInterrupt:
-        pass
+    # Keep the script running until Ctrl+C or a service exits
+    with processes_lock:
+        running = list(processes)
+    supervise(running)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file